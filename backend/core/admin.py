@@ -1,4 +1,5 @@
 from django.contrib import admin
+from .signals import bulk_saved
 from .models import (
     User, Career, Resource, SuccessStory, UserProfile,
     Multimedia, QuizQuestion, Feedback, Bookmark, QuizResult, PasswordResetToken, Option
@@ -54,7 +55,14 @@ class SuccessStoryAdmin(admin.ModelAdmin):
     actions = ['approve_stories']
 
     def approve_stories(self, request, queryset):
-        queryset.update(is_approved=True)
+        stories = list(queryset.filter(is_approved=False))
+        SuccessStory.objects.filter(pk__in=[story.pk for story in stories]).update(is_approved=True)
+        for story in stories:
+            story.is_approved = True
+        # update() sends no post_save; without this the successstories
+        # version (ETags, cached list bodies) would not move
+        if stories:
+            bulk_saved.send(sender=SuccessStory, instances=stories)
     approve_stories.short_description = "Mark selected stories as approved"
 
 # Register other models with default admin interface
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Register signal receivers that keep derived data in sync
+        from . import search, quiz, rollups, recommendations, exports, versions, authentication  # noqa: F401
+        from . import instrumentation
+
+        if settings.REQUEST_TIMING:
+            instrumentation.install()
@@ -0,0 +1,252 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.db import connections
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from . import exports, versions
+from .authentication import CachedJWTAuthentication
+from .files import ranged_file_response
+from .quiz import aget_question_payload
+from .response_cache import response_cache
+from .serializers import UserSerializer, ValuesRowRenderer
+from .views import BookmarkViewSet
+
+
+# -------------------------
+# Async Read Views
+# -------------------------
+#
+# Async variants of the read-heavy GET endpoints, mounted over the regular
+# routes when ASYNC_READ_VIEWS is on (pathseeker/asgi.py turns it on). A
+# request they fully understand -- a JSON GET with plain parameters -- is
+# answered on the event loop with the async ORM, reusing the sync views'
+# querysets, serializers, ETags and response cache. Anything else (writes,
+# the browsable API, pagination cursors, trending/recommended lists) is
+# handed to the regular DRF view unchanged.
+
+_authenticator = CachedJWTAuthentication()
+_json = JSONRenderer()
+
+
+def json_response(data, status=200):
+    return HttpResponse(_json.render(data), content_type="application/json", status=status)
+
+
+def accepts_json(request):
+    accept = request.headers.get("Accept", "*/*")
+    return (
+        "format" not in request.GET
+        and "text/html" not in accept
+        and ("application/json" in accept or "*/*" in accept)
+    )
+
+
+async def delegate(sync_view, request, *args, **kwargs):
+    return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Run slow sync work (PDF rendering) on a thread of its own. Plain
+    sync_to_async would use the one thread Django serializes sync code on,
+    and every sync view and async ORM query would queue behind it.
+    """
+    def call():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+    return await sync_to_async(call, thread_sensitive=False)()
+
+
+async def authenticate(request):
+    """Return (user, None), or (None, response) with DRF's 401 body."""
+    try:
+        result = await _authenticator.aauthenticate(request)
+    except APIException as e:
+        detail = e.detail if isinstance(e.detail, (list, dict)) else {"detail": e.detail}
+        response = json_response(detail, status=e.status_code)
+        response["WWW-Authenticate"] = _authenticator.authenticate_header(request)
+        return None, response
+    if result is None:
+        return AnonymousUser(), None
+    return result[0], None
+
+
+def not_authenticated(request):
+    response = json_response({"detail": "Authentication credentials were not provided."}, status=401)
+    response["WWW-Authenticate"] = _authenticator.authenticate_header(request)
+    return response
+
+
+def bind_view(view_class, request, user, action=None):
+    """An initialised view instance, as DRF would build it, for reuse of its hooks."""
+    drf_request = Request(request)
+    drf_request.user = user
+    drf_request.accepted_renderer = _json
+    return view_class(action=action, request=drf_request, args=(), kwargs={}, format_kwarg=None)
+
+
+async def conditional(request, scope, parts):
+    """
+    Return (version token, etag, last_modified, 304 response or None) for a
+    versioned scope, reading the version through the async cache API.
+    """
+    token, changed = await versions.aget_version(scope)
+    etag = versions.etag_for(token, *parts)
+    last_modified = int(changed.timestamp())
+    return token, etag, last_modified, get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def finish(response, etag, last_modified, view=None):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    if view is not None:
+        response["Allow"] = ", ".join(view.allowed_methods)
+        patch_vary_headers(response, ["Accept"])
+    return response
+
+
+# -------------------------
+# Endpoints
+# -------------------------
+
+def catalog_list(viewset_class, sync_view):
+    """Async list action for a ConditionalGetMixin/CachedResponseMixin viewset."""
+    plain_params = {"fields", "omit", *getattr(viewset_class, "filter_fields", ())}
+
+    @csrf_exempt
+    async def view(request):
+        if request.method != "GET" or not accepts_json(request) or set(request.GET) - plain_params:
+            return await delegate(sync_view, request)
+
+        user, error = await authenticate(request)
+        if error is not None:
+            return error
+        instance = bind_view(viewset_class, request, user, action="list")
+        token, etag, last_modified, not_modified = await conditional(
+            request, instance.version_scope, instance.get_etag_parts(instance.request),
+        )
+        if not_modified is not None:
+            return finish(not_modified, etag, last_modified)
+
+        parts = instance.get_response_cache_parts(instance.request)
+        key = response_cache.key_for(instance.version_scope, token, *parts) if parts is not None else None
+        entry = await response_cache.aget(key) if key is not None else None
+        if entry is not None:
+            content, content_type = entry
+            response = HttpResponse(content, content_type=content_type)
+            response["X-Cache"] = "HIT"
+            return finish(response, etag, last_modified, instance)
+
+        queryset = instance.filter_queryset(instance.get_queryset())
+        serializer = instance.get_serializer()
+        renderer = ValuesRowRenderer.for_serializer(serializer)
+        if renderer is not None:
+            data = renderer.render([row async for row in queryset.values(*renderer.sources)])
+        else:
+            data = instance.get_serializer([obj async for obj in queryset], many=True).data
+
+        response = json_response(data)
+        if key is not None:
+            await response_cache.aset(key, response.content, response["Content-Type"])
+            response["X-Cache"] = "MISS"
+        return finish(response, etag, last_modified, instance)
+
+    return view
+
+
+def question_list(view_class, sync_view):
+    @csrf_exempt
+    async def view(request):
+        if request.method != "GET" or not accepts_json(request):
+            return await delegate(sync_view, request)
+
+        user, error = await authenticate(request)
+        if error is not None:
+            return error
+        instance = bind_view(view_class, request, user)
+        token, etag, last_modified, not_modified = await conditional(
+            request, instance.version_scope, instance.get_etag_parts(instance.request),
+        )
+        if not_modified is not None:
+            return finish(not_modified, etag, last_modified)
+
+        response = HttpResponse(await aget_question_payload(token), content_type="application/json")
+        return finish(response, etag, last_modified, instance)
+
+    return view
+
+
+def bookmark_list(sync_view):
+    @csrf_exempt
+    async def view(request):
+        # ?user= is accepted (and ignored) like on the sync view
+        if request.method != "GET" or not accepts_json(request) or set(request.GET) - {"user"}:
+            return await delegate(sync_view, request)
+
+        user, error = await authenticate(request)
+        if error is not None:
+            return error
+        if not user.is_authenticated:
+            return not_authenticated(request)
+
+        instance = bind_view(BookmarkViewSet, request, user, action="list")
+        bookmarks = [bm async for bm in instance.filter_queryset(instance.get_queryset())]
+        return json_response(instance.get_serializer(bookmarks, many=True).data)
+
+    return view
+
+
+def bookmark_export(sync_view):
+    """export_pdf with the render moved off Django's shared sync thread."""
+
+    @csrf_exempt
+    async def view(request):
+        if request.method != "GET":
+            return await delegate(sync_view, request)
+
+        user, error = await authenticate(request)
+        if error is not None:
+            return error
+        if not user.is_authenticated:
+            return not_authenticated(request)
+
+        if request.GET.get("mode") == "job":
+            export = await run_blocking(exports.request_export, user, wait=False)
+            if not exports.is_current(export):
+                return json_response(
+                    {"status": export.status, "version": export.version, "error": export.error},
+                    status=202,
+                )
+        else:
+            export = await run_blocking(exports.request_export, user, wait=True)
+
+        return ranged_file_response(
+            request, export.file_path, "application/pdf",
+            filename="bookmarks.pdf", as_attachment=True,
+        )
+
+    return view
+
+
+def current_user(sync_view):
+    @csrf_exempt
+    async def view(request):
+        if request.method != "GET" or not accepts_json(request):
+            return await delegate(sync_view, request)
+
+        user, error = await authenticate(request)
+        if error is not None:
+            return error
+        if not user.is_authenticated:
+            return not_authenticated(request)
+        return json_response(UserSerializer(user).data)
+
+    return view
@@ -0,0 +1,190 @@
+import copy
+import hmac
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.permissions import BasePermission
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from . import metrics
+from .models import User
+
+
+# -------------------------
+# User Cache
+# -------------------------
+
+class UserCache:
+    """
+    Bounded, thread-safe LRU of User objects with a per-entry TTL. Callers
+    always get their own copy, so a view mutating request.user cannot leak
+    into other requests.
+
+    `generation` moves on every invalidation; a load that started before an
+    invalidation is not stored, so a lookup racing a password reset cannot
+    put the old row back.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        metrics.cache_lookup("users", entry is not None)
+        return copy.copy(entry[0]) if entry is not None else None
+
+    def set(self, key, user, generation):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (copy.copy(user), time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self.generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+user_cache = UserCache(
+    maxsize=getattr(settings, "JWT_USER_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "JWT_USER_CACHE_TTL", 30),
+)
+
+
+# -------------------------
+# Authentication
+# -------------------------
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user from `user_cache`
+    instead of querying for it on every request. The token itself is still
+    validated each time, and the active and password-change checks run
+    against the cached user. `aauthenticate()` is the same for async views,
+    using the async ORM on a cache miss.
+    """
+
+    def get_user(self, validated_token):
+        key = self.cache_key(validated_token)
+        user = user_cache.get(key)
+        if user is None:
+            generation = user_cache.generation
+            user = super().get_user(validated_token)
+            user_cache.set(key, user, generation)
+            return user
+        return self.check_user(user, validated_token)
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        key = self.cache_key(validated_token)
+        user = user_cache.get(key)
+        if user is None:
+            generation = user_cache.generation
+            lookup = {api_settings.USER_ID_FIELD: validated_token[api_settings.USER_ID_CLAIM]}
+            try:
+                user = await self.user_model.objects.aget(**lookup)
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+            user = self.check_user(user, validated_token)
+            user_cache.set(key, user, generation)
+            return user
+        return self.check_user(user, validated_token)
+
+    def cache_key(self, validated_token):
+        try:
+            return str(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    def check_user(self, user, validated_token):
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+
+class MetricsTokenAuthentication(BaseAuthentication):
+    """
+    Accept `Authorization: Bearer <METRICS_TOKEN>` for /metrics, so a
+    scraper needs no five-minute JWT. The request stays anonymous, with
+    `request.auth` set to METRICS_SCRAPE; any other header is left to the
+    next authentication class. Off while METRICS_TOKEN is empty.
+    """
+
+    def authenticate(self, request):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if not token:
+            return None
+        parts = get_authorization_header(request).split()
+        if len(parts) != 2 or parts[0].lower() != b"bearer":
+            return None
+        if not hmac.compare_digest(parts[1], token.encode()):
+            return None
+        return AnonymousUser(), METRICS_SCRAPE
+
+    def authenticate_header(self, request):
+        # First in MetricsView's list, so this picks 401 over 403
+        return 'Bearer realm="metrics"'
+
+
+METRICS_SCRAPE = object()
+
+
+class HasMetricsToken(BasePermission):
+    def has_permission(self, request, view):
+        return request.auth is METRICS_SCRAPE
+
+
+# -------------------------
+# Signals
+# -------------------------
+
+# Saves cover is_active toggles, role changes and password resets alike.
+# Other workers catch up within JWT_USER_CACHE_TTL.
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_cache.invalidate(str(instance.pk))
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from contextlib import ExitStack
+
+from django.db import connections
+from django.test import Client
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .async_views import bind_view
+from .loadtest import LoadResult, run_load
+
+
+# -------------------------
+# API Benchmark Suite
+# -------------------------
+#
+# Drives every GET endpoint under /api/ and reports latency percentiles,
+# throughput and SQL queries per request, as plain dicts that serialize
+# straight to JSON so runs can be diffed. Requests go through the Django
+# test client in-process (sequential; counts queries on every database
+# alias), or to a running server through core.loadtest (concurrent; no
+# query counts).
+
+# GET endpoints outside the router's list/detail routes, or interesting
+# parameter sets of those
+EXTRA_ENDPOINTS = [
+    ("careers list (page)", "/api/careers/?page_size=20"),
+    ("careers list (domain filter)", "/api/careers/?domain=technology"),
+    ("careers list (search)", "/api/careers/?search=data"),
+    ("careers list (trending)", "/api/careers/?trending=true"),
+    ("careers list (recommended)", "/api/careers/?recommended=true"),
+    ("careers list (sparse)", "/api/careers/?fields=title,domain"),
+    ("resources list (trending)", "/api/resources/?trending=true"),
+    ("quiz questions", "/api/questions/list/"),
+    ("search", "/api/search/?q=data"),
+    ("current user", "/api/auth/me/"),
+]
+
+
+def api_endpoints(router, user):
+    """
+    (name, path) for every GET route the router registers -- list, detail
+    (with a pk the user can see) and GET extra actions -- plus EXTRA_ENDPOINTS.
+    """
+    endpoints = []
+    for prefix, viewset, basename in router.registry:
+        lookup = None
+        for route in router.get_routes(viewset):
+            if "get" not in router.get_method_map(viewset, route.mapping):
+                continue
+            name = route.name.format(basename=basename).replace(f"{basename}-", f"{prefix} ")
+            if "{lookup}" in route.url:
+                if lookup is None:
+                    request = APIRequestFactory().get(f"/api/{prefix}/")
+                    view = bind_view(viewset, request, user, action="retrieve")
+                    lookup = view.get_queryset().values_list("pk", flat=True).first() or ""
+                if lookup == "":
+                    continue
+            url = route.url.format(
+                prefix=prefix, lookup=lookup, trailing_slash=router.trailing_slash,
+            ).strip("^$")
+            endpoints.append((name, f"/api/{url}"))
+    return endpoints + EXTRA_ENDPOINTS
+
+
+class QueryCounter:
+    """connection.execute_wrapper() hook counting statements on every alias."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def install(self, stack):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+
+def auth_headers(user):
+    if user is None or not user.pk:
+        return {}
+    return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+
+def bench_client(path, headers, requests=30, warmup=3):
+    """Time `requests` sequential GETs of `path` through the test client."""
+    client = Client(HTTP_HOST="localhost")
+    result = LoadResult()
+    statuses = set()
+    with ExitStack() as stack:
+        for _ in range(warmup):
+            _consume(client.get(path, **headers))
+        counter = QueryCounter().install(stack)
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started = time.perf_counter()
+            response = client.get(path, **headers)
+            _consume(response)
+            result.latencies.append(time.perf_counter() - request_started)
+            statuses.add(response.status_code)
+            result.requests += 1
+            result.errors += response.status_code >= 400
+        result.elapsed = time.perf_counter() - started
+
+    summary = result.summary()
+    summary["queries_per_request"] = round(counter.count / requests, 2) if requests else None
+    summary["status"] = sorted(statuses)
+    return summary
+
+
+def bench_server(base_url, path, headers, concurrency=10, duration=5.0):
+    """Hammer `path` on a running server for `duration` seconds."""
+    wire_headers = {"Authorization": headers["HTTP_AUTHORIZATION"]} if headers else {}
+    result = asyncio.run(run_load(
+        [base_url.rstrip("/") + path], concurrency=concurrency, duration=duration, headers=wire_headers,
+    ))
+    summary = result.summary()
+    summary["queries_per_request"] = None
+    return summary
+
+
+def _consume(response):
+    if getattr(response, "streaming", False):
+        for _ in response.streaming_content:
+            pass
+        response.close()
+    else:
+        response.content
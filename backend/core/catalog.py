@@ -0,0 +1,215 @@
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from .models import Career, Resource, Multimedia, SuccessStory, QuizQuestion, Option
+from .signals import bulk_saved
+
+
+# -------------------------
+# Catalog Specs
+# -------------------------
+
+@dataclass
+class CatalogSpec:
+    """
+    How one model is loaded: `key` is the natural key rows are matched on,
+    `foreign_keys` maps an FK field to the natural-key field of its target so
+    fixtures can say {"question": "What motivates you?"} instead of an id.
+    """
+    model: type
+    key: tuple
+    foreign_keys: dict = field(default_factory=dict)
+
+    def field_names(self):
+        return [
+            f.name for f in self.model._meta.concrete_fields
+            if not f.primary_key and f.editable
+        ]
+
+
+CATALOGS = {
+    "careers": CatalogSpec(Career, key=("title", "company")),
+    "resources": CatalogSpec(Resource, key=("title",)),
+    "multimedia": CatalogSpec(Multimedia, key=("title",)),
+    "stories": CatalogSpec(SuccessStory, key=("name", "domain"), foreign_keys={"user": "email"}),
+    "quiz_questions": CatalogSpec(QuizQuestion, key=("text",)),
+    "quiz_options": CatalogSpec(Option, key=("question", "text"), foreign_keys={"question": "text"}),
+}
+
+
+# -------------------------
+# Readers
+# -------------------------
+
+def read_records(path, fmt=None):
+    """
+    Yield dicts from a .json (array), .ndjson/.jsonl or .csv file. NDJSON and
+    CSV are streamed line by line; JSON arrays are parsed whole.
+    """
+    path = Path(path)
+    fmt = fmt or path.suffix.lstrip(".").lower()
+    if fmt == "jsonl":
+        fmt = "ndjson"
+
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "json":
+            yield from json.load(f)
+        elif fmt == "ndjson":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            raise ValueError(f"Unsupported catalog format: {fmt}")
+
+
+# -------------------------
+# Loader
+# -------------------------
+
+@dataclass
+class LoadReport:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: list = field(default_factory=list)
+
+
+class CatalogLoader:
+    """
+    Idempotent upsert of records into one catalog. Each batch costs one
+    SELECT of candidate rows, one bulk_create and one bulk_update inside its
+    own transaction; existing rows keep their primary keys, so bookmarks and
+    other references survive a reseed.
+    """
+
+    def __init__(self, spec, batch_size=500, dry_run=False):
+        self.spec = spec
+        self.model = spec.model
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.fields = {f.name: f for f in self.model._meta.concrete_fields if f.name in spec.field_names()}
+        self._fk_cache = {}
+
+    def load(self, records):
+        report = LoadReport()
+        records = iter(records)
+        row_number = 0
+        while True:
+            batch = list(islice(records, self.batch_size))
+            if not batch:
+                return report
+            cleaned = {}
+            for record in batch:
+                row_number += 1
+                if not any(value not in (None, "") for value in record.values()):
+                    continue  # blank line in a CSV
+                try:
+                    values = self.clean(record)
+                except (ValidationError, ValueError, LookupError) as e:
+                    report.errors.append({"row": row_number, "error": _message(e)})
+                    continue
+                # A key repeated inside one batch: the last row wins
+                cleaned[self.natural_key(values)] = values
+            self.apply(cleaned, report)
+
+    def clean(self, record):
+        values = {}
+        for name, value in record.items():
+            model_field = self.fields.get(name)
+            if model_field is None:
+                raise ValueError(f"Unknown field '{name}'")
+            if name in self.spec.foreign_keys:
+                values[model_field.attname] = self.resolve_fk(name, value)
+            else:
+                values[name] = self.convert(model_field, value)
+        missing = [k for k in self.spec.key if self._attname(k) not in values]
+        if missing:
+            raise ValueError(f"Missing natural key field(s): {', '.join(missing)}")
+        return values
+
+    def convert(self, model_field, value):
+        if isinstance(model_field, models.JSONField):
+            if isinstance(value, str):
+                if not value.strip():
+                    return model_field.get_default()
+                try:
+                    return json.loads(value)
+                except json.JSONDecodeError:
+                    raise ValueError(f"{model_field.name}: invalid JSON")
+            return value
+        if isinstance(value, str) and not isinstance(model_field, (models.CharField, models.TextField)):
+            if value == "" and model_field.null:
+                return None
+            return model_field.to_python(value)
+        return value
+
+    def resolve_fk(self, name, value):
+        if value in (None, ""):
+            return None
+        target = self.fields[name].related_model
+        lookup = self.spec.foreign_keys[name]
+        cache = self._fk_cache.setdefault(name, {})
+        if value not in cache:
+            pk = target.objects.filter(**{lookup: value}).values_list("pk", flat=True).first()
+            if pk is None:
+                raise LookupError(f"No {target.__name__} with {lookup}={value!r}")
+            cache[value] = pk
+        return cache[value]
+
+    def _attname(self, name):
+        return self.fields[name].attname
+
+    def natural_key(self, values):
+        return tuple(values.get(self._attname(k)) for k in self.spec.key)
+
+    def existing_rows(self, keys):
+        first = self._attname(self.spec.key[0])
+        candidates = self.model.objects.filter(**{f"{first}__in": {k[0] for k in keys}})
+        return {self.natural_key(vars(obj)): obj for obj in candidates}
+
+    def apply(self, cleaned, report):
+        if not cleaned:
+            return
+        with transaction.atomic():
+            existing = self.existing_rows(cleaned.keys())
+            to_create, to_update, changed_fields = [], [], set()
+            for key, values in cleaned.items():
+                obj = existing.get(key)
+                if obj is None:
+                    to_create.append(self.model(**values))
+                    continue
+                changed = [name for name, value in values.items() if getattr(obj, name) != value]
+                if not changed:
+                    report.unchanged += 1
+                    continue
+                for name in changed:
+                    setattr(obj, name, values[name])
+                changed_fields.update(changed)
+                to_update.append(obj)
+
+            if not self.dry_run:
+                created = self.model.objects.bulk_create(to_create, batch_size=self.batch_size)
+                if to_update:
+                    self.model.objects.bulk_update(to_update, sorted(changed_fields), batch_size=self.batch_size)
+                if created or to_update:
+                    bulk_saved.send(sender=self.model, instances=list(created) + to_update)
+            report.created += len(to_create)
+            report.updated += len(to_update)
+
+
+def load_catalog(name, records, batch_size=500, dry_run=False):
+    return CatalogLoader(CATALOGS[name], batch_size=batch_size, dry_run=dry_run).load(records)
+
+
+def _message(error):
+    if isinstance(error, ValidationError):
+        return "; ".join(error.messages)
+    return str(error)
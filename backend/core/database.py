@@ -0,0 +1,35 @@
+from django.db import connections
+
+
+# -------------------------
+# Read/Write Routing
+# -------------------------
+
+WRITE_ALIAS = "default"
+READ_ALIAS = "replica"
+
+
+class ReadWriteRouter:
+    """
+    Sends reads to the read-only `replica` connection and everything else
+    to `default`. Both are the same SQLite file in WAL mode, so a read on
+    the replica sees every committed write at once; what it cannot see is
+    a transaction still open on `default`, so reads inside one stay there.
+    """
+
+    def db_for_read(self, model, **hints):
+        if READ_ALIAS not in connections.settings or connections[WRITE_ALIAS].in_atomic_block:
+            return WRITE_ALIAS
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return READ_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return WRITE_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {WRITE_ALIAS, READ_ALIAS}
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db == WRITE_ALIAS
@@ -0,0 +1,266 @@
+import csv
+import itertools
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet
+
+from .models import (
+    User, Career, Resource, SuccessStory, UserProfile, Multimedia,
+    QuizQuestion, Option, QuizResult, Feedback, Bookmark, BookmarkExport,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPORT_ROOT = Path(getattr(settings, "EXPORT_ROOT", settings.BASE_DIR / "var" / "exports"))
+
+# A pending job older than this is assumed lost (e.g. the worker restarted)
+JOB_TIMEOUT = timedelta(minutes=10)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "EXPORT_WORKERS", 2), thread_name_prefix="bookmark-export"
+)
+
+
+# -------------------------
+# Rendering
+# -------------------------
+
+def render_bookmarks_pdf(user_id, path):
+    """Write the user's bookmarks PDF to `path` using a single query."""
+    bookmarks = (
+        Bookmark.objects.filter(user_id=user_id)
+        .select_related("career", "resource", "multimedia")
+        .order_by("created_at")
+    )
+    doc = SimpleDocTemplate(str(path))
+    styles = getSampleStyleSheet()
+    story = []
+
+    story.append(Paragraph("My Bookmarks & Notes", styles["Title"]))
+    story.append(Spacer(1, 20))
+
+    for bm in bookmarks.iterator(chunk_size=500):
+        item = bm.career or bm.resource or bm.multimedia
+        text = f"<b>{escape(str(item))}</b><br/>{escape(bm.note or '')}"
+        story.append(Paragraph(text, styles["Normal"]))
+        story.append(Spacer(1, 12))
+
+    doc.build(story)
+
+
+def _export_path(user_id, version):
+    return EXPORT_ROOT / f"bookmarks-{user_id}-v{version}.pdf"
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except (FileNotFoundError, TypeError):
+        pass
+
+
+def render_export(export_id):
+    """
+    Render the export until the stored file matches the latest bookmark
+    version; bookmarks edited mid-render simply trigger another pass.
+    """
+    EXPORT_ROOT.mkdir(parents=True, exist_ok=True)
+    while True:
+        export = BookmarkExport.objects.get(pk=export_id)
+        version = export.version
+        path = _export_path(export.user_id, version)
+        # A temp file of its own: an inline render and a pool job for the
+        # same export may run at once, and each renames only its own file
+        fd, tmp_path = tempfile.mkstemp(dir=EXPORT_ROOT, prefix=f".{path.stem}-", suffix=".tmp")
+        os.close(fd)
+
+        try:
+            render_bookmarks_pdf(export.user_id, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            _remove(tmp_path)
+            BookmarkExport.objects.filter(pk=export_id).update(status="failed", error=str(e))
+            raise
+
+        updated = BookmarkExport.objects.filter(pk=export_id, version=version).update(
+            status="ready", rendered_version=version, file_path=str(path), error="",
+            updated_at=timezone.now(),
+        )
+        if updated:
+            if export.file_path and export.file_path != str(path):
+                _remove(export.file_path)
+            return
+        _remove(path)
+
+
+def _run_job(export_id):
+    try:
+        render_export(export_id)
+    except Exception:
+        logger.exception("Bookmark export %s failed", export_id)
+    finally:
+        connections.close_all()
+
+
+# -------------------------
+# Public API
+# -------------------------
+
+def is_current(export):
+    return (
+        export.status == "ready"
+        and export.rendered_version == export.version
+        and bool(export.file_path)
+        and os.path.exists(export.file_path)
+    )
+
+
+def request_export(user, wait=True):
+    """
+    Return the user's BookmarkExport, making sure a current PDF exists or is
+    on its way. With `wait` the render happens inline; otherwise it is
+    queued on the export thread pool and the caller polls.
+    """
+    export, _ = BookmarkExport.objects.get_or_create(user=user)
+    if is_current(export):
+        return export
+
+    if wait:
+        render_export(export.pk)
+        export.refresh_from_db()
+        return export
+
+    stale_before = timezone.now() - JOB_TIMEOUT
+    claimed = (
+        BookmarkExport.objects.filter(pk=export.pk)
+        .exclude(status="pending", updated_at__gte=stale_before)
+        .update(status="pending", updated_at=timezone.now())
+    )
+    if claimed:
+        _executor.submit(_run_job, export.pk)
+    export.refresh_from_db()
+    return export
+
+
+# -------------------------
+# Signals
+# -------------------------
+
+@receiver(post_save, sender=Bookmark)
+@receiver(post_delete, sender=Bookmark)
+def bump_export_version(sender, instance, **kwargs):
+    BookmarkExport.objects.filter(user_id=instance.user_id).update(version=F("version") + 1)
+
+
+# -------------------------
+# Table Exports
+# -------------------------
+
+class TableExport:
+    """One exportable model: its columns and the timestamp `since=` filters on."""
+
+    def __init__(self, model, since_field=None, exclude=()):
+        self.model = model
+        self.since_field = since_field
+        self.fields = [
+            f.attname for f in model._meta.concrete_fields if f.name not in exclude
+        ]
+
+    def rows(self, since=None, chunk_size=2000):
+        queryset = self.model.objects.all()
+        if since is not None:
+            queryset = queryset.filter(**{f"{self.since_field}__gte": since})
+        order = [self.since_field, "pk"] if self.since_field else ["pk"]
+        return queryset.order_by(*order).values_list(*self.fields).iterator(chunk_size=chunk_size)
+
+
+TABLE_EXPORTS = {
+    "users": TableExport(User, "created_at", exclude=("password",)),
+    "profiles": TableExport(UserProfile, "updated_at"),
+    "careers": TableExport(Career, "created_at"),
+    "resources": TableExport(Resource, "created_at"),
+    "multimedia": TableExport(Multimedia, "uploaded_at"),
+    "successstories": TableExport(SuccessStory, "created_at"),
+    "questions": TableExport(QuizQuestion),
+    "options": TableExport(Option),
+    "quizresults": TableExport(QuizResult, "submitted_at"),
+    "feedback": TableExport(Feedback, "submitted_at"),
+    "bookmarks": TableExport(Bookmark, "created_at"),
+}
+
+
+def parse_since(value):
+    """Parse an ISO date or datetime into an aware datetime, or raise ValueError."""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class _Echo:
+    """csv.writer target that hands each formatted line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_cell(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def stream_ndjson(table, rows):
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(dict(zip(table.fields, row))) + "\n"
+
+
+def stream_csv(table, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(table.fields)
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+async def astream(lines, lines_per_chunk=2000):
+    """
+    Async iterator over a stream_ndjson()/stream_csv() generator for ASGI
+    responses, pulled `lines_per_chunk` lines (one joined chunk) per
+    sync_to_async hop. Django would otherwise drain the sync generator
+    into a list -- the whole table -- before sending anything. The hops
+    are thread-sensitive, so the rows' database cursor stays on one thread.
+    """
+    def next_chunk():
+        return "".join(itertools.islice(lines, lines_per_chunk))
+
+    pull = sync_to_async(next_chunk)
+    try:
+        while chunk := await pull():
+            yield chunk
+    finally:
+        await sync_to_async(lines.close)()
@@ -0,0 +1,201 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+
+# -------------------------
+# Range Requests
+# -------------------------
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Read size when Django streams a file itself (FileResponse's default is 4 KiB)
+BLOCK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    """
+    Parse a single-range `Range` header against a file of `size` bytes.
+    Returns (start, end) inclusive, or None when the header should be
+    ignored (absent, malformed or multi-range) and the full file served.
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable
+    return start, min(end, size - 1)
+
+
+class RangeReader:
+    """
+    File wrapper that stops after `length` bytes from the current offset.
+    It exposes the file's descriptor, so a WSGI server with sendfile
+    support (gunicorn) sends the range straight from the page cache, with
+    the response's Content-Length as the byte count.
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+async def aread_blocks(file, block_size):
+    """Async iterator over `file`, read off the event loop one block at a time."""
+    read = sync_to_async(file.read, thread_sensitive=False)
+    try:
+        while chunk := await read(block_size):
+            yield chunk
+    finally:
+        file.close()
+
+
+def file_etag(stat):
+    """A strong validator for a file on disk: its size and mtime."""
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def if_range_matches(request, etag, last_modified):
+    """
+    Whether a Range request may be honoured: there is no `If-Range`, or it
+    names the current version. Otherwise the whole file is sent instead.
+    """
+    header = request.META.get("HTTP_IF_RANGE")
+    if not header:
+        return True
+    header = header.strip()
+    if header.startswith(('"', "W/")):
+        return header == etag
+    return parse_http_date_safe(header) == last_modified
+
+
+def ranged_file_response(request, path, content_type, filename=None, as_attachment=False):
+    """
+    Stream a file from disk, answering `Range: bytes=...` with 206 Partial
+    Content. Data is read in BLOCK_SIZE blocks, never loaded whole: under
+    WSGI through FileResponse (with sendfile where the server has it),
+    under ASGI through an async iterator.
+
+    Responses carry an ETag and Last-Modified from the file's stat, so
+    If-None-Match/If-Modified-Since get a 304 and a stale If-Range gets
+    the whole file rather than a range of the old one.
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = file_etag(stat)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return response
+
+    byte_range = None
+    if if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(request.META.get("HTTP_RANGE"), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    file = open(path, "rb")
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type, as_attachment=as_attachment, filename=filename)
+    else:
+        start, end = byte_range
+        file.seek(start)
+        response = FileResponse(
+            RangeReader(file, end - start + 1), status=206,
+            content_type=content_type, as_attachment=as_attachment, filename=filename,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+    response.block_size = BLOCK_SIZE
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        # Under ASGI Django consumes a sync iterator into a list before
+        # sending anything, i.e. the whole file (or range) would sit in memory
+        response.streaming_content = aread_blocks(response.file_to_stream, BLOCK_SIZE)
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+# -------------------------
+# Media Files
+# -------------------------
+
+def media_file_response(request, field_file, as_attachment=False):
+    """
+    Serve an uploaded FileField's file (default file system storage).
+
+    With FILE_OFFLOAD set, the body is left to the front server: nginx
+    ("x-accel-redirect", with MEDIA_ROOT exposed as an internal location
+    at FILE_ACCEL_REDIRECT_PREFIX) or Apache/lighttpd ("x-sendfile"),
+    which then handle ranges and validators themselves. Otherwise Django
+    streams it with ranged_file_response().
+    """
+    name = field_file.name
+    filename = os.path.basename(name)
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    offload = getattr(settings, "FILE_OFFLOAD", None)
+    if offload:
+        response = HttpResponse(content_type=content_type)
+        if offload == "x-accel-redirect":
+            response["X-Accel-Redirect"] = settings.FILE_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(name)
+        elif offload == "x-sendfile":
+            response["X-Sendfile"] = field_file.path
+        else:
+            raise ValueError(f"Unknown FILE_OFFLOAD {offload!r}")
+        if as_attachment:
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    try:
+        return ranged_file_response(request, field_file.path, content_type,
+                                    filename=filename, as_attachment=as_attachment)
+    except FileNotFoundError:
+        raise Http404("File not found.")
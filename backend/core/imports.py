@@ -0,0 +1,172 @@
+import codecs
+import csv
+import json
+
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from .serializers import CareerSerializer, ResourceSerializer, MultimediaSerializer
+from .signals import bulk_saved
+
+
+IMPORTABLE = {
+    "careers": CareerSerializer,
+    "resources": ResourceSerializer,
+    "multimedia": MultimediaSerializer,
+}
+
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/x-jsonlines": "ndjson",
+}
+
+EXTENSIONS = {
+    "csv": "csv",
+    "ndjson": "ndjson",
+    "jsonl": "ndjson",
+}
+
+
+def detect_format(content_type="", filename=""):
+    fmt = CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+    if fmt is None and "." in filename:
+        fmt = EXTENSIONS.get(filename.rsplit(".", 1)[1].lower())
+    return fmt
+
+
+class UnreadableUpload(Exception):
+    """The rest of the upload cannot be read (bad encoding or broken CSV)."""
+
+    def __init__(self, row_number, message):
+        super().__init__(message)
+        self.row_number = row_number
+
+
+def iter_rows(stream, fmt):
+    """
+    Yield (row_number, record, error) from a binary stream, decoding one line
+    at a time. Unparseable NDJSON lines become per-row errors; input that
+    stops the decoder or the CSV reader raises UnreadableUpload, since
+    nothing after it can be read reliably.
+    """
+    lines = codecs.iterdecode(stream, "utf-8")
+    # Row 1 is the header, so CSV data rows start at 2 like in a spreadsheet
+    row_number = 1 if fmt == "csv" else 0
+    try:
+        if fmt == "csv":
+            for row_number, record in enumerate(csv.DictReader(lines), start=2):
+                yield row_number, record, None
+            return
+
+        for row_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, None, {"non_field_errors": [f"Invalid JSON: {e.msg}"]}
+                continue
+            if not isinstance(record, dict):
+                yield row_number, None, {"non_field_errors": ["Each line must be a JSON object."]}
+                continue
+            yield row_number, record, None
+    except UnicodeDecodeError:
+        raise UnreadableUpload(row_number + 1, "File is not valid UTF-8.")
+    except csv.Error as e:
+        raise UnreadableUpload(row_number + 1, f"Malformed CSV: {e}")
+
+
+class BulkImporter:
+    """
+    Validate rows with an existing ModelSerializer and insert the valid ones
+    with bulk_create, batch by batch. Memory use is bounded by `batch_size`
+    rows plus at most `max_errors` stored error entries, whatever the size
+    of the upload.
+    """
+
+    def __init__(self, serializer_class, batch_size=500, max_errors=1000, extra=None, context=None):
+        self.serializer = serializer_class(context=context or {})
+        self.model = serializer_class.Meta.model
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.extra = extra or {}
+        self.json_fields = [
+            name for name, field in self.serializer.fields.items()
+            if isinstance(field, serializers.JSONField) and not field.read_only
+        ]
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, row_number, detail):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row_number, "errors": detail})
+
+    def decode_json_cells(self, record):
+        """CSV cells arrive as text; parse the ones backing JSON fields."""
+        for name in self.json_fields:
+            value = record.get(name)
+            if not isinstance(value, str):
+                continue
+            if not value.strip():
+                del record[name]
+                continue
+            try:
+                record[name] = json.loads(value)
+            except json.JSONDecodeError:
+                raise ValidationError({name: ["Value must be valid JSON."]})
+        return record
+
+    def run(self, rows):
+        """
+        Import every row and return the summary. An UnreadableUpload stops
+        the import: the rows read before it are still imported (earlier
+        batches are already committed) and the summary's `stopped` carries
+        the reason.
+        """
+        batch = []
+        stopped = None
+        try:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    self.import_batch(batch)
+                    batch = []
+        except UnreadableUpload as e:
+            stopped = e
+        if batch:
+            self.import_batch(batch)
+        if stopped is not None:
+            self.add_error(stopped.row_number, {"non_field_errors": [str(stopped)]})
+        return {
+            "created": self.created,
+            "stopped": str(stopped) if stopped is not None else None,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "errors_truncated": self.error_count > len(self.errors),
+        }
+
+    def import_batch(self, batch):
+        objects = []
+        for row_number, record, error in batch:
+            if error is not None:
+                self.add_error(row_number, error)
+                continue
+            try:
+                validated = self.serializer.run_validation(self.decode_json_cells(record))
+            except ValidationError as e:
+                self.add_error(row_number, e.detail)
+                continue
+            objects.append(self.model(**{**validated, **self.extra}))
+
+        if objects:
+            with transaction.atomic():
+                created = self.model.objects.bulk_create(objects)
+                bulk_saved.send(sender=self.model, instances=created)
+            self.created += len(created)
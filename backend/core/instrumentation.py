@@ -0,0 +1,117 @@
+import heapq
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from rest_framework.serializers import BaseSerializer
+
+from .serializers import ValuesRowRenderer
+
+
+# -------------------------
+# Request Timing
+# -------------------------
+#
+# The timing of the request being served lives in a ContextVar, so it
+# follows the request through sync_to_async/async_to_sync hops and into
+# whichever thread runs its queries. One execute wrapper, added to every
+# database connection when it is created, times each statement into it;
+# outside a request it costs one ContextVar lookup. It times execute()
+# only: rows fetched lazily afterwards are counted in whichever phase
+# iterates them (usually serialization).
+
+_current = ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    __slots__ = ("started", "sql", "queries", "slowest", "keep", "serialize", "render", "_serializing")
+
+    def __init__(self, keep=5):
+        self.started = time.perf_counter()
+        self.sql = 0.0
+        self.queries = 0
+        # Min-heap of the `keep` slowest (seconds, sql) so far, so a request
+        # running thousands of statements holds only a handful of them
+        self.slowest = []
+        self.keep = keep
+        self.serialize = 0.0
+        self.render = 0.0
+        self._serializing = False
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def add_query(self, duration, sql):
+        self.sql += duration
+        self.queries += 1
+        if len(self.slowest) < self.keep:
+            heapq.heappush(self.slowest, (duration, sql))
+        elif self.slowest and duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (duration, sql))
+
+    def top_queries(self):
+        """The slowest statements kept, as (seconds, sql), slowest first."""
+        return sorted(self.slowest, key=lambda query: query[0], reverse=True)
+
+
+def start(keep=5):
+    timing = RequestTiming(keep)
+    return timing, _current.set(timing)
+
+
+def finish(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+def record_sql(execute, sql, params, many, context):
+    timing = _current.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.add_query(time.perf_counter() - started, sql)
+
+
+def _timed_serialization(func):
+    """Add the time spent in `func` to the current request's serialize phase."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        timing = _current.get()
+        # Nested serializers are already inside the outer one's time
+        if timing is None or timing._serializing:
+            return func(*args, **kwargs)
+        timing._serializing = True
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timing.serialize += time.perf_counter() - started
+            timing._serializing = False
+    return wrapper
+
+
+def install():
+    """
+    Time serialization: BaseSerializer.data (which every serializer's .data
+    runs through) and the values() fast path. Called once from
+    CoreConfig.ready() when REQUEST_TIMING is on.
+    """
+    BaseSerializer.data = property(_timed_serialization(BaseSerializer.data.fget))
+    ValuesRowRenderer.render = _timed_serialization(ValuesRowRenderer.render)
+
+
+@receiver(connection_created)
+def add_sql_timer(sender, connection, **kwargs):
+    # First in the list, i.e. outermost: execute_wrapper() blocks pop the
+    # last entry on exit, which must stay theirs
+    if settings.REQUEST_TIMING and record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_sql)
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+
+# -------------------------
+# Minimal HTTP/1.1 Client
+# -------------------------
+#
+# Just enough HTTP to drive our own servers hard from one process, with
+# keep-alive, Content-Length and chunked bodies. Kept dependency-free so
+# the load test runs wherever the app does.
+
+class Connection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, path, headers):
+        """Send a GET and return (status, body bytes), reconnecting if needed."""
+        for attempt in (1, 2):
+            if self.writer is None:
+                await self.open()
+            try:
+                self.writer.write(_request_bytes(self.host, path, headers))
+                await self.writer.drain()
+                return await self._read_response()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # The server closed an idle keep-alive connection
+                self.close()
+                if attempt == 2:
+                    raise
+
+    async def _read_response(self):
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readuntil(b"\r\n")
+                    break
+                body += await self.reader.readexactly(size)
+                await self.reader.readexactly(2)
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await self.reader.read()
+            self.close()
+
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, bytes(body)
+
+
+def _request_bytes(host, path, headers):
+    lines = [f"GET {path} HTTP/1.1", f"Host: {host}", "Accept: application/json"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+# -------------------------
+# Load Test
+# -------------------------
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class LoadResult:
+    requests: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    latencies: list = field(default_factory=list)
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        ms = lambda value: None if value is None else round(value * 1000, 2)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "seconds": round(self.elapsed, 2),
+            "throughput_rps": round(self.requests / self.elapsed, 1) if self.elapsed else None,
+            "p50_ms": ms(percentile(latencies, 50)),
+            "p95_ms": ms(percentile(latencies, 95)),
+            "p99_ms": ms(percentile(latencies, 99)),
+        }
+
+
+async def _client(url_cycle, headers, deadline, result):
+    parts = urlsplit(url_cycle[0])
+    connection = Connection(parts.hostname, parts.port or 80)
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            path = url_cycle[i % len(url_cycle)]
+            i += 1
+            path = urlsplit(path)._replace(scheme="", netloc="").geturl()
+            started = time.perf_counter()
+            try:
+                status, _ = await connection.request(path, headers)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                result.errors += 1
+                connection.close()
+                await asyncio.sleep(0.05)
+                continue
+            result.latencies.append(time.perf_counter() - started)
+            result.requests += 1
+            if status >= 400:
+                result.errors += 1
+    finally:
+        connection.close()
+
+
+async def _slow_client(url, deadline, trickle_seconds):
+    """Send a request one header line at a time over `trickle_seconds`."""
+    parts = urlsplit(url)
+    path = parts._replace(scheme="", netloc="").geturl()
+    payload = _request_bytes(parts.hostname, path, {"X-Slow-Client": "1"}).split(b"\r\n")
+    while time.perf_counter() < deadline:
+        connection = Connection(parts.hostname, parts.port or 80)
+        try:
+            await connection.open()
+            for line in payload[:-1]:
+                connection.writer.write(line + b"\r\n")
+                await connection.writer.drain()
+                await asyncio.sleep(trickle_seconds / len(payload))
+            await connection.writer.drain()
+            await connection._read_response()
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            await asyncio.sleep(0.05)
+        finally:
+            connection.close()
+
+
+async def run_load(urls, concurrency=50, duration=10.0, headers=None, slow_clients=0, slow_seconds=2.0):
+    """
+    Hammer `urls` (round robin) from `concurrency` keep-alive clients for
+    `duration` seconds while `slow_clients` others trickle their requests
+    in. Returns the LoadResult of the fast clients.
+    """
+    result = LoadResult()
+    started = time.perf_counter()
+    deadline = started + duration
+    tasks = [
+        asyncio.create_task(_client(urls[i % len(urls):] + urls[:i % len(urls)], headers or {}, deadline, result))
+        for i in range(concurrency)
+    ]
+    tasks += [
+        asyncio.create_task(_slow_client(urls[0], deadline, slow_seconds))
+        for _ in range(slow_clients)
+    ]
+    await asyncio.wait(tasks[:concurrency])
+    result.elapsed = time.perf_counter() - started
+    for task in tasks[concurrency:]:
+        task.cancel()
+    await asyncio.gather(*tasks[concurrency:], return_exceptions=True)
+    return result
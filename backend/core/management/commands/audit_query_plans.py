@@ -0,0 +1,92 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.migrations import Migration, AddIndex
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+
+from core.models import User
+from core.query_audit import audit
+from core.synthetic import generate
+from core.urls import router
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs EXPLAIN QUERY PLAN over every viewset list query, flags table scans and temp B-trees '
+        'and proposes the missing indexes (everything, including --seed rows, is rolled back)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Synthetic rows to add per table first (use in CI against an empty database)')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the plan of every query')
+        parser.add_argument('--fail-on-missing', action='store_true',
+                            help='Exit with an error when an index is missing (for CI)')
+        parser.add_argument('--write-migration', action='store_true',
+                            help='Write a core migration adding the missing indexes')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if options['seed']:
+                    self.seed(options['seed'])
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE')
+                users = [
+                    User.objects.create_user(email='audit-user@example.com', password=None),
+                    User.objects.create_user(email='audit-staff@example.com', password=None, is_staff=True),
+                ]
+                findings = audit(router, users)
+                raise Rollback
+        except Rollback:
+            pass
+
+        missing = {}
+        for finding in findings:
+            if not finding.flagged and not options['verbose_plans']:
+                continue
+            style = self.style.ERROR if finding.index else self.style.WARNING if finding.flagged else str
+            self.stdout.write(style(finding.label))
+            for detail in finding.plan:
+                self.stdout.write(f'    {detail}')
+            if finding.index:
+                missing.setdefault((finding.model, tuple(finding.index.fields)), finding.index)
+
+        flagged = sum(f.flagged for f in findings)
+        self.stdout.write(f'\n{len(findings)} distinct queries, {flagged} with scans or temp B-trees, '
+                          f'{len(missing)} missing indexes')
+        for (model, _), index in missing.items():
+            self.stdout.write(self.style.ERROR(
+                f'  {model.__name__}: models.Index(fields={list(index.fields)!r}, name={index.name!r})'
+            ))
+
+        if missing and options['write_migration']:
+            self.write_migration(missing)
+        if missing and options['fail_on_missing']:
+            raise CommandError(f'{len(missing)} missing indexes')
+
+    def write_migration(self, missing):
+        leaf = MigrationLoader(None, ignore_no_migrations=True).graph.leaf_nodes('core')
+        number = int(leaf[0][1][:4]) + 1 if leaf else 1
+        migration = Migration(f'{number:04d}_query_plan_indexes', 'core')
+        migration.dependencies = leaf
+        migration.operations = [
+            AddIndex(model_name=model._meta.model_name, index=index) for (model, _), index in missing.items()
+        ]
+        writer = MigrationWriter(migration)
+        with open(writer.path, 'w') as f:
+            f.write(writer.as_string())
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {writer.path}; add the indexes above to each model\'s Meta.indexes to keep makemigrations in sync'
+        ))
+
+    def seed(self, rows):
+        users = max(rows // 10, 1)
+        generate({
+            'users': users, 'careers': rows, 'resources': rows, 'multimedia': rows, 'stories': rows,
+            'quiz_results': rows, 'feedback': rows, 'bookmarks': min(rows, users * rows),
+        }, seed=rows)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from core.rollups import backfill
+
+class Command(BaseCommand):
+    help = 'Rebuilds the dashboard analytics rollups from quiz results, users and bookmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding analytics rollups...')
+        rows = backfill(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Successfully wrote {rows} rollup rows.'))
@@ -0,0 +1,117 @@
+import json
+import logging
+import subprocess
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import api_endpoints, auth_headers, bench_client, bench_server
+from core.models import User, Career, Resource, Multimedia, QuizResult, Feedback, Bookmark
+from core.urls import router
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks every GET endpoint under /api/ (p50/p95/p99, queries per request, throughput) and writes JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--as', dest='role', choices=['anonymous', 'user', 'staff'], default='user',
+                            help='Who makes the requests (user: the user with the latest bookmark)')
+        parser.add_argument('--email', help='Make the requests as this user instead')
+        parser.add_argument('--requests', type=int, default=30, help='Timed requests per endpoint (test client)')
+        parser.add_argument('--warmup', type=int, default=3, help='Untimed requests per endpoint first')
+        parser.add_argument('--server', help='Base URL of a running server to load instead of the test client')
+        parser.add_argument('--concurrency', type=int, default=10, help='Clients per endpoint with --server')
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per endpoint with --server')
+        parser.add_argument('--only', help='Only endpoints whose name contains this text')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--compare', help='A previous --output file to compare against')
+
+    def handle(self, *args, **options):
+        user = self.get_user(options)
+        headers = auth_headers(user)
+        endpoints = [
+            (name, path) for name, path in api_endpoints(router, user)
+            if not options['only'] or options['only'] in name
+        ]
+
+        # Expected 4xx (e.g. admin-only routes as a regular user) are reported
+        # in the results; don't also log each one
+        logging.getLogger('django.request').setLevel(logging.ERROR)
+
+        results = {}
+        for name, path in endpoints:
+            if options['server']:
+                stats = bench_server(options['server'], path, headers,
+                                     concurrency=options['concurrency'], duration=options['duration'])
+            else:
+                stats = bench_client(path, headers, requests=options['requests'], warmup=options['warmup'])
+            results[name] = {'path': path, **stats}
+            self.report(name, stats)
+
+        run = {
+            'started_at': datetime.now(timezone.utc).isoformat(),
+            'commit': self.git_commit(),
+            'mode': 'server' if options['server'] else 'client',
+            'role': options['role'] if not options['email'] else 'user',
+            'database': {'name': str(settings.DATABASES['default']['NAME']), 'rows': self.row_counts()},
+            'endpoints': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(run, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+        if options['compare']:
+            self.compare(options['compare'], results)
+
+    def get_user(self, options):
+        if options['email']:
+            user = User.objects.filter(email=options['email']).first()
+        elif options['role'] == 'staff':
+            user = User.objects.filter(is_staff=True, is_active=True).order_by('pk').first()
+        elif options['role'] == 'user':
+            user = User.objects.filter(pk=Bookmark.objects.order_by('-pk').values('user')[:1]).first()
+        else:
+            return AnonymousUser()
+        if user is None:
+            raise CommandError('No matching user; run generate_synthetic_data or pass --email')
+        return user
+
+    def report(self, name, stats):
+        queries = stats['queries_per_request']
+        style = self.style.ERROR if stats['errors'] else str
+        self.stdout.write(style(
+            f"{name:<40} p50 {stats['p50_ms']:>8} ms  p95 {stats['p95_ms']:>8} ms  p99 {stats['p99_ms']:>8} ms  "
+            f"{stats['throughput_rps']:>8} req/s"
+            + (f"  {queries:>6} queries" if queries is not None else '')
+            + (f"  {stats['errors']} errors {stats.get('status', '')}" if stats['errors'] else '')
+        ))
+
+    def compare(self, path, results):
+        with open(path) as f:
+            baseline = json.load(f)['endpoints']
+        self.stdout.write(f'\nCompared with {path} (p50 / p95, negative is faster):')
+        for name, stats in results.items():
+            before = baseline.get(name)
+            if not before or not before['p50_ms'] or not before['p95_ms']:
+                continue
+            p50 = (stats['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100
+            p95 = (stats['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+            style = self.style.ERROR if p95 > 20 else self.style.SUCCESS if p95 < -20 else str
+            self.stdout.write(style(f'{name:<40} {p50:+7.1f}% / {p95:+7.1f}%'))
+
+    def row_counts(self):
+        return {
+            model._meta.model_name: model.objects.count()
+            for model in (User, Career, Resource, Multimedia, QuizResult, Feedback, Bookmark)
+        }
+
+    def git_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                cwd=settings.BASE_DIR,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,81 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import User, Career, Resource
+from core.views import CareerViewSet, ResourceViewSet
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compares list throughput of the values() fast path against ModelSerializer (synthetic rows are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Synthetic rows added per model')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per path; the best one is reported')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.seed(options['rows'])
+                for viewset, url in ((CareerViewSet, '/api/careers/'), (ResourceViewSet, '/api/resources/')):
+                    self.compare(viewset, url, options['repeat'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def seed(self, rows):
+        Career.objects.bulk_create(
+            Career(
+                title=f'Benchmark Career {i}', description='Lorem ipsum ' * 40, domain='technology',
+                required_skills=['Python', 'SQL', 'Communication'], education_path='BSc ' * 20,
+                expected_salary='$80k', company='Bench Co', demand='High', growth='+12%',
+                experience='1-3 years', salary_range='50k-100k',
+            )
+            for i in range(rows)
+        )
+        Resource.objects.bulk_create(
+            Resource(
+                title=f'Benchmark Resource {i}', description='Lorem ipsum ' * 10,
+                file=f'resources/bench-{i}.pdf', tags=['cv', 'interview'], download_count=i,
+            )
+            for i in range(rows)
+        )
+
+    def run(self, view, repeat):
+        # An unsaved, authenticated user keeps the response cache out of the way
+        user = User(email='bench@example.com', is_active=True)
+        best = None
+        for _ in range(repeat):
+            request = APIRequestFactory().get(self.url)
+            force_authenticate(request, user=user)
+            started = time.perf_counter()
+            response = view(request)
+            response.render()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, response
+
+    def compare(self, viewset, url, repeat):
+        self.url = url
+        view = viewset.as_view({'get': 'list'})
+        fast, fast_response = self.run(view, repeat)
+        viewset.fast_list = False
+        try:
+            slow, slow_response = self.run(view, repeat)
+        finally:
+            del viewset.fast_list
+
+        rows = len(fast_response.data)
+        identical = fast_response.content == slow_response.content
+        self.stdout.write(
+            f"{url}: {rows} rows | ModelSerializer {slow * 1000:.0f} ms ({rows / slow:,.0f} rows/s) | "
+            f"fast path {fast * 1000:.0f} ms ({rows / fast:,.0f} rows/s)"
+        )
+        style = self.style.SUCCESS if identical else self.style.ERROR
+        self.stdout.write(style(f"  speedup x{slow / fast:.2f}, output {'identical' if identical else 'DIFFERS'}"))
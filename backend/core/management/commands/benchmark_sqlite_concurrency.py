@@ -0,0 +1,106 @@
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction, OperationalError
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+from core.loadtest import percentile
+from core.models import Career, Feedback
+
+
+class Command(BaseCommand):
+    help = 'Compares concurrent read/write throughput of the tuned SQLite setup against plain defaults, on a scratch copy of the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=8, help='Reader threads')
+        parser.add_argument('--writers', type=int, default=4, help='Writer threads')
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per configuration')
+
+    def handle(self, *args, **options):
+        source = connections.settings['default']
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, write_settings, read_settings in self.configurations(source, Path(tmp)):
+                stats = self.run(write_settings, read_settings, options)
+                self.report(label, stats, options['duration'])
+
+    def configurations(self, source, tmp):
+        plain_path = self.copy_database(source['NAME'], tmp / 'plain.sqlite3', journal_mode='DELETE')
+        plain = {**source, 'NAME': str(plain_path), 'CONN_MAX_AGE': 0, 'OPTIONS': {}}
+        yield 'defaults (rollback journal, one connection)', plain, plain
+
+        tuned_path = self.copy_database(source['NAME'], tmp / 'tuned.sqlite3', journal_mode='WAL')
+        replica = connections.settings.get('replica', source)
+        yield (
+            'production (WAL, tuned pragmas, read replica)',
+            {**source, 'NAME': str(tuned_path)},
+            {**replica, 'NAME': str(tuned_path) if replica is source else f'file:{tuned_path}?mode=ro'},
+        )
+
+    def copy_database(self, source_path, path, journal_mode):
+        with sqlite3.connect(source_path) as src, sqlite3.connect(path) as dest:
+            src.backup(dest)
+            dest.execute(f'PRAGMA journal_mode={journal_mode}')
+        return path
+
+    def run(self, write_settings, read_settings, options):
+        stats = {'reads': [], 'writes': [], 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['duration']
+
+        def worker(alias, settings_dict, operation, bucket):
+            connections[alias] = DatabaseWrapper(settings_dict, alias)
+            try:
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        operation(alias)
+                    except OperationalError:
+                        with lock:
+                            stats['errors'] += 1
+                        continue
+                    with lock:
+                        stats[bucket].append(time.perf_counter() - started)
+            finally:
+                connections[alias].close()
+
+        threads = [
+            threading.Thread(target=worker, args=('bench_read', read_settings, self.read, 'reads'))
+            for _ in range(options['readers'])
+        ] + [
+            threading.Thread(target=worker, args=('bench_write', write_settings, self.write, 'writes'))
+            for _ in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return stats
+
+    def read(self, alias):
+        # Roughly one catalog list page plus a count
+        list(Career.objects.using(alias).values('pk', 'title', 'domain', 'salary_range')[:50])
+        Feedback.objects.using(alias).count()
+
+    def write(self, alias):
+        # A small read-then-write transaction, like a quiz submission
+        with transaction.atomic(using=alias):
+            Feedback.objects.using(alias).filter(category='query').exists()
+            feedback = Feedback.objects.using(alias).create(category='query', message='benchmark')
+            Feedback.objects.using(alias).filter(pk=feedback.pk).update(message='benchmark (edited)')
+
+    def report(self, label, stats, duration):
+        self.stdout.write(label)
+        for bucket in ('reads', 'writes'):
+            latencies = sorted(stats[bucket])
+            p99 = percentile(latencies, 99)
+            self.stdout.write(
+                f"  {bucket}: {len(latencies) / duration:,.0f}/s, "
+                f"p50 {percentile(latencies, 50) * 1000 if latencies else 0:.1f} ms, "
+                f"p99 {p99 * 1000 if p99 is not None else 0:.1f} ms"
+            )
+        style = self.style.SUCCESS if not stats['errors'] else self.style.ERROR
+        self.stdout.write(style(f"  'database is locked' errors: {stats['errors']}"))
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.synthetic import DEFAULT_VOLUMES, PASSWORD, generate, refresh_derived
+
+
+class Command(BaseCommand):
+    help = 'Bulk-inserts synthetic users, profiles, catalog rows, quiz results, bookmarks and feedback for benchmarks'
+
+    def add_arguments(self, parser):
+        for key, default in DEFAULT_VOLUMES.items():
+            parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=default,
+                                help=f'Rows to create (default {default})')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, for repeatable data')
+        parser.add_argument('--skip-derived', action='store_true',
+                            help='Do not rebuild the search index and rollups afterwards')
+
+    def handle(self, *args, **options):
+        volumes = {key: options[key] for key in DEFAULT_VOLUMES}
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                counts = generate(
+                    volumes, batch_size=options['batch_size'], seed=options['seed'],
+                    log=lambda message: self.stdout.write(f'  {message}'),
+                )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not options['skip_derived']:
+            self.stdout.write('Rebuilding search index and rollups...')
+            refresh_derived()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {sum(counts.values()):,} rows in {elapsed:.1f}s. '
+            f'Synthetic users log in with the password "{PASSWORD}".'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.catalog import CATALOGS, load_catalog, read_records
+
+class Command(BaseCommand):
+    help = 'Upserts catalog rows from a JSON, NDJSON or CSV file, matching existing rows by natural key'
+
+    def add_arguments(self, parser):
+        parser.add_argument('catalog', choices=sorted(CATALOGS))
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['json', 'ndjson', 'csv'],
+                            help='File format (defaults to the file extension)')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Report changes without writing them')
+
+    def handle(self, *args, **options):
+        try:
+            records = read_records(options['path'], options['format'])
+            report = load_catalog(
+                options['catalog'], records,
+                batch_size=options['batch_size'], dry_run=options['dry_run'],
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for error in report.errors:
+            self.stdout.write(self.style.ERROR(f"Row {error['row']}: {error['error']}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['catalog']}: {report.created} created, {report.updated} updated, "
+            f"{report.unchanged} unchanged, {len(report.errors)} errors"
+            + (' (dry run)' if options['dry_run'] else '')
+        ))
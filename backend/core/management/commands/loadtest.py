@@ -0,0 +1,44 @@
+import asyncio
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.loadtest import run_load
+
+
+class Command(BaseCommand):
+    help = 'Runs a keep-alive HTTP load test against a running server and reports latency percentiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('urls', nargs='+', help='Full URLs, requested round robin')
+        parser.add_argument('--concurrency', type=int, default=50, help='Concurrent keep-alive clients')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run for')
+        parser.add_argument('--token', help='JWT access token sent as a Bearer header')
+        parser.add_argument('--slow-clients', type=int, default=0,
+                            help='Extra clients that trickle their request headers in slowly')
+        parser.add_argument('--slow-seconds', type=float, default=2.0,
+                            help='Seconds each slow client takes to send one request')
+        parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+
+    def handle(self, *args, **options):
+        headers = {'Authorization': f"Bearer {options['token']}"} if options['token'] else {}
+        result = asyncio.run(run_load(
+            options['urls'],
+            concurrency=options['concurrency'],
+            duration=options['duration'],
+            headers=headers,
+            slow_clients=options['slow_clients'],
+            slow_seconds=options['slow_seconds'],
+        ))
+        summary = result.summary()
+
+        if options['json']:
+            self.stdout.write(json.dumps(summary))
+            return
+        self.stdout.write(
+            f"{summary['requests']} requests in {summary['seconds']}s "
+            f"({summary['throughput_rps']} req/s), {summary['errors']} errors"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"p50 {summary['p50_ms']} ms | p95 {summary['p95_ms']} ms | p99 {summary['p99_ms']} ms"
+        ))
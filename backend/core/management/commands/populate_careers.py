@@ -1,13 +1,10 @@
 from django.core.management.base import BaseCommand
-from core.models import Career
+from core.catalog import load_catalog
 
 class Command(BaseCommand):
     help = 'Populates the database with initial career data'
 
     def handle(self, *args, **kwargs):
-        self.stdout.write('Deleting existing career data...')
-        Career.objects.all().delete()
-
         careers_data = [
             {
                 "title": "Software Engineer", "company": "Tech Corp", "expected_salary": "$75,000 - $120,000",
@@ -41,8 +38,10 @@ class Command(BaseCommand):
             }
         ]
 
-        self.stdout.write('Creating new career entries...')
-        for data in careers_data:
-            Career.objects.create(**data)
+        self.stdout.write('Loading career entries...')
+        report = load_catalog("careers", careers_data)
+        self.stdout.write(
+            f"{report.created} created, {report.updated} updated, {report.unchanged} unchanged"
+        )
 
         self.stdout.write(self.style.SUCCESS('Successfully populated the database with career data.'))
\ No newline at end of file
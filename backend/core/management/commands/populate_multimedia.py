@@ -1,13 +1,10 @@
 from django.core.management.base import BaseCommand
-from core.models import Multimedia
+from core.catalog import load_catalog
 
 class Command(BaseCommand):
     help = 'Populates the database with initial multimedia content'
 
     def handle(self, *args, **kwargs):
-        self.stdout.write('Deleting existing multimedia content...')
-        Multimedia.objects.all().delete()
-
         content_data = [
             {
                 "type": "Video",
@@ -32,8 +29,10 @@ class Command(BaseCommand):
             },
         ]
 
-        self.stdout.write('Creating new multimedia entries...')
-        for data in content_data:
-            Multimedia.objects.create(**data)
+        self.stdout.write('Loading multimedia entries...')
+        report = load_catalog("multimedia", content_data)
+        self.stdout.write(
+            f"{report.created} created, {report.updated} updated, {report.unchanged} unchanged"
+        )
 
         self.stdout.write(self.style.SUCCESS('Successfully populated the database with multimedia content.'))
\ No newline at end of file
@@ -1,14 +1,11 @@
 # core/management/commands/populate_quiz_questions.py
 from django.core.management.base import BaseCommand
-from core.models import QuizQuestion, Option
+from core.catalog import load_catalog
 
 class Command(BaseCommand):
     help = 'Populates the database with initial quiz questions'
 
     def handle(self, *args, **kwargs):
-        Option.objects.all().delete()
-        QuizQuestion.objects.all().delete()
-
         questions_data = [
             {
                 "text": "What type of work environment do you prefer?",
@@ -64,16 +61,14 @@ class Command(BaseCommand):
             
         ]
 
-        for i, q_data in enumerate(questions_data):
-            question = QuizQuestion.objects.create(
-                text=q_data['text'],
-                order=i
-            )
-            for opt in q_data['options']:
-                Option.objects.create(
-                    question=question,
-                    text=opt['text'],
-                    category=opt['category']
-                )
+        load_catalog("quiz_questions", (
+            {"text": q_data['text'], "order": i}
+            for i, q_data in enumerate(questions_data)
+        ))
+        load_catalog("quiz_options", (
+            {"question": q_data['text'], "text": opt['text'], "category": opt['category'], "order": j}
+            for q_data in questions_data
+            for j, opt in enumerate(q_data['options'])
+        ))
 
         self.stdout.write(self.style.SUCCESS('Successfully populated the database with quiz questions.'))
@@ -1,13 +1,10 @@
 from django.core.management.base import BaseCommand
-from core.models import Resource
+from core.catalog import load_catalog
 
 class Command(BaseCommand):
     help = 'Populates the database with initial resource data'
 
     def handle(self, *args, **kwargs):
-        self.stdout.write('Deleting existing resource data...')
-        Resource.objects.all().delete()
-
         resources_data = [
             {
                 "title": "Resume Building Guide",
@@ -43,8 +40,10 @@ class Command(BaseCommand):
             },
         ]
 
-        self.stdout.write('Creating new resource entries...')
-        for data in resources_data:
-            Resource.objects.create(**data)
+        self.stdout.write('Loading resource entries...')
+        report = load_catalog("resources", resources_data)
+        self.stdout.write(
+            f"{report.created} created, {report.updated} updated, {report.unchanged} unchanged"
+        )
 
         self.stdout.write(self.style.SUCCESS('Successfully populated the database with resource data.'))
\ No newline at end of file
@@ -1,14 +1,11 @@
 from django.core.management.base import BaseCommand
-from core.models import SuccessStory, User
-from core.serializers import SuccessStorySerializer
+from core.models import User
+from core.catalog import load_catalog
 
 class Command(BaseCommand):
     help = 'Populates the database with initial success stories'
 
     def handle(self, *args, **kwargs):
-        self.stdout.write('Deleting existing success stories...')
-        SuccessStory.objects.all().delete()
-
         # Get the first user (usually the admin) to assign as the author.
         # Make sure you have at least one user in your database.
         try:
@@ -44,16 +41,19 @@ class Command(BaseCommand):
             },
         ]
 
-        self.stdout.write('Creating new success stories...')
-        for story_data in stories_data:
-            serializer = SuccessStorySerializer(data={
+        self.stdout.write('Loading success stories...')
+        report = load_catalog("stories", (
+            {
                 **story_data,
-                "user": author.id,
+                "user": author.email,
                 "is_approved": True  # Pre-approve for immediate visibility
-            })
-            if serializer.is_valid():
-                serializer.save()
-            else:
-                self.stdout.write(self.style.ERROR(f'Error saving story: {serializer.errors}'))
+            }
+            for story_data in stories_data
+        ))
+        for error in report.errors:
+            self.stdout.write(self.style.ERROR(f"Error saving story {error['row']}: {error['error']}"))
+        self.stdout.write(
+            f"{report.created} created, {report.updated} updated, {report.unchanged} unchanged"
+        )
 
         self.stdout.write(self.style.SUCCESS('Successfully populated the database with success stories.'))
\ No newline at end of file
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from core.search import rebuild_index
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index for careers, resources and multimedia'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding search index...')
+        counts = rebuild_index(batch_size=options['batch_size'])
+        for kind, count in counts.items():
+            self.stdout.write(f'  {kind}: {count} indexed')
+        self.stdout.write(self.style.SUCCESS('Successfully rebuilt the search index.'))
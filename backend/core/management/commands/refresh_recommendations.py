@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+from core.models import User
+from core.recommendations import refresh_recommendations, refresh_stale
+
+class Command(BaseCommand):
+    help = 'Recomputes stored career recommendations, e.g. after the career catalog changes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help='Only refresh these user ids (repeatable)')
+        parser.add_argument('--stale', action='store_true',
+                            help='Only refresh users whose quiz result or profile changed since')
+        parser.add_argument('--loop', action='store_true', help='Keep refreshing stale users (implies --stale)')
+        parser.add_argument('--interval', type=float, default=60.0, help='Seconds between runs with --loop')
+
+    def handle(self, *args, **options):
+        if options['stale'] or options['loop']:
+            while True:
+                refreshed = refresh_stale()
+                self.stdout.write(self.style.SUCCESS(f'Successfully refreshed recommendations for {refreshed} users.'))
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+            return
+
+        user_ids = options['users'] or User.objects.values_list('pk', flat=True).iterator()
+        refreshed = 0
+        for user_id in user_ids:
+            refresh_recommendations(user_id)
+            refreshed += 1
+        self.stdout.write(self.style.SUCCESS(f'Successfully refreshed recommendations for {refreshed} users.'))
@@ -0,0 +1,38 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from core.outbox import send_batch
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Delivers queued outbox email in batches over one reused mail connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new mail')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls when idle')
+
+    def handle(self, *args, **options):
+        while True:
+            total_sent = total_failed = 0
+            while True:
+                try:
+                    sent, failed = send_batch(batch_size=options['batch_size'])
+                except Exception:
+                    # e.g. the database is briefly unavailable; the claimed
+                    # rows come back when their lease runs out
+                    logger.exception('Sending an outbox batch failed')
+                    self.stderr.write('Sending a batch failed; see the log.')
+                    break
+                if not sent and not failed:
+                    break
+                total_sent += sent
+                total_failed += failed
+            if total_sent or total_failed:
+                self.stdout.write(f'Sent {total_sent}, failed {total_failed}.')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+        self.stdout.write(self.style.SUCCESS('Outbox drained.'))
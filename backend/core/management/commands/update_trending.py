@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+from core import trending
+
+class Command(BaseCommand):
+    help = 'Folds new bookmarks into the trending scores and prunes items outside the window'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep folding in new bookmarks')
+        parser.add_argument('--interval', type=float, default=60.0, help='Seconds between runs with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            processed, pruned = trending.refresh()
+            self.stdout.write(self.style.SUCCESS(
+                f'Processed {processed} new bookmarks, pruned {pruned} stale items.'
+            ))
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,253 @@
+import atexit
+import bisect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------
+# Metrics Registry
+# -------------------------
+#
+# Counters and histograms kept in memory per process and exposed in the
+# Prometheus text format at /metrics. With METRICS_DIR set, each process
+# also writes its values to <METRICS_DIR>/<pid>.json every
+# METRICS_FLUSH_INTERVAL seconds (and at exit), and a scrape adds up every
+# file there, so whichever worker answers reports the whole server. Its own
+# values are read live; the other workers' are at most one interval old.
+# Counters only ever go up, so files left by exited workers stay valid
+# until the directory is cleared on deploy.
+
+# Seconds; the upper bounds of the latency histogram's buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS = {
+    "http_requests_total": ("counter", "Requests served, by view, method and status."),
+    "http_request_duration_seconds": ("histogram", "Time to the response headers, by view and method."),
+    "http_request_db_queries_total": ("counter", "SQL statements executed while serving requests, by view."),
+    "http_request_db_seconds_total": ("counter", "Time spent executing SQL while serving requests, by view."),
+    "cache_lookups_total": ("counter", "Cache lookups, by cache and result (hit or miss)."),
+    "cache_hit_ratio": ("gauge", "Hits over lookups since the counters started, by cache."),
+}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and fixed-bucket histograms keyed by metric name
+    and a sorted tuple of label pairs. `collect()` merges this process's
+    values with the other processes' snapshots in `directory`; `render()`
+    formats the result for Prometheus.
+    """
+
+    def __init__(self, directory=None, flush_interval=5.0, buckets=LATENCY_BUCKETS):
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._counters = {}
+        self._histograms = {}
+        self._dirty = False
+        self._flusher = None
+
+    def inc(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._check_fork()
+            self._counters[key] = self._counters.get(key, 0) + amount
+            self._dirty = True
+        self._ensure_flusher()
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._check_fork()
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # Per-bucket counts (the last one is +Inf), sum, count
+                histogram = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][bisect.bisect_left(self.buckets, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+            self._dirty = True
+        self._ensure_flusher()
+
+    def snapshot(self):
+        """This process's values, in the JSON-friendly form written to disk."""
+        with self._lock:
+            return {
+                "counters": [[name, labels, value] for (name, labels), value in self._counters.items()],
+                "histograms": [
+                    [name, labels, list(buckets), total, count]
+                    for (name, labels), (buckets, total, count) in self._histograms.items()
+                ],
+            }
+
+    def flush(self):
+        """Write this process's snapshot to METRICS_DIR, if anything changed."""
+        if self.directory is None or not self._dirty:
+            return
+        self._dirty = False
+        data = json.dumps(self.snapshot())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a scrape never reads half a file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(tmp, self.directory / f"{os.getpid()}.json")
+
+    def collect(self):
+        """
+        Merged values of every process: ({(name, labels): value},
+        {(name, labels): [buckets, sum, count]}).
+        """
+        snapshots = [self.snapshot()]
+        if self.directory is not None and self.directory.is_dir():
+            own = f"{os.getpid()}.json"
+            for path in self.directory.glob("*.json"):
+                if path.name == own:
+                    continue
+                try:
+                    snapshots.append(json.loads(path.read_text()))
+                except (OSError, ValueError):
+                    logger.warning("Skipping unreadable metrics file %s", path)
+
+        counters, histograms = {}, {}
+        for snapshot in snapshots:
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, buckets, total, count in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                merged = histograms.get(key)
+                if merged is None:
+                    histograms[key] = [list(buckets), total, count]
+                elif len(merged[0]) == len(buckets):
+                    merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+                    merged[1] += total
+                    merged[2] += count
+        return counters, histograms
+
+    def render(self):
+        """Every metric in the Prometheus text exposition format (0.0.4)."""
+        counters, histograms = self.collect()
+        counters.update(self.hit_ratios(counters))
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            if kind == "histogram":
+                series = sorted(item for item in histograms.items() if item[0][0] == name)
+            else:
+                series = sorted(item for item in counters.items() if item[0][0] == name)
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (_, labels), value in series:
+                if kind != "histogram":
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                    continue
+                buckets, total, count = value
+                cumulative = 0
+                for bound, bucket in zip(self.buckets + (float("inf"),), buckets):
+                    cumulative += bucket
+                    le = "+Inf" if bound == float("inf") else _number(bound)
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+                lines.append(f"{name}_count{_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def hit_ratios(self, counters):
+        lookups = {}
+        for (name, labels), value in counters.items():
+            if name != "cache_lookups_total":
+                continue
+            labels = dict(labels)
+            hits, total = lookups.get(labels["cache"], (0, 0))
+            lookups[labels["cache"]] = (hits + value * (labels["result"] == "hit"), total + value)
+        return {
+            ("cache_hit_ratio", (("cache", cache),)): round(hits / total, 4)
+            for cache, (hits, total) in lookups.items() if total
+        }
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._dirty = True
+
+    def _check_fork(self):
+        # A worker forked from a process that already counted something must
+        # not report (and write back under its own pid) the parent's values
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _ensure_flusher(self):
+        if self.directory is None or self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._run, name="metrics-flusher", daemon=True)
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to write metrics to %s", self.directory)
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+registry = MetricsRegistry(
+    directory=getattr(settings, "METRICS_DIR", None),
+    flush_interval=getattr(settings, "METRICS_FLUSH_INTERVAL", 5.0),
+)
+
+
+# -------------------------
+# Recording
+# -------------------------
+
+def observe_request(request, response, timing, total):
+    """Record one served request; called by RequestTimingMiddleware."""
+    match = getattr(request, "resolver_match", None)
+    # URL names; the router's (career-list, career-detail, bookmark-export-pdf)
+    # name the viewset action too
+    view = match.view_name if match is not None else "unmatched"
+    registry.inc("http_requests_total", {"view": view, "method": request.method, "status": response.status_code})
+    registry.observe("http_request_duration_seconds", {"view": view, "method": request.method}, total)
+    if timing.queries:
+        registry.inc("http_request_db_queries_total", {"view": view}, timing.queries)
+        registry.inc("http_request_db_seconds_total", {"view": view}, timing.sql)
+
+
+def cache_lookup(cache, hit):
+    registry.inc("cache_lookups_total", {"cache": cache, "result": "hit" if hit else "miss"})
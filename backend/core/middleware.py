@@ -0,0 +1,113 @@
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.functional import SimpleLazyObject, empty
+
+from . import instrumentation, metrics
+
+
+slow_request_logger = logging.getLogger("core.slow_requests")
+
+
+# -------------------------
+# Request Timing
+# -------------------------
+
+class RequestTimingMiddleware:
+    """
+    Times each request -- SQL (with the query count), serialization,
+    rendering and the total -- records it in the /metrics registry
+    (core.metrics), and logs requests slower than SLOW_REQUEST_MS as one
+    JSON record with their slowest queries. The Server-Timing header with
+    the same figures goes only to staff users, or to everyone with DEBUG
+    on. Put it first in MIDDLEWARE so the total covers the others.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_seconds = settings.SLOW_REQUEST_MS / 1000
+        self.top_queries = settings.SLOW_REQUEST_TOP_QUERIES
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing, token = instrumentation.start(self.top_queries)
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.finish(token)
+        return self.finish(request, response, timing)
+
+    async def __acall__(self, request):
+        timing, token = instrumentation.start(self.top_queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.finish(token)
+        return self.finish(request, response, timing)
+
+    def process_template_response(self, request, response):
+        # Called right before a DRF/template response is rendered
+        timing = instrumentation.current()
+        if timing is not None:
+            render_started = time.perf_counter()
+
+            def rendered(response):
+                timing.render += time.perf_counter() - render_started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def finish(self, request, response, timing):
+        total = timing.elapsed()
+        if settings.DEBUG or is_staff(request):
+            response["Server-Timing"] = (
+                f'db;dur={timing.sql * 1000:.1f};desc="{timing.queries} queries", '
+                f"serialize;dur={timing.serialize * 1000:.1f}, "
+                f"render;dur={timing.render * 1000:.1f}, "
+                f"total;dur={total * 1000:.1f}"
+            )
+        metrics.observe_request(request, response, timing, total)
+        if total >= self.slow_seconds:
+            self.log_slow(request, response, timing, total)
+        return response
+
+    def log_slow(self, request, response, timing, total):
+        record = {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 1),
+            "db_ms": round(timing.sql * 1000, 1),
+            "queries": timing.queries,
+            "serialize_ms": round(timing.serialize * 1000, 1),
+            "render_ms": round(timing.render * 1000, 1),
+            "top_queries": [
+                {"ms": round(seconds * 1000, 2), "sql": sql}
+                for seconds, sql in timing.top_queries()
+            ],
+        }
+        slow_request_logger.warning(json.dumps(record), extra={"slow_request": record})
+
+
+def is_staff(request):
+    """
+    Whether the user the request was served for is staff: the one DRF or an
+    async view authenticated, or a session user something already loaded.
+    An unloaded session user counts as not staff; loading it here would
+    query the database, from the event loop under ASGI.
+    """
+    user = request.__dict__.get("user")
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return False
+    return bool(getattr(user, "is_staff", False))
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_userprofile_bio_userprofile_education_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='career',
+            index=models.Index(fields=['domain', '-career_id'], name='career_domain_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='career',
+            index=models.Index(fields=['experience', '-career_id'], name='career_experience_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='career',
+            index=models.Index(fields=['salary_range', '-career_id'], name='career_salary_range_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_career_career_domain_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS core_search_index "
+                "USING fts5(title, body, tokenize='porter unicode61')"
+            ),
+            reverse_sql="DROP TABLE IF EXISTS core_search_index",
+        ),
+    ]
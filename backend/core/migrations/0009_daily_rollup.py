@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('metric', models.CharField(choices=[('active_user', 'Active user'), ('quiz_attempt', 'Quiz attempt'), ('bookmark_career', 'Career bookmark'), ('bookmark_resource', 'Resource bookmark'), ('bookmark_multimedia', 'Multimedia bookmark')], max_length=30)),
+                ('key', models.CharField(max_length=100)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('metric', 'day', 'key'), name='daily_rollup_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CareerRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveIntegerField()),
+                ('score', models.FloatField()),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.career')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='career_recommendations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['rank'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'rank'), name='career_recommendation_rank_unique')],
+            },
+        ),
+    ]
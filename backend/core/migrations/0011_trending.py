@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_career_recommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, unique=True)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TrendingScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('career', 'Career'), ('resource', 'Resource')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('log_score', models.FloatField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', '-log_score'], name='trending_score_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='trending_score_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_trending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookmarkExport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('rendered_version', models.PositiveIntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('idle', 'Idle'), ('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='idle', max_length=10)),
+                ('file_path', models.CharField(blank=True, max_length=500)),
+                ('error', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='bookmark_export', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0013_outbox_email'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookmark',
+            index=models.Index(fields=['user', 'created_at'], name='bookmark_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quizquestion',
+            index=models.Index(fields=['order'], name='quizquestion_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quizresult',
+            index=models.Index(fields=['user', '-submitted_at'], name='quizresult_user_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['-created_at'], name='resource_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='successstory',
+            index=models.Index(fields=['is_approved', '-created_at'], name='story_approved_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='successstory',
+            index=models.Index(fields=['-created_at'], name='story_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-created_at'], name='user_created_idx'),
+        ),
+    ]
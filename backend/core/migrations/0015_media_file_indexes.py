@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-17 00:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_query_plan_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='multimedia',
+            index=models.Index(fields=['file'], name='multimedia_file_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['file'], name='resource_file_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-17 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_media_file_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['profile_image'], name='profile_image_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['resume'], name='profile_resume_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-17 00:49
+
+from django.db import migrations, models
+from django.db.models import Max, Sum
+
+
+def fill_totals(apps, schema_editor):
+    DailyRollup = apps.get_model('core', 'DailyRollup')
+    RollupTotal = apps.get_model('core', 'RollupTotal')
+    rows = (
+        DailyRollup.objects.values('metric', 'key')
+        .annotate(total=Sum('count'), last_day=Max('day'))
+        .order_by()
+    )
+    RollupTotal.objects.bulk_create(
+        (RollupTotal(metric=row['metric'], key=row['key'], count=row['total'], last_day=row['last_day']) for row in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_profile_file_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('active_user', 'Active user'), ('quiz_attempt', 'Quiz attempt'), ('bookmark_career', 'Career bookmark'), ('bookmark_resource', 'Resource bookmark'), ('bookmark_multimedia', 'Multimedia bookmark')], max_length=30)),
+                ('key', models.CharField(max_length=100)),
+                ('count', models.IntegerField(default=0)),
+                ('last_day', models.DateField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['metric', '-count'], name='rollup_total_top_idx'), models.Index(fields=['metric', 'last_day'], name='rollup_total_recent_idx')],
+                'constraints': [models.UniqueConstraint(fields=('metric', 'key'), name='rollup_total_unique')],
+            },
+        ),
+        migrations.RunPython(fill_totals, migrations.RunPython.noop),
+    ]
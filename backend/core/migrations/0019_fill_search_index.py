@@ -0,0 +1,40 @@
+from django.db import migrations
+
+from core import search
+
+
+# 0008 created the index empty; rows saved before it were only found after
+# a manual rebuild_search_index. Rebuilt from the historical models, so the
+# migration keeps working as the catalog models change.
+BUILDERS = {
+    'Career': ('career', search.career_document),
+    'Resource': ('resource', search.resource_document),
+    'Multimedia': ('multimedia', search.multimedia_document),
+}
+
+
+def fill_search_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {search.SEARCH_TABLE}')
+        for model_name, (kind, build) in BUILDERS.items():
+            model = apps.get_model('core', model_name)
+            rows = []
+            for instance in model.objects.iterator(chunk_size=1000):
+                rows.append((search._rowid(kind, instance.pk), *build(instance)))
+                if len(rows) >= 1000:
+                    search._insert_rows(cursor, rows)
+                    rows = []
+            if rows:
+                search._insert_rows(cursor, rows)
+        cursor.execute(f"INSERT INTO {search.SEARCH_TABLE} ({search.SEARCH_TABLE}) VALUES ('optimize')")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_stale_recommendations'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_search_index, migrations.RunPython.noop),
+    ]
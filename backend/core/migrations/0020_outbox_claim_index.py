@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-17 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_fill_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='outboxemail',
+            index=models.Index(fields=['claim_token'], name='outbox_claim_idx'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseU
 from django.conf import settings
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 # -----------------------
 # User & Manager
@@ -46,6 +47,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["uname"]
 
+    class Meta:
+        # Admin user list, newest first
+        indexes = [models.Index(fields=["-created_at"], name="user_created_idx")]
+
     def __str__(self):
         return self.email
 
@@ -70,6 +75,15 @@ class Career(models.Model):
     experience = models.CharField(max_length=50, blank=True) # e.g., "entry", "mid"
     salary_range = models.CharField(max_length=50, blank=True) # e.g., "80-120k"
 
+    class Meta:
+        # Filter column first, pk second: one index range scan serves both the
+        # WHERE clause and the keyset ORDER BY of /api/careers/.
+        indexes = [
+            models.Index(fields=["domain", "-career_id"], name="career_domain_idx"),
+            models.Index(fields=["experience", "-career_id"], name="career_experience_idx"),
+            models.Index(fields=["salary_range", "-career_id"], name="career_salary_range_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -107,6 +121,14 @@ class Resource(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name="resources")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # /api/resources/ lists newest first
+            models.Index(fields=["-created_at"], name="resource_created_idx"),
+            # /media/ requests look the row up by file name
+            models.Index(fields=["file"], name="resource_file_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -125,6 +147,13 @@ class SuccessStory(models.Model):
     is_approved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Public list (approved only) and staff list, both newest first
+        indexes = [
+            models.Index(fields=["is_approved", "-created_at"], name="story_approved_created_idx"),
+            models.Index(fields=["-created_at"], name="story_created_idx"),
+        ]
+
     def __str__(self):
         return f"Story by {self.name} in {self.domain}"
 
@@ -149,6 +178,13 @@ class UserProfile(models.Model):
     resume = models.FileField(upload_to="resumes/", blank=True, null=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # /media/ requests look the row up by file name
+        indexes = [
+            models.Index(fields=["profile_image"], name="profile_image_idx"),
+            models.Index(fields=["resume"], name="profile_resume_idx"),
+        ]
+
     def __str__(self):
         return f"Profile: {self.user.uname}"
 
@@ -175,6 +211,10 @@ class Multimedia(models.Model):
     tags = models.JSONField(default=list, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # /media/ requests look the row up by file name
+        indexes = [models.Index(fields=["file"], name="multimedia_file_idx")]
+
     def __str__(self):
         return self.title
 
@@ -189,6 +229,7 @@ class QuizQuestion(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=["order"], name="quizquestion_order_idx")]
 
     def __str__(self):
         return self.text
@@ -214,6 +255,10 @@ class QuizResult(models.Model):
     best_category = models.CharField(max_length=100)
     submitted_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # A user's latest result feeds their recommendations
+        indexes = [models.Index(fields=["user", "-submitted_at"], name="quizresult_user_submitted_idx")]
+
     def __str__(self):
         return f"Result {self.result_id} - {self.best_category}"
 
@@ -248,6 +293,8 @@ class Bookmark(models.Model):
 
     class Meta:
         unique_together = ("user", "career", "resource", "multimedia")
+        # A user's bookmarks in the order they were added (PDF export)
+        indexes = [models.Index(fields=["user", "created_at"], name="bookmark_user_created_idx")]
 
 
         
@@ -271,3 +318,203 @@ class PasswordResetToken(models.Model):
 
     def __str__(self):
         return f"Token for {self.user.email}"
+
+
+# -----------------------
+# Analytics Rollups
+# -----------------------
+class DailyRollup(models.Model):
+    """
+    Pre-aggregated daily counters for the admin dashboard, maintained from
+    signals (see core.rollups) and rebuilt with `backfill_rollups`.
+    `key` is the grouping value: a quiz category, a bookmarked object id or,
+    for active users, the user id.
+    """
+    METRIC_CHOICES = [
+        ("active_user", "Active user"),
+        ("quiz_attempt", "Quiz attempt"),
+        ("bookmark_career", "Career bookmark"),
+        ("bookmark_resource", "Resource bookmark"),
+        ("bookmark_multimedia", "Multimedia bookmark"),
+    ]
+
+    day = models.DateField()
+    metric = models.CharField(max_length=30, choices=METRIC_CHOICES)
+    key = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["metric", "day", "key"], name="daily_rollup_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.metric} {self.key}: {self.count}"
+
+
+class RollupTotal(models.Model):
+    """
+    All-time count per metric and key, kept next to the DailyRollup rows by
+    the same bumps, so the dashboard's totals and top lists read one row
+    per key instead of summing every day of history. `last_day` is the
+    latest day the key was bumped (for active users: their last activity).
+    """
+    metric = models.CharField(max_length=30, choices=DailyRollup.METRIC_CHOICES)
+    key = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+    last_day = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["metric", "key"], name="rollup_total_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["metric", "-count"], name="rollup_total_top_idx"),
+            models.Index(fields=["metric", "last_day"], name="rollup_total_recent_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} {self.key}: {self.count}"
+
+
+# -----------------------
+# Career Recommendations
+# -----------------------
+class CareerRecommendation(models.Model):
+    """
+    Materialized top careers per user, rewritten by core.recommendations
+    in the background after the user's quiz result or profile changes, or
+    by `refresh_recommendations`.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="career_recommendations")
+    career = models.ForeignKey(Career, on_delete=models.CASCADE, related_name="+")
+    rank = models.PositiveIntegerField()
+    score = models.FloatField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "rank"], name="career_recommendation_rank_unique"),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.career_id} for user {self.user_id}"
+
+
+class StaleRecommendation(models.Model):
+    """
+    A user whose quiz result or profile changed after their stored
+    recommendations were computed. The background refresh queued by the
+    save, or `refresh_recommendations --stale`, clears the mark.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="+")
+    marked_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Recommendations for user {self.user_id} stale since {self.marked_at}"
+
+
+# -----------------------
+# Trending
+# -----------------------
+class TrendingScore(models.Model):
+    """
+    Exponentially decayed popularity of one catalog item, kept as the log of
+    its score relative to a fixed epoch (see core.trending). Ordering by
+    log_score is the same as ordering by the current decayed score.
+    """
+    KIND_CHOICES = [
+        ("career", "Career"),
+        ("resource", "Resource"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    log_score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="trending_score_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "-log_score"], name="trending_score_rank_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.log_score:.3f}"
+
+
+class TrendingCheckpoint(models.Model):
+    """Last event id folded into the trending scores, per event source."""
+    source = models.CharField(max_length=50, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} @ {self.last_id}"
+
+
+# -----------------------
+# Bookmark Exports
+# -----------------------
+class BookmarkExport(models.Model):
+    """
+    Tracks a user's rendered bookmark PDF. `version` is bumped whenever one
+    of the user's bookmarks changes; the file on disk is current only while
+    `rendered_version` matches it.
+    """
+    STATUS_CHOICES = [
+        ("idle", "Idle"),
+        ("pending", "Pending"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+    ]
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="bookmark_export")
+    version = models.PositiveIntegerField(default=0)
+    rendered_version = models.PositiveIntegerField(null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="idle")
+    file_path = models.CharField(max_length=500, blank=True)
+    error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Bookmark export for user {self.user_id} ({self.status})"
+
+
+# -----------------------
+# Email Outbox
+# -----------------------
+class OutboxEmail(models.Model):
+    """
+    Mail queued by request handlers and delivered by the `send_queued_mail`
+    worker (see core.outbox).
+    """
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claim_token = models.CharField(max_length=32, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+            # claim_batch() re-reads the rows it just claimed by token
+            models.Index(fields=["claim_token"], name="outbox_claim_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
@@ -0,0 +1,114 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = getattr(settings, "OUTBOX_MAX_ATTEMPTS", 5)
+RETRY_BASE = timedelta(seconds=getattr(settings, "OUTBOX_RETRY_BASE_SECONDS", 30))
+RETRY_MAX = timedelta(hours=1)
+
+# How long a worker owns the messages it claimed before others may retry them
+CLAIM_LEASE = timedelta(minutes=5)
+
+
+def enqueue_mail(subject, message, from_email, recipient_list):
+    """Drop-in for send_mail() on the request path: one INSERT, no SMTP."""
+    return OutboxEmail.objects.create(
+        subject=subject, body=message, from_email=from_email, to=list(recipient_list),
+    )
+
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2x base, 4x base ... capped at RETRY_MAX."""
+    return min(RETRY_BASE * (2 ** max(attempts - 1, 0)), RETRY_MAX)
+
+
+def claim_batch(batch_size):
+    """
+    Atomically take up to `batch_size` due messages for this worker. The
+    claim is a single UPDATE, so concurrent workers never get the same row.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    due = (
+        OutboxEmail.objects.filter(status="queued", next_attempt_at__lte=now)
+        .order_by("next_attempt_at")
+        .values("pk")[:batch_size]
+    )
+    claimed = OutboxEmail.objects.filter(pk__in=due).update(
+        claim_token=token, next_attempt_at=now + CLAIM_LEASE,
+    )
+    if not claimed:
+        return []
+    return list(OutboxEmail.objects.filter(claim_token=token, status="queued"))
+
+
+def send_batch(batch_size=50, connection=None):
+    """
+    Deliver one batch of queued mail over a single backend connection.
+    Returns (sent, failed) counts for the batch.
+
+    If the connection cannot be opened (SMTP down, bad credentials) every
+    claimed message counts as a failed attempt and backs off, so a broken
+    server never turns into a tight retry loop.
+    """
+    messages = claim_batch(batch_size)
+    if not messages:
+        return 0, 0
+
+    connection = connection or get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        logger.warning("Opening the mail connection failed: %s", e)
+        for outbox in messages:
+            record_failure(outbox, e)
+        return 0, len(messages)
+
+    sent = failed = 0
+    try:
+        for outbox in messages:
+            email = EmailMessage(
+                outbox.subject, outbox.body, outbox.from_email, outbox.to, connection=connection,
+            )
+            try:
+                email.send()
+            except Exception as e:
+                logger.warning("Sending outbox email %s failed: %s", outbox.pk, e)
+                record_failure(outbox, e)
+                failed += 1
+            else:
+                outbox.attempts += 1
+                outbox.status = "sent"
+                outbox.sent_at = timezone.now()
+                outbox.last_error = ""
+                release(outbox)
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def record_failure(outbox, error):
+    """Count a failed attempt: back off, or give up after MAX_ATTEMPTS."""
+    outbox.attempts += 1
+    outbox.last_error = str(error)
+    if outbox.attempts >= MAX_ATTEMPTS:
+        outbox.status = "failed"
+    else:
+        outbox.next_attempt_at = timezone.now() + retry_delay(outbox.attempts)
+    release(outbox)
+
+
+def release(outbox):
+    outbox.claim_token = ""
+    outbox.save(update_fields=[
+        "attempts", "status", "next_attempt_at", "last_error", "sent_at", "claim_token",
+    ])
@@ -0,0 +1,27 @@
+from rest_framework.pagination import CursorPagination
+
+
+# -------------------------
+# Keyset Pagination
+# -------------------------
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination over the primary key.
+
+    Pagination is opt-in so existing clients that expect a plain list keep
+    working: a page is only returned when the request carries `page_size`
+    or `cursor`. Pages are fetched with `WHERE pk < ? ORDER BY pk DESC LIMIT n`,
+    which stays index-only no matter how deep the client scrolls.
+    """
+    page_size = None
+    default_page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-pk"
+
+    def get_page_size(self, request):
+        params = request.query_params
+        if self.page_size_query_param not in params and self.cursor_query_param not in params:
+            return None
+        return super().get_page_size(request) or self.default_page_size
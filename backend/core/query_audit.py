@@ -0,0 +1,186 @@
+from dataclasses import dataclass, field
+
+from django.db import connections
+from django.db.models import Index
+from django.db.models.expressions import Col
+from django.db.models.lookups import Exact
+from django.db.models.sql.where import AND
+from rest_framework.test import APIRequestFactory
+
+from .async_views import bind_view
+from .models import Bookmark, QuizResult
+
+
+# -------------------------
+# Query Plan Audit
+# -------------------------
+#
+# Builds the list queryset of every registered viewset the way a request
+# would (get_queryset + filter_queryset + paginator ordering), asks SQLite
+# for its EXPLAIN QUERY PLAN and flags full table scans and temp B-trees.
+# For a flagged query whose equality filters and ORDER BY are plain
+# columns of the base table, the composite index that would serve it is
+# proposed unless the database already has one with those leading columns.
+
+# Hot queries that do not come from a viewset, kept in step with the code
+# that runs them.
+EXTRA_QUERIES = {
+    # recommendations.build_user_signals()
+    "recommendations: latest quiz result": lambda user: (
+        QuizResult.objects.filter(user_id=user.pk).order_by("-submitted_at")
+    ),
+    # exports.render_bookmarks_pdf()
+    "exports: bookmarks pdf": lambda user: (
+        Bookmark.objects.filter(user_id=user.pk).select_related("career", "resource", "multimedia")
+        .order_by("created_at")
+    ),
+}
+
+
+@dataclass
+class PlanFinding:
+    label: str
+    model: type
+    sql: str
+    plan: list
+    scans: list = field(default_factory=list)
+    temp_btrees: list = field(default_factory=list)
+    index: Index = None
+
+    @property
+    def flagged(self):
+        return bool(self.scans or self.temp_btrees)
+
+
+def explain(queryset):
+    """EXPLAIN QUERY PLAN detail lines for `queryset` on its own database."""
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return sql, [row[-1] for row in cursor.fetchall()]
+
+
+def audit_queryset(label, queryset):
+    sql, plan = explain(queryset)
+    finding = PlanFinding(label, queryset.model, sql, plan)
+    for detail in plan:
+        # An ordered walk of an index ("SCAN t USING INDEX i") is what a
+        # LIMITed ORDER BY wants; FTS virtual tables and constant rows are
+        # not table scans either
+        if detail.startswith("SCAN ") and not any(
+            word in detail for word in ("USING", "VIRTUAL TABLE", "CONSTANT ROW")
+        ):
+            finding.scans.append(detail)
+        elif detail.startswith("USE TEMP B-TREE"):
+            finding.temp_btrees.append(detail)
+    if finding.flagged:
+        finding.index = missing_index(queryset)
+    return finding
+
+
+def index_fields(queryset):
+    """
+    The `Index.fields` that would serve `queryset`: equality-filtered columns
+    of the base table first, then its ORDER BY. None when a join, an OR or a
+    non-equality lookup means no single-table index can help.
+    """
+    query = queryset.query
+    opts = queryset.model._meta
+    table = opts.db_table
+
+    fields = []
+    if query.where.children:
+        if query.where.connector != AND or query.where.negated:
+            return None
+        for child in query.where.children:
+            lhs = getattr(child, "lhs", None)
+            if not isinstance(child, Exact) or not isinstance(lhs, Col) or lhs.alias != table:
+                return None
+            if lhs.target.name not in fields:
+                fields.append(lhs.target.name)
+
+    ordering = query.order_by or (opts.ordering if query.default_ordering else ())
+    for name in ordering:
+        if not isinstance(name, str):
+            return None
+        descending = name.startswith("-")
+        name = name.lstrip("-")
+        name = opts.pk.name if name == "pk" else name
+        if "__" in name or name not in {f.name for f in opts.concrete_fields}:
+            return None
+        if name not in fields:
+            fields.append(f"-{name}" if descending else name)
+    return fields or None
+
+
+def existing_indexes(model, connection):
+    """Column lists of every index the database has on `model`'s table."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    return [c["columns"] for c in constraints.values() if c["index"] or c["unique"] or c["primary_key"]]
+
+
+def missing_index(queryset):
+    fields = index_fields(queryset)
+    if fields is None:
+        return None
+    model = queryset.model
+    columns = [model._meta.get_field(name.lstrip("-")).column for name in fields]
+    for existing in existing_indexes(model, connections[queryset.db]):
+        if existing[:len(columns)] == columns:
+            return None
+    index = Index(fields=fields, name="")
+    index.set_name_with_model(model)
+    return index
+
+
+def viewset_querysets(router, users):
+    """
+    Yield (label, queryset) for each registered viewset's list action, once
+    per user and per representative parameter set: no parameters, each
+    `filter_fields` entry with a value taken from the data, and a keyset page
+    when the viewset paginates with a cursor.
+    """
+    for prefix, viewset, _ in router.registry:
+        for user in users:
+            for params in representative_params(viewset, user):
+                view = bind_view(viewset, _get_request(prefix, params), user, action="list")
+                queryset = view.filter_queryset(view.get_queryset())
+                paginator = view.paginator
+                if "page_size" in params and hasattr(paginator, "get_ordering"):
+                    queryset = queryset.order_by(*paginator.get_ordering(view.request, queryset, view))
+                role = "staff" if user.is_staff else "user"
+                query = "&".join(f"{k}={v}" for k, v in params.items())
+                yield f"{prefix} list ({role}{', ' + query if query else ''})", queryset
+
+
+def representative_params(viewset, user):
+    params = [{}]
+    view = bind_view(viewset, _get_request("", {}), user, action="list")
+    base = view.get_queryset()
+    for name in getattr(viewset, "filter_fields", ()):
+        value = base.values_list(name, flat=True).exclude(**{name: ""}).first()
+        params.append({name: value if value is not None else "x"})
+    if hasattr(view.paginator, "get_ordering"):
+        params += [{**p, "page_size": 20} for p in list(params)]
+    return params
+
+
+def _get_request(prefix, params):
+    return APIRequestFactory().get(f"/api/{prefix}/", params)
+
+
+def audit(router, users):
+    """Run the audit; returns PlanFindings for distinct SQL statements."""
+    seen = set()
+    findings = []
+    cases = list(viewset_querysets(router, users))
+    for user in users:
+        cases += [(f"{label} ({'staff' if user.is_staff else 'user'})", build(user)) for label, build in EXTRA_QUERIES.items()]
+    for label, queryset in cases:
+        finding = audit_queryset(label, queryset)
+        if finding.sql in seen:
+            continue
+        seen.add(finding.sql)
+        findings.append(finding)
+    return findings
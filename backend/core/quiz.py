@@ -0,0 +1,166 @@
+import threading
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.renderers import JSONRenderer
+
+from .models import QuizQuestion, Option
+from .serializers import QuizQuestionSerializer
+from . import versions
+from .signals import bulk_saved
+
+
+# -------------------------
+# Quiz Version
+# -------------------------
+#
+# Question and option edits move the "quiz" scope in core.versions once
+# their transaction commits. In-process tables remember the version they
+# were built from and rebuild lazily once it moves, so workers sharing a
+# cache backend pick up admin edits without a restart, and never rebuild
+# from rows that are about to change.
+
+def get_quiz_version():
+    token, _ = versions.get_version("quiz")
+    return token
+
+
+# -------------------------
+# Option -> Category Table
+# -------------------------
+
+class OptionTable:
+    """
+    Maps option ids to (question_id, category), built with a single query.
+    `categories` keeps first-seen order so ties resolve the same way on
+    every worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self.options = {}
+        self.categories = []
+
+    def _build(self):
+        options = {}
+        categories = []
+        rows = Option.objects.order_by("question__order", "question_id", "order", "id").values_list(
+            "id", "question_id", "category"
+        )
+        for option_id, question_id, category in rows:
+            options[option_id] = (question_id, category)
+            if category not in categories:
+                categories.append(category)
+        self.options = options
+        self.categories = categories
+
+    def refresh(self):
+        version = get_quiz_version()
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._build()
+                    self._version = version
+        return self
+
+    def invalidate(self):
+        self._version = None
+
+
+option_table = OptionTable()
+
+
+class InvalidAnswers(ValueError):
+    pass
+
+
+def score_answers(option_ids):
+    """
+    Score a list of chosen option ids. Returns (scores, best_category).
+    Raises InvalidAnswers for unknown ids or two answers to one question.
+    """
+    table = option_table.refresh()
+    scores = dict.fromkeys(table.categories, 0)
+    answered = set()
+
+    for option_id in option_ids:
+        try:
+            question_id, category = table.options[option_id]
+        except KeyError:
+            raise InvalidAnswers(f"Unknown option id: {option_id}")
+        if question_id in answered:
+            raise InvalidAnswers(f"More than one answer given for question {question_id}.")
+        answered.add(question_id)
+        scores[category] += 1
+
+    best_category = ""
+    best_score = 0
+    for category, score in scores.items():
+        if score > best_score:
+            best_category, best_score = category, score
+    return scores, best_category
+
+
+# -------------------------
+# Question Payload
+# -------------------------
+
+QUESTION_PAYLOAD_KEY = "quiz:questions:v{version}"
+QUESTION_PAYLOAD_TIMEOUT = 60 * 60 * 24
+
+
+def render_question_payload():
+    questions = QuizQuestion.objects.prefetch_related("options")
+    return JSONRenderer().render(QuizQuestionSerializer(questions, many=True).data)
+
+
+def get_question_payload():
+    """
+    Return the full question list as pre-rendered JSON bytes. Keys carry the
+    quiz version token, so a committed edit simply makes the next request
+    miss and rebuild; stale entries age out on their own.
+    """
+    key = QUESTION_PAYLOAD_KEY.format(version=get_quiz_version())
+    payload = cache.get(key)
+    if payload is None:
+        payload = render_question_payload()
+        cache.set(key, payload, QUESTION_PAYLOAD_TIMEOUT)
+    return payload
+
+
+async def aget_question_payload(version=None):
+    """
+    get_question_payload() for async views, through the cache's async API;
+    only a miss renders, off the loop. `version` is the quiz token if the
+    caller already has it.
+    """
+    if version is None:
+        version, _ = await versions.aget_version("quiz")
+    payload = await cache.aget(QUESTION_PAYLOAD_KEY.format(version=version))
+    if payload is None:
+        payload = await sync_to_async(get_question_payload)()
+    return payload
+
+
+# -------------------------
+# Signals
+# -------------------------
+
+@receiver(post_save, sender=QuizQuestion)
+@receiver(post_save, sender=Option)
+@receiver(post_delete, sender=QuizQuestion)
+@receiver(post_delete, sender=Option)
+def invalidate_quiz_caches(sender, **kwargs):
+    # After the commit, like the version itself (core.versions): a rebuild
+    # before it would reload the rows that are about to change and keep them
+    transaction.on_commit(option_table.invalidate)
+
+
+@receiver(bulk_saved)
+def invalidate_quiz_caches_bulk(sender, **kwargs):
+    if sender in (QuizQuestion, Option):
+        invalidate_quiz_caches(sender)
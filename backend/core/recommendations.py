@@ -0,0 +1,174 @@
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Career, QuizResult, UserProfile, CareerRecommendation, StaleRecommendation
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "RECOMMENDATION_WORKERS", 1), thread_name_prefix="recommendations"
+)
+
+# Which career domains each quiz category points towards
+CATEGORY_DOMAINS = {
+    "Tech": {"technology", "data-analytics"},
+    "Creative": {"design"},
+    "Analytical": {"data-analytics"},
+    "Leadership": {"management"},
+}
+
+QUIZ_WEIGHT = 0.5
+SKILLS_WEIGHT = 0.35
+INTERESTS_WEIGHT = 0.15
+
+# How many careers are stored per user; top picks are the first few of these
+STORED_RECOMMENDATIONS = 20
+TOP_PICKS = 3
+
+
+# -------------------------
+# Scoring
+# -------------------------
+
+def _normalize(values):
+    return {str(v).strip().casefold() for v in values or [] if str(v).strip()}
+
+
+def build_user_signals(user_id):
+    """Collect everything scoring needs about a user in two queries."""
+    latest = QuizResult.objects.filter(user_id=user_id).order_by("-submitted_at").values_list("scores", flat=True).first()
+    profile = UserProfile.objects.filter(user_id=user_id).values("skills", "interests").first() or {}
+
+    domain_weights = {}
+    quiz_scores = latest if isinstance(latest, dict) else {}
+    total = sum(v for v in quiz_scores.values() if isinstance(v, (int, float))) or 0
+    if total:
+        for category, value in quiz_scores.items():
+            for domain in CATEGORY_DOMAINS.get(category, ()):
+                domain_weights[domain] = domain_weights.get(domain, 0) + value / total
+
+    return {
+        "domain_weights": domain_weights,
+        "skills": _normalize(profile.get("skills")),
+        "interests": _normalize(profile.get("interests")),
+    }
+
+
+def score_career(signals, domain, title, required_skills):
+    quiz = min(signals["domain_weights"].get(domain.casefold(), 0), 1)
+
+    required = _normalize(required_skills)
+    skills = len(required & signals["skills"]) / len(required) if required else 0
+
+    haystack = f"{domain} {title}".casefold()
+    interests = 1 if any(interest in haystack for interest in signals["interests"]) else 0
+
+    return QUIZ_WEIGHT * quiz + SKILLS_WEIGHT * skills + INTERESTS_WEIGHT * interests
+
+
+def rank_careers(user_id, limit=STORED_RECOMMENDATIONS):
+    """Return [(score, career_id), ...] best first, streaming the catalog once."""
+    signals = build_user_signals(user_id)
+    if not (signals["domain_weights"] or signals["skills"] or signals["interests"]):
+        return []
+
+    rows = Career.objects.values_list("career_id", "domain", "title", "required_skills").iterator(chunk_size=2000)
+    scored = (
+        (score_career(signals, domain, title, skills), career_id)
+        for career_id, domain, title, skills in rows
+    )
+    return [(s, cid) for s, cid in heapq.nlargest(limit, scored) if s > 0]
+
+
+# -------------------------
+# Materialization
+# -------------------------
+#
+# Scoring streams the whole catalog, so neither saves nor reads run it in
+# the request. A save marks the user stale (one upsert in its own
+# transaction) and, once committed, queues the refresh on a small thread
+# pool; reads only fetch the stored rows. The mark stays until a refresh
+# has covered it, so work lost with a restarted process is picked up by
+# `refresh_recommendations --stale`.
+
+def refresh_recommendations(user_id):
+    started = timezone.now()
+    ranked = rank_careers(user_id)
+    with transaction.atomic():
+        CareerRecommendation.objects.filter(user_id=user_id).delete()
+        CareerRecommendation.objects.bulk_create([
+            CareerRecommendation(user_id=user_id, career_id=career_id, rank=rank, score=score)
+            for rank, (score, career_id) in enumerate(ranked, start=1)
+        ])
+        # A change saved while scoring keeps its mark
+        StaleRecommendation.objects.filter(user_id=user_id, marked_at__lte=started).delete()
+    return len(ranked)
+
+
+def _run_refresh(user_id):
+    try:
+        refresh_recommendations(user_id)
+    except Exception:
+        logger.exception("Refreshing recommendations for user %s failed", user_id)
+    finally:
+        connections.close_all()
+
+
+def _refresh_later(user_id):
+    _executor.submit(_run_refresh, user_id)
+
+
+def mark_stale(user_id):
+    StaleRecommendation.objects.bulk_create(
+        [StaleRecommendation(user_id=user_id, marked_at=timezone.now())],
+        update_conflicts=True, unique_fields=["user"], update_fields=["marked_at"],
+    )
+    transaction.on_commit(lambda: _refresh_later(user_id))
+
+
+def refresh_stale():
+    """Recompute the recommendations of every stale user; returns how many."""
+    user_ids = list(StaleRecommendation.objects.order_by("marked_at").values_list("user_id", flat=True))
+    for user_id in user_ids:
+        refresh_recommendations(user_id)
+    return len(user_ids)
+
+
+def get_recommendations(user, limit=STORED_RECOMMENDATIONS):
+    """
+    Stored recommendations with their careers, one indexed query. Only a
+    user with nothing stored yet (e.g. before the first refresh has run) is
+    scored live, without storing the result.
+    """
+    stored = list(
+        CareerRecommendation.objects.filter(user=user).select_related("career")[:limit]
+    )
+    if stored:
+        return stored
+    ranked = rank_careers(user.pk, limit)
+    careers = Career.objects.in_bulk([career_id for _, career_id in ranked])
+    return [
+        CareerRecommendation(user=user, career=careers[career_id], rank=rank, score=score)
+        for rank, (score, career_id) in enumerate(ranked, start=1)
+        if career_id in careers
+    ]
+
+
+@receiver(post_save, sender=QuizResult)
+def mark_stale_after_quiz(sender, instance, raw=False, **kwargs):
+    if not raw:
+        mark_stale(instance.user_id)
+
+
+@receiver(post_save, sender=UserProfile)
+def mark_stale_after_profile(sender, instance, created, raw=False, **kwargs):
+    # A brand-new empty profile has nothing to score against
+    if not raw and not created:
+        mark_stale(instance.user_id)
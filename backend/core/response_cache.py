@@ -0,0 +1,100 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+from . import metrics, versions
+
+
+class ResponseCache:
+    """
+    Rendered response bodies for anonymous catalog GETs, kept in a Django
+    cache alias (locmem or file-based both work). Keys embed the scope's
+    version token from core.versions, so a save or delete of the underlying
+    models orphans exactly that scope's entries and leaves the rest alone;
+    the backend's own eviction reclaims them.
+
+    Hit/miss counters live in the same backend, so workers sharing a file
+    cache also share their statistics.
+    """
+
+    STATS = ("hits", "misses", "oversized")
+
+    def __init__(self, alias, max_bytes):
+        self.alias = alias
+        self.max_bytes = max_bytes
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def make_key(self, scope, *parts):
+        token, _ = versions.get_version(scope)
+        return self.key_for(scope, token, *parts)
+
+    def key_for(self, scope, token, *parts):
+        digest = hashlib.md5("\n".join(map(str, parts)).encode(), usedforsecurity=False)
+        return f"response:{scope}:{token}:{digest.hexdigest()}"
+
+    def get(self, key):
+        """Return (content, content_type) or None, counting the hit or miss."""
+        entry = self.cache.get(key)
+        self._count("hits" if entry is not None else "misses")
+        metrics.cache_lookup("responses", entry is not None)
+        return entry
+
+    def set(self, key, content, content_type):
+        if len(content) > self.max_bytes:
+            self._count("oversized")
+            return False
+        self.cache.set(key, (content, content_type))
+        return True
+
+    # get()/set() for async views, through the cache's async API so a
+    # network backend never blocks the event loop
+
+    async def aget(self, key):
+        entry = await self.cache.aget(key)
+        await self._acount("hits" if entry is not None else "misses")
+        metrics.cache_lookup("responses", entry is not None)
+        return entry
+
+    async def aset(self, key, content, content_type):
+        if len(content) > self.max_bytes:
+            await self._acount("oversized")
+            return False
+        await self.cache.aset(key, (content, content_type))
+        return True
+
+    def _count(self, name):
+        key = f"response:stats:{name}"
+        if not self.cache.add(key, 1, timeout=None):
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                pass  # evicted between add() and incr()
+
+    async def _acount(self, name):
+        key = f"response:stats:{name}"
+        if not await self.cache.aadd(key, 1, timeout=None):
+            try:
+                await self.cache.aincr(key)
+            except ValueError:
+                pass
+
+    def stats(self):
+        keys = {f"response:stats:{name}": name for name in self.STATS}
+        values = {keys[k]: v for k, v in self.cache.get_many(list(keys)).items()}
+        stats = {name: values.get(name, 0) for name in self.STATS}
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else None
+        return stats
+
+    def reset_stats(self):
+        self.cache.delete_many([f"response:stats:{name}" for name in self.STATS])
+
+
+response_cache = ResponseCache(
+    getattr(settings, "RESPONSE_CACHE_ALIAS", "default"),
+    max_bytes=getattr(settings, "RESPONSE_CACHE_MAX_BYTES", 512 * 1024),
+)
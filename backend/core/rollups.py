@@ -0,0 +1,183 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, F, Sum, Value
+from django.db.models.functions import Greatest, TruncDate
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import User, Career, Resource, Multimedia, QuizResult, Bookmark, DailyRollup, RollupTotal
+
+
+BOOKMARK_TARGETS = {
+    "career": Career,
+    "resource": Resource,
+    "multimedia": Multimedia,
+}
+
+
+# -------------------------
+# Incremental Updates
+# -------------------------
+
+def bump(metric, day, key, amount=1):
+    """
+    Add `amount` to the key's row for `day` and to its all-time total,
+    creating them on first use.
+    """
+    key = str(key)
+    _add(DailyRollup, {"metric": metric, "day": day, "key": key}, amount)
+    _add(
+        RollupTotal, {"metric": metric, "key": key}, amount,
+        updates={"last_day": Greatest("last_day", Value(day, output_field=DateField()))},
+        defaults={"last_day": day},
+    )
+
+
+def _add(model, lookup, amount, updates=None, defaults=None):
+    rows = model.objects.filter(**lookup)
+    updates = {"count": F("count") + amount, **(updates or {})}
+    if rows.update(**updates) or amount < 0:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **(defaults or {}), count=amount)
+    except IntegrityError:
+        # Another request created the row first
+        rows.update(**updates)
+
+
+def _day(dt):
+    return timezone.localdate(dt)
+
+
+@receiver(post_save, sender=User)
+def rollup_new_user(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        bump("active_user", _day(instance.created_at), instance.pk)
+
+
+@receiver(post_save, sender=QuizResult)
+def rollup_quiz_result(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        day = _day(instance.submitted_at)
+        bump("quiz_attempt", day, instance.best_category)
+        bump("active_user", day, instance.user_id)
+
+
+@receiver(post_delete, sender=QuizResult)
+def unroll_quiz_result(sender, instance, **kwargs):
+    bump("quiz_attempt", _day(instance.submitted_at), instance.best_category, -1)
+
+
+def _bookmark_targets(bookmark):
+    for kind in BOOKMARK_TARGETS:
+        target_id = getattr(bookmark, f"{kind}_id")
+        if target_id is not None:
+            yield f"bookmark_{kind}", target_id
+
+
+@receiver(post_save, sender=Bookmark)
+def rollup_bookmark(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        for metric, target_id in _bookmark_targets(instance):
+            bump(metric, _day(instance.created_at), target_id)
+
+
+@receiver(post_delete, sender=Bookmark)
+def unroll_bookmark(sender, instance, **kwargs):
+    for metric, target_id in _bookmark_targets(instance):
+        bump(metric, _day(instance.created_at), target_id, -1)
+
+
+# -------------------------
+# Dashboard Reads
+# -------------------------
+
+# Totals and top lists read RollupTotal, one row per key; DailyRollup
+# keeps the per-day history for charts and backfills.
+
+def active_users_count(days=30):
+    since = timezone.localdate() - timedelta(days=days)
+    return RollupTotal.objects.filter(metric="active_user", last_day__gte=since).count()
+
+
+def total(metric):
+    return RollupTotal.objects.filter(metric=metric).aggregate(total=Sum("count"))["total"] or 0
+
+
+def top_keys(metric, limit=5):
+    """Return [(key, count), ...] for the highest all-time totals of a metric."""
+    rows = (
+        RollupTotal.objects.filter(metric=metric, count__gt=0)
+        .order_by("-count")
+        .values_list("key", "count")[:limit]
+    )
+    return list(rows)
+
+
+def popular_bookmarks(kind, limit=5):
+    """Top bookmarked objects of one kind, shaped like `{"<kind>__title": ..., "count": ...}`."""
+    top = top_keys(f"bookmark_{kind}", limit)
+    titles = BOOKMARK_TARGETS[kind].objects.in_bulk([int(key) for key, _ in top])
+    return [
+        {f"{kind}__title": str(titles[int(key)]), "count": count}
+        for key, count in top
+        if int(key) in titles
+    ]
+
+
+# -------------------------
+# Backfill
+# -------------------------
+
+def backfill(batch_size=1000):
+    """Rebuild every rollup row, daily and all-time, from the event tables."""
+    counts = Counter()
+
+    for row in (
+        QuizResult.objects.annotate(day=TruncDate("submitted_at"))
+        .values("day", "best_category").annotate(n=Count("pk"))
+    ):
+        counts["quiz_attempt", row["day"], row["best_category"]] += row["n"]
+
+    for row in (
+        QuizResult.objects.annotate(day=TruncDate("submitted_at"))
+        .values("day", "user_id").annotate(n=Count("pk"))
+    ):
+        counts["active_user", row["day"], str(row["user_id"])] += row["n"]
+
+    for row in User.objects.annotate(day=TruncDate("created_at")).values("day", "pk"):
+        counts["active_user", row["day"], str(row["pk"])] += 1
+
+    for kind in BOOKMARK_TARGETS:
+        field = f"{kind}_id"
+        for row in (
+            Bookmark.objects.filter(**{f"{field}__isnull": False})
+            .annotate(day=TruncDate("created_at"))
+            .values("day", field).annotate(n=Count("pk"))
+        ):
+            counts[f"bookmark_{kind}", row["day"], str(row[field])] += row["n"]
+
+    totals = {}
+    for (metric, day, key), n in counts.items():
+        count, last_day = totals.get((metric, key), (0, day))
+        totals[metric, key] = (count + n, max(last_day, day))
+
+    with transaction.atomic():
+        DailyRollup.objects.all().delete()
+        DailyRollup.objects.bulk_create(
+            (DailyRollup(metric=metric, day=day, key=key, count=n) for (metric, day, key), n in counts.items()),
+            batch_size=batch_size,
+        )
+        RollupTotal.objects.all().delete()
+        RollupTotal.objects.bulk_create(
+            (
+                RollupTotal(metric=metric, key=key, count=count, last_day=last_day)
+                for (metric, key), (count, last_day) in totals.items()
+            ),
+            batch_size=batch_size,
+        )
+    return len(counts)
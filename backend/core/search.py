@@ -0,0 +1,221 @@
+import re
+
+from django.db import connection, connections, router, transaction
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils.html import escape
+
+from .models import Career, Resource, Multimedia
+from .signals import bulk_saved
+
+
+# -------------------------
+# Full-text Search Index
+# -------------------------
+#
+# One SQLite FTS5 table holds careers, resources and multimedia side by side.
+# The rowid encodes both the object type and its primary key
+# (pk * TYPE_COUNT + type code), so an upsert or delete touches a
+# single row by rowid instead of scanning the index for a matching column.
+
+SEARCH_TABLE = "core_search_index"
+
+INDEXED_TYPES = {
+    "career": 0,
+    "resource": 1,
+    "multimedia": 2,
+}
+TYPE_BY_CODE = {code: name for name, code in INDEXED_TYPES.items()}
+TYPE_COUNT = 4  # leave room for one more indexed type without a reindex
+
+MAX_RESULTS = 50
+
+# snippet() wraps matches in these private-use characters rather than in
+# <mark> tags, so the indexed text can be HTML-escaped before the tags go in
+MARK_START = "\ue000"
+MARK_END = "\ue001"
+
+
+def _join(values):
+    return " ".join(str(v) for v in values or [])
+
+
+def career_document(career):
+    body = " ".join([
+        career.description, career.company, career.domain,
+        _join(career.required_skills),
+    ])
+    return career.title, body
+
+
+def resource_document(resource):
+    return resource.title, " ".join([resource.description, _join(resource.tags)])
+
+
+def multimedia_document(multimedia):
+    return multimedia.title, " ".join([multimedia.transcript, _join(multimedia.tags)])
+
+
+DOCUMENT_BUILDERS = {
+    Career: ("career", career_document),
+    Resource: ("resource", resource_document),
+    Multimedia: ("multimedia", multimedia_document),
+}
+
+
+def _rowid(kind, pk):
+    return pk * TYPE_COUNT + INDEXED_TYPES[kind]
+
+
+def index_instance(instance):
+    kind, build = DOCUMENT_BUILDERS[type(instance)]
+    title, body = build(instance)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, body) VALUES (%s, %s, %s)",
+            [_rowid(kind, instance.pk), title, body],
+        )
+
+
+def index_instances(instances):
+    rows = []
+    for instance in instances:
+        kind, build = DOCUMENT_BUILDERS[type(instance)]
+        rows.append((_rowid(kind, instance.pk), *build(instance)))
+    if rows:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, body) VALUES (%s, %s, %s)", rows
+            )
+
+
+def unindex_instance(instance):
+    kind, _ = DOCUMENT_BUILDERS[type(instance)]
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [_rowid(kind, instance.pk)])
+
+
+def rebuild_index(batch_size=1000):
+    """Drop every indexed row and reinsert all catalog rows in bulk."""
+    counts = {}
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        for model, (kind, build) in DOCUMENT_BUILDERS.items():
+            rows = []
+            counts[kind] = 0
+            for instance in model.objects.iterator(chunk_size=batch_size):
+                rows.append((_rowid(kind, instance.pk), *build(instance)))
+                if len(rows) >= batch_size:
+                    _insert_rows(cursor, rows)
+                    counts[kind] += len(rows)
+                    rows = []
+            if rows:
+                _insert_rows(cursor, rows)
+                counts[kind] += len(rows)
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+    return counts
+
+
+def _insert_rows(cursor, rows):
+    cursor.executemany(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, body) VALUES (%s, %s, %s)", rows
+    )
+
+
+def build_match_expression(query):
+    """
+    Turn free user input into a safe FTS5 expression: every word becomes a
+    quoted prefix term, so operators and stray quotes cannot break the query.
+    """
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search(query, types=None, limit=20):
+    """
+    Return ranked hits across all indexed types as dicts with
+    `type`, `id`, `title`, `snippet` and `score` (higher is better).
+    """
+    match = build_match_expression(query)
+    if not match:
+        return []
+
+    sql = (
+        f"SELECT rowid, title, "
+        f"snippet({SEARCH_TABLE}, -1, '{MARK_START}', '{MARK_END}', '…', 16), "
+        f"bm25({SEARCH_TABLE}, 10.0, 1.0) AS rank "
+        f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s"
+    )
+    params = [match]
+    codes = [INDEXED_TYPES[t] for t in types or [] if t in INDEXED_TYPES]
+    if codes:
+        sql += f" AND rowid %% {TYPE_COUNT} IN ({', '.join(str(c) for c in codes)})"
+    sql += " ORDER BY rank LIMIT %s"
+    params.append(min(limit, MAX_RESULTS))
+
+    with connections[router.db_for_read(Career)].cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return [
+        {
+            "type": TYPE_BY_CODE[rowid % TYPE_COUNT],
+            "id": rowid // TYPE_COUNT,
+            "title": title,
+            "snippet": render_snippet(snippet),
+            # bm25() is negative with better matches lower; flip it for clients
+            "score": round(-rank, 6),
+        }
+        for rowid, title, snippet, rank in rows
+    ]
+
+
+def filter_matching(queryset, query):
+    """
+    Narrow a Career, Resource or Multimedia queryset to the rows whose
+    indexed text matches `query` (the same prefix terms as search()),
+    looked up in the index instead of a LIKE scan. Ordering, further
+    filters and pagination stay the caller's.
+    """
+    kind, _ = DOCUMENT_BUILDERS[queryset.model]
+    match = build_match_expression(query)
+    if not match:
+        return queryset.none()
+    return queryset.filter(pk__in=RawSQL(
+        f"SELECT rowid / {TYPE_COUNT} FROM {SEARCH_TABLE} "
+        f"WHERE {SEARCH_TABLE} MATCH %s AND rowid %% {TYPE_COUNT} = %s",
+        [match, INDEXED_TYPES[kind]],
+    ))
+
+
+def render_snippet(snippet):
+    """HTML for a snippet: the indexed text escaped, matches in <mark>."""
+    # Stray markers in the text itself only ever produce an unbalanced <mark>
+    return escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+# -------------------------
+# Signals
+# -------------------------
+
+@receiver(post_save, sender=Career)
+@receiver(post_save, sender=Resource)
+@receiver(post_save, sender=Multimedia)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_instance(instance)
+
+
+@receiver(post_delete, sender=Career)
+@receiver(post_delete, sender=Resource)
+@receiver(post_delete, sender=Multimedia)
+def remove_from_search_index(sender, instance, **kwargs):
+    unindex_instance(instance)
+
+
+@receiver(bulk_saved)
+def update_search_index_bulk(sender, instances, **kwargs):
+    if sender in DOCUMENT_BUILDERS:
+        index_instances(instances)
@@ -1,10 +1,177 @@
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from .models import (
     User, Career, Resource, SuccessStory, UserProfile,
     Multimedia, QuizQuestion, Feedback, Bookmark, QuizResult, Option
 )
 
 
+# -------------------------
+# Sparse Fieldsets
+# -------------------------
+
+def _split_names(value):
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def requested_fieldset(context, list_exclude=()):
+    """
+    Work out which fields a read should return. Gives (fields, omit):
+    `fields` is the ?fields= whitelist or None, `omit` the names to drop
+    (?omit=, or `list_exclude` for list actions that asked for neither).
+    Writes always use the full serializer.
+    """
+    request = context.get("request")
+    if request is None or request.method not in ("GET", "HEAD"):
+        return None, set()
+    fields = _split_names(request.query_params.get("fields"))
+    omit = _split_names(request.query_params.get("omit"))
+    if fields is None and omit is None:
+        if getattr(context.get("view"), "action", None) == "list":
+            return None, set(list_exclude)
+        return None, set()
+    return fields, omit or set()
+
+
+class SparseFieldsetMixin:
+    """
+    Honour ?fields=a,b and ?omit=a,b. Meta.list_exclude names long text
+    fields that list actions leave out unless the client asks otherwise.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields, omit = requested_fieldset(self.context, getattr(self.Meta, "list_exclude", ()))
+        for name in list(self.fields):
+            if name in omit or (fields is not None and name not in fields):
+                self.fields.pop(name)
+
+
+# -------------------------
+# Fast Read Path
+# -------------------------
+
+# Fields whose to_representation() returns what .values() already holds
+_PASS_THROUGH = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField,
+    serializers.ChoiceField, serializers.ReadOnlyField,
+)
+
+# Fields that need a model instance or related objects to render
+_UNSUPPORTED = (
+    serializers.BaseSerializer, serializers.SerializerMethodField,
+    serializers.HiddenField, serializers.ManyRelatedField,
+)
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != "iso-8601" or tz is None:
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+    return convert
+
+
+def _file_converter(field, model_field, request):
+    storage = model_field.storage
+    use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+
+    def convert(name):
+        if not name:
+            return None
+        if not use_url:
+            return name
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+    return convert
+
+
+def _compile_converter(field, model_field, request):
+    """Return a value -> representation callable, or None if unsupported."""
+    if isinstance(field, _UNSUPPORTED):
+        return None
+    if isinstance(field, serializers.FileField):
+        return _file_converter(field, model_field, request)
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return (lambda value: value) if field.pk_field is None else None
+    if isinstance(field, serializers.RelatedField):
+        return None
+    if isinstance(field, serializers.JSONField):
+        return (lambda value: value) if not field.binary else field.to_representation
+    if isinstance(field, _PASS_THROUGH):
+        return lambda value: value
+    return field.to_representation
+
+
+class ValuesRowRenderer:
+    """
+    Renders `.values()` rows exactly as `serializer` renders instances of
+    its model, with one converter per field compiled up front. Build it
+    from an already constructed serializer so sparse fieldsets carry over.
+
+    Use `for_serializer()`, which returns None when any field (or a custom
+    `to_representation()` without a `finalize_representation()` hook)
+    cannot be reproduced from plain column values.
+    """
+
+    def __init__(self, serializer, columns):
+        self.columns = columns
+        self.finalize = getattr(serializer, "finalize_representation", None)
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        serializer_class = type(serializer)
+        custom = serializer_class.to_representation is not serializers.Serializer.to_representation
+        if custom and not hasattr(serializer, "finalize_representation"):
+            return None
+
+        model = serializer.Meta.model
+        request = serializer.context.get("request")
+        concrete = {f.name: f for f in model._meta.concrete_fields}
+        columns = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            model_field = concrete.get(field.source)
+            if model_field is None:
+                return None
+            converter = _compile_converter(field, model_field, request)
+            if converter is None:
+                return None
+            columns.append((name, field.source, converter))
+        return cls(serializer, columns)
+
+    @property
+    def sources(self):
+        return ["pk", *dict.fromkeys(source for _, source, _ in self.columns)]
+
+    def render(self, rows):
+        columns = self.columns
+        finalize = self.finalize
+        data = []
+        for row in rows:
+            item = {}
+            for name, source, convert in columns:
+                value = row[source]
+                item[name] = None if value is None else convert(value)
+            if finalize is not None:
+                item = finalize(item, row["pk"])
+            data.append(item)
+        return data
+
+
 # Option Serializer
 class OptionSerializer(serializers.ModelSerializer):
     class Meta:
@@ -26,7 +193,13 @@ class QuizResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = QuizResult
         fields = ['result_id', 'user', 'scores', 'best_category', 'submitted_at']
-        read_only_fields = ['user', 'result_id', 'submitted_at']
+        # Scores come from quiz.score_answers() only (QuizResultViewSet.submit)
+        read_only_fields = fields
+
+
+# Quiz Submission Serializer (scored server-side)
+class QuizSubmissionSerializer(serializers.Serializer):
+    options = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
 
 
 # User Serializer
@@ -49,7 +222,7 @@ class UserSerializer(serializers.ModelSerializer):
 # UserProfile Serializer
 from rest_framework import serializers
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     education = serializers.JSONField(required=False, default=list)
     work_experience = serializers.JSONField(required=False, default=list)
     skills = serializers.ListField(child=serializers.CharField(), required=False, default=list)
@@ -61,22 +234,27 @@ class UserProfileSerializer(serializers.ModelSerializer):
         model = UserProfile
         fields = "__all__" 
         read_only_fields = [UserProfile._meta.pk.name, "user"]
+        list_exclude = ["bio", "education", "work_experience"]
 
     def get_id(self, obj):
         return getattr(obj, obj._meta.pk.name)
 
 
 # Career Serializer
-class CareerSerializer(serializers.ModelSerializer):
+class CareerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Career
         fields = "__all__"
+        list_exclude = ["description", "education_path"]
 
 
 # Resource Serializer
-class ResourceSerializer(serializers.ModelSerializer):
+class ResourceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Resource
+        # download_count is the stored total: the counter's buffered clicks
+        # are per process, and list bodies are cached and ETag'd per
+        # catalog version, so they would only disagree between workers
         fields = "__all__"
 
 
@@ -89,10 +267,11 @@ class SuccessStorySerializer(serializers.ModelSerializer):
 
 
 # Multimedia Serializer
-class MultimediaSerializer(serializers.ModelSerializer):
+class MultimediaSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Multimedia
         fields = "__all__"
+        list_exclude = ["transcript"]
 
 
 # Feedback Serializer
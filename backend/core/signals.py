@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+
+# Sent after bulk_create/bulk_update writes that bypass post_save, so derived
+# data (search index, caches, ...) can catch up in one go.
+# Arguments: sender=<model class>, instances=<list of saved objects>
+bulk_saved = Signal()
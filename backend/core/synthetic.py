@@ -0,0 +1,187 @@
+import json
+import random
+import uuid
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.db import connections, router
+from django.utils import timezone
+
+from . import trending, versions
+from .rollups import backfill
+from .search import rebuild_index
+from .models import (
+    User, UserProfile, Career, Resource, Multimedia, SuccessStory, QuizResult, Feedback, Bookmark,
+)
+
+
+# -------------------------
+# Synthetic Data
+# -------------------------
+#
+# Fills the database with realistic-looking rows in bulk for benchmarks and
+# query-plan audits. Small tables go through chunked bulk_create; the
+# high-volume ones (quiz results, bookmarks, feedback) through a plain
+# executemany INSERT, since building a model instance per row would cost
+# more than the insert itself. Either way no per-row signals fire;
+# `refresh_derived()` rebuilds what those signals would have maintained.
+
+DEFAULT_VOLUMES = {
+    "users": 1000,
+    "careers": 500,
+    "resources": 200,
+    "multimedia": 100,
+    "stories": 200,
+    "quiz_results": 5000,
+    "bookmarks": 20000,
+    "feedback": 2000,
+}
+
+# Every generated user can log in with this password
+PASSWORD = "synthetic-pass"
+
+DOMAINS = ["technology", "design", "data-analytics", "healthcare", "finance", "education", "marketing"]
+EXPERIENCE = ["entry", "mid", "senior"]
+SALARY_RANGES = ["30-50k", "50-80k", "80-120k", "120k+"]
+SKILLS = ["Python", "SQL", "Figma", "Excel", "Communication", "Leadership", "React", "Statistics", "Writing"]
+CATEGORIES = ["technical", "creative", "analytical", "social", "business"]
+WORDS = (
+    "career growth skills team project data design learn build manage analyse plan "
+    "support research develop create lead client product market system"
+).split()
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _bulk_create(model, objects, batch_size):
+    """bulk_create `objects` (any iterable) in chunks; returns the new pks."""
+    objects = iter(objects)
+    pks = []
+    while chunk := list(islice(objects, batch_size)):
+        pks += [obj.pk for obj in model.objects.bulk_create(chunk)]
+    return pks
+
+
+def _insert_rows(model, fields, rows, batch_size):
+    """executemany an INSERT of `rows` (tuples of db-ready values for `fields`)."""
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(model._meta.get_field(name).column) for name in fields)
+    sql = (
+        f"INSERT INTO {quote(model._meta.db_table)} ({columns}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))})"
+    )
+    rows = iter(rows)
+    count = 0
+    with connection.cursor() as cursor:
+        while chunk := list(islice(rows, batch_size)):
+            cursor.executemany(sql, chunk)
+            count += len(chunk)
+    return count
+
+
+def generate(volumes, batch_size=5000, seed=0, log=None):
+    """
+    Insert `volumes` (keys as in DEFAULT_VOLUMES; missing keys mean zero)
+    synthetic rows and return {key: rows created}. Bookmarks and quiz
+    results belong to the users created here; each user gets a profile.
+    """
+    users, careers = volumes.get("users", 0), volumes.get("careers", 0)
+    stories, results, bookmarks, feedback = (
+        volumes.get(key, 0) for key in ("stories", "quiz_results", "bookmarks", "feedback")
+    )
+    if (stories or results or bookmarks) and not users:
+        raise ValueError("stories, quiz results and bookmarks need at least one generated user")
+    if bookmarks > users * careers:
+        raise ValueError(
+            f"{bookmarks} bookmarks need users x careers >= {bookmarks} (one bookmark per user and career)"
+        )
+
+    rng = random.Random(seed)
+    tag = uuid.uuid4().hex[:8]
+    log = log or (lambda message: None)
+    counts = {}
+
+    password = make_password(PASSWORD)
+    user_pks = _bulk_create(User, (
+        User(email=f"synthetic-{tag}-{i}@example.com", uname=f"synthetic{i}", password=password,
+             role=rng.choice(["student", "graduate", "professional"]))
+        for i in range(users)
+    ), batch_size)
+    _bulk_create(UserProfile, (
+        UserProfile(user_id=pk, education_level="Bachelor's", bio=_text(rng, 20),
+                    interests=rng.sample(DOMAINS, 2), skills=rng.sample(SKILLS, 3))
+        for pk in user_pks
+    ), batch_size)
+    counts["users"] = len(user_pks)
+    log(f"users: {len(user_pks)} (with profiles)")
+
+    career_pks = _bulk_create(Career, (
+        Career(title=f"{_text(rng, 2)} Specialist {i}", description=_text(rng, 60),
+               domain=rng.choice(DOMAINS), required_skills=rng.sample(SKILLS, 3),
+               education_path=_text(rng, 15), expected_salary="$70k", company=f"Company {i % 97}",
+               demand=rng.choice(["High", "Very High", "Medium"]), growth=f"+{rng.randint(1, 30)}%",
+               experience=rng.choice(EXPERIENCE), salary_range=rng.choice(SALARY_RANGES))
+        for i in range(careers)
+    ), batch_size)
+    counts["careers"] = len(career_pks)
+    log(f"careers: {len(career_pks)}")
+
+    counts["resources"] = len(_bulk_create(Resource, (
+        Resource(title=f"{_text(rng, 3)} Guide {i}", description=_text(rng, 25),
+                 category=rng.choice(["PDF", "Checklist", "Infographic"]),
+                 file_url=f"https://example.com/resources/{i}.pdf", tags=rng.sample(SKILLS, 2),
+                 download_count=rng.randint(0, 5000))
+        for i in range(volumes.get("resources", 0))
+    ), batch_size))
+    counts["multimedia"] = len(_bulk_create(Multimedia, (
+        Multimedia(title=f"{_text(rng, 3)} Talk {i}", type=rng.choice(["Video", "Podcast", "Explainer"]),
+                   url=f"https://example.com/media/{i}", transcript=_text(rng, 200))
+        for i in range(volumes.get("multimedia", 0))
+    ), batch_size))
+    log(f"resources: {counts['resources']}, multimedia: {counts['multimedia']}")
+
+    counts["stories"] = len(_bulk_create(SuccessStory, (
+        SuccessStory(user_id=rng.choice(user_pks), name=f"Synthetic {i}", domain=rng.choice(DOMAINS),
+                     education=_text(rng, 10), challenge=_text(rng, 30), outcome=_text(rng, 30),
+                     is_approved=rng.random() < 0.8)
+        for i in range(stories)
+    ), batch_size))
+
+    now = connections[router.db_for_write(QuizResult)].ops.adapt_datetimefield_value(timezone.now())
+    counts["quiz_results"] = _insert_rows(QuizResult, ("user", "scores", "best_category", "submitted_at"), (
+        (rng.choice(user_pks), json.dumps({c: rng.randint(0, 10) for c in CATEGORIES}),
+         rng.choice(CATEGORIES), now)
+        for _ in range(results)
+    ), batch_size)
+    log(f"stories: {counts['stories']}, quiz results: {counts['quiz_results']}")
+
+    # Bookmark i is user i % U and career (i // U + offset[user]) % C, which
+    # never repeats a (user, career) pair for i < U * C
+    offsets = [rng.randrange(len(career_pks) or 1) for _ in user_pks]
+    counts["bookmarks"] = _insert_rows(Bookmark, ("user", "career", "note", "created_at"), (
+        (user_pks[i % len(user_pks)],
+         career_pks[(i // len(user_pks) + offsets[i % len(user_pks)]) % len(career_pks)],
+         _text(rng, 6) if i % 5 == 0 else "", now)
+        for i in range(bookmarks)
+    ), batch_size)
+    log(f"bookmarks: {counts['bookmarks']}")
+
+    counts["feedback"] = _insert_rows(Feedback, ("user", "category", "message", "submitted_at"), (
+        (rng.choice(user_pks) if user_pks else None, rng.choice(["bug", "suggestion", "query"]),
+         _text(rng, 25), now)
+        for _ in range(feedback)
+    ), batch_size)
+    log(f"feedback: {counts['feedback']}")
+    return counts
+
+
+def refresh_derived():
+    """Rebuild what signals and workers maintain: search index, rollups, trending, catalog versions."""
+    rebuild_index()
+    backfill()
+    trending.refresh()
+    for scope in versions.SCOPES:
+        versions.bump_version(scope)
@@ -1,3 +1,1098 @@
-from django.test import TestCase
+import asyncio
+import importlib
+import json
+import os
+import tempfile
+from datetime import timedelta
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.files.base import ContentFile
+from django.core.mail.backends.locmem import EmailBackend as LocmemBackend
+from django.core.management import call_command
+from django.apps import apps as django_apps
+from django.contrib import admin
+from django.db import connection
+from django.test import AsyncClient, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+
+from .catalog import load_catalog
+from .benchmark import api_endpoints, auth_headers, bench_client
+from .authentication import user_cache
+from .counters import download_counter
+from .instrumentation import RequestTiming
+from .metrics import MetricsRegistry, registry
+from . import exports, imports, outbox, recommendations, rollups, search, trending
+from . import urls as core_urls
+from .quiz import InvalidAnswers, get_question_payload, get_quiz_version, option_table, score_answers
+from .models import (
+    User, UserProfile, Career, Resource, Multimedia, QuizQuestion, Option, QuizResult, Feedback, Bookmark,
+    OutboxEmail, SuccessStory, BookmarkExport, DailyRollup, RollupTotal, CareerRecommendation, StaleRecommendation,
+)
+from .signals import bulk_saved
+from .serializers import QuizQuestionSerializer, ValuesRowRenderer
+from .synthetic import generate
+from .urls import router
+from .versions import get_version
+from .views import CareerViewSet, ResourceViewSet, dashboard_view
+
+
+class FastListConformanceTests(TestCase):
+    """
+    The values()-based list path must produce byte-identical JSON to the
+    ModelSerializer path for every shape the list endpoints can return.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin@example.com", password="x")
+        Career.objects.create(
+            title="Data Analyst", description="Numbers", domain="data-analytics",
+            required_skills=["SQL", "Python"], education_path="BSc", expected_salary="$70k",
+            company="Acme", demand="High", growth="+10%", experience="1-3 years", salary_range="50k-100k",
+        )
+        Career.objects.create(
+            title="Désigner ✏️", description="", domain="design",
+            required_skills=[{"name": "Figma", "level": 3}], salary_range="",
+        )
+        for i in range(5):
+            Career.objects.create(title=f"Engineer {i}", description="x" * 300, domain="technology")
+
+        Resource.objects.create(
+            title="Guide", description="PDF guide", file="resources/guide.pdf",
+            tags=["cv", "tips"], created_by=cls.user, download_count=4,
+        )
+        Resource.objects.create(
+            title="Checklist", category="Checklist", file_url="https://example.com/c.pdf",
+            target_audience="Student",
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertSameBytes(self, viewset, url):
+        render = ValuesRowRenderer.render
+        with mock.patch.object(ValuesRowRenderer, "render", autospec=True, side_effect=render) as fast_render:
+            fast = self.client.get(url)
+        self.assertTrue(fast_render.called, "fast path was not taken")
+        with mock.patch.object(viewset, "fast_list", False):
+            reference = self.client.get(url)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(reference.status_code, 200)
+        self.assertEqual(fast.content, reference.content)
+        return fast
+
+    def test_career_list(self):
+        self.assertSameBytes(CareerViewSet, "/api/careers/")
+
+    def test_career_filters_and_search(self):
+        self.assertSameBytes(CareerViewSet, "/api/careers/?domain=technology")
+        self.assertSameBytes(CareerViewSet, "/api/careers/?search=sql")
+
+    def test_career_sparse_fieldsets(self):
+        self.assertSameBytes(CareerViewSet, "/api/careers/?fields=title,required_skills,created_at")
+        self.assertSameBytes(CareerViewSet, "/api/careers/?omit=education_path")
+
+    def test_career_keyset_pages(self):
+        first = self.assertSameBytes(CareerViewSet, "/api/careers/?page_size=3")
+        next_url = first.json()["next"]
+        self.assertIsNotNone(next_url)
+        self.assertSameBytes(CareerViewSet, next_url)
+
+    def test_resource_list_with_files_and_nulls(self):
+        response = self.assertSameBytes(ResourceViewSet, "/api/resources/")
+        urls = {item["title"]: item["file"] for item in response.json()}
+        self.assertEqual(urls["Guide"], "http://testserver/media/resources/guide.pdf")
+        self.assertIsNone(urls["Checklist"])
+
+    def test_resource_download_counts_are_the_stored_totals(self):
+        # This process's buffered clicks would differ per worker under one ETag
+        with mock.patch.object(download_counter, "pending", return_value=3):
+            response = self.assertSameBytes(ResourceViewSet, "/api/resources/")
+        counts = {item["title"]: item["download_count"] for item in response.json()}
+        self.assertEqual(counts["Guide"], 4)
+
+    def test_download_flushes_keep_the_resource_version(self):
+        resource = Resource.objects.get(title="Guide")
+        version = get_version("resources")
+        with self.captureOnCommitCallbacks(execute=True):
+            download_counter.increment(resource.pk, 2)
+            download_counter.flush()
+        self.assertEqual(get_version("resources"), version)
+        resource.refresh_from_db()
+        self.assertEqual(resource.download_count, 6)
+
+    def test_resource_sparse_fieldsets(self):
+        self.assertSameBytes(ResourceViewSet, "/api/resources/?fields=title,download_count,file")
+        self.assertSameBytes(ResourceViewSet, "/api/resources/?omit=description,created_by")
+
+    def test_unsupported_serializer_falls_back(self):
+        request = APIRequestFactory().get("/api/questions/")
+        serializer = QuizQuestionSerializer(context={"request": request})
+        self.assertIsNone(ValuesRowRenderer.for_serializer(serializer))
+
+
+class SyntheticDataTests(TestCase):
+    def test_generate_counts_and_unique_bookmarks(self):
+        counts = generate({"users": 5, "careers": 4, "bookmarks": 20, "quiz_results": 7, "feedback": 3}, batch_size=6)
+        self.assertEqual(counts["bookmarks"], 20)
+        self.assertEqual(Bookmark.objects.count(), 20)
+        self.assertEqual(QuizResult.objects.count(), 7)
+        self.assertEqual(Feedback.objects.count(), 3)
+        self.assertEqual(UserProfile.objects.filter(user__email__startswith="synthetic-").count(), 5)
+        self.assertEqual(Bookmark.objects.values("user", "career").distinct().count(), 20)
+
+    def test_rejects_more_bookmarks_than_pairs(self):
+        with self.assertRaises(ValueError):
+            generate({"users": 2, "careers": 2, "bookmarks": 5})
+        self.assertFalse(User.objects.exists())
+
+
+class BenchmarkSuiteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        generate({"users": 3, "careers": 5, "resources": 2, "bookmarks": 6, "quiz_results": 3})
+        cls.user = User.objects.filter(email__startswith="synthetic-").first()
+
+    def test_endpoints_cover_router_routes(self):
+        paths = dict(api_endpoints(router, self.user))
+        self.assertEqual(paths["careers list"], "/api/careers/")
+        self.assertRegex(paths["careers detail"], r"^/api/careers/\d+/$")
+        self.assertEqual(paths["bookmarks export-pdf"], "/api/bookmarks/export_pdf/")
+
+    def test_bench_client_reports_latency_and_queries(self):
+        stats = bench_client("/api/careers/", auth_headers(self.user), requests=3, warmup=1)
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["status"], [200])
+        self.assertEqual(stats["queries_per_request"], 1)
+        self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+
+
+class MetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(
+            email="metrics-admin@example.com", password="x", is_staff=True,
+        )
+
+    def setUp(self):
+        registry.clear()
+
+    def test_endpoint_is_admin_only(self):
+        self.assertEqual(APIClient().get("/metrics").status_code, 401)
+
+    @override_settings(METRICS_TOKEN="scrape-secret")
+    def test_scrape_token(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION="Bearer scrape-secret")
+        self.assertEqual(client.get("/metrics").status_code, 200)
+        # Only for /metrics
+        self.assertEqual(client.get("/api/import/careers/").status_code, 401)
+        client.credentials(HTTP_AUTHORIZATION="Bearer wrong-secret")
+        self.assertEqual(client.get("/metrics").status_code, 401)
+        # Staff JWTs keep working alongside it
+        self.assertEqual(self.client.get("/metrics", **auth_headers(self.staff)).status_code, 200)
+
+    def test_scrape_token_is_off_when_unset(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION="Bearer ")
+        self.assertEqual(client.get("/metrics").status_code, 401)
+
+    def test_requests_are_counted_per_view(self):
+        client = APIClient()
+        client.get("/api/careers/")
+        client.force_authenticate(self.staff)
+        response = client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        self.assertIn('http_requests_total{method="GET",status="200",view="career-list"} 1', body)
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",view="career-list",le="+Inf"} 1', body)
+        self.assertIn('http_request_db_queries_total{view="career-list"}', body)
+        self.assertIn('cache_lookups_total{cache="responses",result="miss"}', body)
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            metrics.observe("http_request_duration_seconds", {"view": "v"}, value)
+        body = metrics.render()
+        self.assertIn('http_request_duration_seconds_bucket{view="v",le="0.1"} 1', body)
+        self.assertIn('http_request_duration_seconds_bucket{view="v",le="1.0"} 3', body)
+        self.assertIn('http_request_duration_seconds_bucket{view="v",le="+Inf"} 4', body)
+        self.assertIn('http_request_duration_seconds_count{view="v"} 4', body)
+
+    def test_other_processes_are_merged_from_the_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            other = MetricsRegistry(directory=directory)
+            other.inc("cache_lookups_total", {"cache": "users", "result": "hit"}, 3)
+            # Written as another worker's snapshot
+            with open(os.path.join(directory, f"{os.getpid() + 1}.json"), "w") as f:
+                json.dump(other.snapshot(), f)
+
+            metrics = MetricsRegistry(directory=directory)
+            metrics.inc("cache_lookups_total", {"cache": "users", "result": "miss"})
+            metrics.inc("cache_lookups_total", {"cache": "users", "result": "hit"})
+            body = metrics.render()
+        self.assertIn('cache_lookups_total{cache="users",result="hit"} 4', body)
+        self.assertIn('cache_hit_ratio{cache="users"} 0.8', body)
+
+
+class RequestTimingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(email="timing-admin@example.com", password="x", is_staff=True)
+        cls.user = User.objects.create_user(email="timing-user@example.com", password="x")
+        for i in range(3):
+            Career.objects.create(title=f"Career {i}", domain="technology")
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def test_server_timing_is_staff_only(self):
+        self.assertNotIn("Server-Timing", self.client.get("/api/careers/"))
+        self.assertNotIn("Server-Timing", self.client.get("/api/careers/", **auth_headers(self.user)))
+        response = self.client.get("/api/careers/", **auth_headers(self.staff))
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", serialize;dur=')
+
+    @override_settings(DEBUG=True)
+    def test_server_timing_for_everyone_in_debug(self):
+        self.assertIn("Server-Timing", self.client.get("/api/careers/"))
+
+    @override_settings(SLOW_REQUEST_MS=0, SLOW_REQUEST_TOP_QUERIES=1)
+    def test_slow_requests_are_logged_with_their_slowest_queries(self):
+        # The token's user is loaded from the database: two queries
+        user_cache.clear()
+        with self.assertLogs("core.slow_requests", "WARNING") as logs:
+            self.client.get("/api/careers/", **auth_headers(self.staff))
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record["path"], "/api/careers/")
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["queries"], 1)
+        self.assertEqual(len(record["top_queries"]), 1)
+        self.assertTrue(record["top_queries"][0]["sql"].startswith("SELECT"))
+
+    def test_only_the_slowest_queries_are_kept(self):
+        timing = RequestTiming(keep=3)
+        for i, duration in enumerate([0.2, 0.5, 0.1, 0.9, 0.3, 0.05]):
+            timing.add_query(duration, f"q{i}")
+        self.assertEqual(timing.queries, 6)
+        self.assertAlmostEqual(timing.sql, 2.05)
+        self.assertEqual(timing.top_queries(), [(0.9, "q3"), (0.5, "q1"), (0.3, "q4")])
+
+
+class MediaFileTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.episode = Multimedia.objects.create(title="Episode", type="Podcast")
+        self.episode.file.save("episode.mp3", ContentFile(b"0123456789" * 10))
+        self.url = "/media/" + self.episode.file.name
+        self.client = APIClient()
+
+    def test_full_file_with_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789" * 10)
+        self.assertEqual(response["Content-Type"], "audio/mpeg")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_range(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=95-")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"56789")
+        self.assertEqual(response["Content-Range"], "bytes 95-99/100")
+        self.assertEqual(response["Content-Length"], "5")
+
+    async def test_asgi_streams_asynchronously(self):
+        response = await AsyncClient().get(self.url, headers={"Range": "bytes=0-3"})
+        self.assertEqual(response.status_code, 206)
+        self.assertTrue(response.is_async)
+        self.assertEqual(b"".join([part async for part in response.streaming_content]), b"0123")
+
+    def test_if_range_and_if_none_match(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_only_files_of_visible_rows(self):
+        self.episode.file.storage.save("multimedia/orphan.mp3", ContentFile(b"x"))
+        self.assertEqual(self.client.get("/media/multimedia/orphan.mp3").status_code, 404)
+        self.assertEqual(self.client.get("/media/exports/other.pdf").status_code, 404)
+
+    def test_resumes_are_owner_or_staff_only(self):
+        owner = User.objects.create_user(email="resume-owner@example.com", password="x")
+        profile = UserProfile.objects.get(user=owner)
+        profile.resume.save("cv.pdf", ContentFile(b"%PDF-1.4"))
+        url = "/media/" + profile.resume.name
+
+        self.assertEqual(self.client.get(url).status_code, 401)
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user(email="someone@example.com", password="x"))
+        self.assertEqual(client.get(url).status_code, 404)
+        client.force_authenticate(owner)
+        self.assertEqual(client.get(url).status_code, 200)
+        client.force_authenticate(User.objects.create_user(email="staff@example.com", password="x", is_staff=True))
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+
+    @override_settings(FILE_OFFLOAD="x-accel-redirect")
+    def test_accel_redirect_offload(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/" + self.episode.file.name)
+        self.assertEqual(response.content, b"")
+
+
+class FlakyBackend(LocmemBackend):
+    """Locmem backend that refuses mail for bad@ addresses."""
+
+    def send_messages(self, messages):
+        if any(address.startswith("bad@") for message in messages for address in message.to):
+            raise OSError("550 mailbox unavailable")
+        return super().send_messages(messages)
+
+
+class UnreachableBackend(LocmemBackend):
+    def open(self):
+        raise OSError("Connection refused")
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class OutboxTests(TestCase):
+    def queue(self, *addresses):
+        return [outbox.enqueue_mail("Hi", "Body", "noreply@example.com", [address]) for address in addresses]
+
+    def test_password_reset_only_enqueues(self):
+        User.objects.create_user(email="reset@example.com", password="x")
+        response = APIClient().post("/api/auth/password-reset/", {"email": "reset@example.com"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(OutboxEmail.objects.get().to, ["reset@example.com"])
+
+    def test_batch_is_sent_over_one_connection(self):
+        self.queue("a@example.com", "b@example.com", "c@example.com")
+        connection = LocmemBackend()
+        with mock.patch.object(connection, "open", wraps=connection.open) as opened:
+            self.assertEqual(outbox.send_batch(connection=connection), (3, 0))
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(OutboxEmail.objects.exclude(status="sent").exists())
+
+    def test_failed_message_backs_off_then_gives_up(self):
+        bad, good = self.queue("bad@example.com", "good@example.com")
+        self.assertEqual(outbox.send_batch(connection=FlakyBackend()), (1, 1))
+        bad.refresh_from_db()
+        self.assertEqual((bad.status, bad.attempts, bad.claim_token), ("queued", 1, ""))
+        self.assertGreater(bad.next_attempt_at, bad.created_at + outbox.retry_delay(1) / 2)
+        self.assertIn("550", bad.last_error)
+        self.assertEqual(OutboxEmail.objects.get(pk=good.pk).status, "sent")
+
+        OutboxEmail.objects.filter(pk=bad.pk).update(
+            attempts=outbox.MAX_ATTEMPTS - 1, next_attempt_at=bad.created_at,
+        )
+        outbox.send_batch(connection=FlakyBackend())
+        self.assertEqual(OutboxEmail.objects.get(pk=bad.pk).status, "failed")
+
+    def test_open_failure_counts_against_every_claimed_message(self):
+        self.queue("a@example.com", "b@example.com")
+        self.assertEqual(outbox.send_batch(connection=UnreachableBackend()), (0, 2))
+        for message in OutboxEmail.objects.all():
+            self.assertEqual((message.status, message.attempts, message.claim_token), ("queued", 1, ""))
+            self.assertIn("Connection refused", message.last_error)
+        # Backed off, so nothing is due right away
+        self.assertEqual(outbox.send_batch(connection=LocmemBackend()), (0, 0))
+
+    def test_claimed_rows_are_reread_through_the_index(self):
+        self.queue(*(f"user{i}@example.com" for i in range(20)))
+        plan = OutboxEmail.objects.filter(claim_token="abc", status="queued").explain()
+        self.assertIn("outbox_claim_idx", plan)
+
+    def test_worker_survives_a_failing_batch(self):
+        with mock.patch("core.management.commands.send_queued_mail.send_batch", side_effect=RuntimeError), \
+                self.assertLogs("core.management.commands.send_queued_mail", "ERROR"):
+            call_command("send_queued_mail", stdout=mock.Mock(), stderr=mock.Mock())
+
+
+class BookmarkExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="pdf-reader@example.com", password="x")
+        career = Career.objects.create(title="Archivist", description="d", domain="humanities")
+        Bookmark.objects.create(user=cls.user, career=career, note="Read later")
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        patcher = mock.patch.object(exports, "EXPORT_ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_overlapping_renders_use_their_own_temp_files(self):
+        render = exports.render_bookmarks_pdf
+        temp_paths = []
+
+        def render_and_overlap(user_id, path):
+            temp_paths.append(path)
+            if len(temp_paths) == 1:
+                # The pool's job for the same export, while this one renders
+                exports.render_export(export.pk)
+            render(user_id, path)
+
+        export = BookmarkExport.objects.create(user=self.user)
+        with mock.patch("core.exports.render_bookmarks_pdf", render_and_overlap):
+            export = exports.request_export(self.user, wait=True)
+
+        self.assertEqual(len(set(temp_paths)), 2)
+        self.assertTrue(exports.is_current(export))
+        self.assertEqual([p.name for p in self.root.iterdir()], [Path(export.file_path).name])
+        self.assertTrue(Path(export.file_path).read_bytes().startswith(b"%PDF"))
+
+
+class TableExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(email="export-admin@example.com", password="x", is_staff=True)
+        for i in range(5):
+            Career.objects.create(title=f"Career {i}", domain="technology")
+
+    def test_export_requires_staff(self):
+        self.assertEqual(APIClient().get("/api/export/careers/").status_code, 401)
+
+    def test_ndjson_export(self):
+        response = self.client.get("/api/export/careers/", **auth_headers(self.staff))
+        self.assertEqual(response.status_code, 200)
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row["title"] for row in rows], [f"Career {i}" for i in range(5)])
+
+    async def test_asgi_export_streams_in_chunks(self):
+        headers = {"Authorization": auth_headers(self.staff)["HTTP_AUTHORIZATION"]}
+        astream = exports.astream
+        with mock.patch("core.exports.astream", lambda lines: astream(lines, lines_per_chunk=2)):
+            response = await AsyncClient().get("/api/export/careers/?type=csv", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+
+        chunks = aiter(response.streaming_content)
+        first = (await anext(chunks)).decode()
+        # The header and one row, not the whole table
+        self.assertEqual(len(first.splitlines()), 2)
+        rest = b"".join([chunk async for chunk in chunks]).decode()
+        self.assertEqual(len(rest.splitlines()), 4)
+
+
+class RecommendationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="recs@example.com", password="x")
+        cls.other = User.objects.create_user(email="recs-other@example.com", password="x")
+        cls.tech = Career.objects.create(title="Backend Developer", description="d", domain="technology", required_skills=["Python"])
+        cls.design = Career.objects.create(title="Product Designer", description="d", domain="design", required_skills=["Figma"])
+        Career.objects.create(title="Nurse", description="d", domain="healthcare")
+
+    def test_saves_refresh_after_commit(self):
+        with mock.patch("core.recommendations._refresh_later", recommendations.refresh_recommendations):
+            with self.captureOnCommitCallbacks(execute=True):
+                QuizResult.objects.create(user=self.user, scores={"Tech": 3, "Creative": 1}, best_category="Tech")
+                # Marked, but not scored inside the saving transaction
+                self.assertTrue(StaleRecommendation.objects.filter(user=self.user).exists())
+                self.assertFalse(CareerRecommendation.objects.exists())
+        self.assertEqual(
+            list(CareerRecommendation.objects.filter(user=self.user).values_list("rank", "career")),
+            [(1, self.tech.pk), (2, self.design.pk)],
+        )
+        self.assertFalse(StaleRecommendation.objects.exists())
+
+    def test_reads_do_not_score_stored_recommendations(self):
+        QuizResult.objects.create(user=self.user, scores={"Tech": 3, "Creative": 1}, best_category="Tech")
+        recommendations.refresh_stale()
+        # Marked stale again; the stored rows are served as they are
+        QuizResult.objects.create(user=self.user, scores={"Creative": 1}, best_category="Creative")
+        # The token's user, then the stored rows
+        user_cache.clear()
+        with mock.patch("core.recommendations.rank_careers") as rank, self.assertNumQueries(2):
+            response = self.client.get("/api/careers/?recommended=true", **auth_headers(self.user))
+        rank.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([career["title"] for career in response.json()], ["Backend Developer", "Product Designer"])
+        self.assertEqual(response.json()[0]["match_percent"], "38%")
+
+    def test_nothing_stored_yet_is_scored_live(self):
+        QuizResult.objects.create(user=self.user, scores={"Creative": 1}, best_category="Creative")
+        response = self.client.get("/api/careers/?top_picks=true", **auth_headers(self.user))
+        self.assertEqual([career["title"] for career in response.json()], ["Product Designer"])
+        self.assertFalse(CareerRecommendation.objects.exists())
+
+    def test_user_param_is_ignored(self):
+        QuizResult.objects.create(user=self.other, scores={"Creative": 1}, best_category="Creative")
+        recommendations.refresh_stale()
+        url = f"/api/careers/?recommended=true&user={self.other.pk}"
+        self.assertEqual(self.client.get(url, **auth_headers(self.user)).json(), [])
+        self.assertEqual(self.client.get(url).json(), [])
+        self.assertEqual(
+            [career["title"] for career in self.client.get(url, **auth_headers(self.other)).json()],
+            ["Product Designer"],
+        )
+
+    def test_refresh_stale_command(self):
+        QuizResult.objects.create(user=self.user, scores={"Tech": 1}, best_category="Tech")
+        profile = UserProfile.objects.get(user=self.other)
+        profile.skills = ["Figma"]
+        profile.save()
+
+        out = StringIO()
+        call_command("refresh_recommendations", "--stale", stdout=out)
+        self.assertIn("for 2 users", out.getvalue())
+        self.assertFalse(StaleRecommendation.objects.exists())
+        self.assertEqual(
+            list(CareerRecommendation.objects.filter(user=self.other).values_list("career", flat=True)),
+            [self.design.pk],
+        )
+
+
+class RollupTests(TestCase):
+    def test_bump_keeps_the_daily_row_and_the_total(self):
+        today = timezone.localdate()
+        earlier = today - timedelta(days=3)
+        rollups.bump("quiz_attempt", today, "Tech")
+        rollups.bump("quiz_attempt", today, "Tech")
+        rollups.bump("quiz_attempt", earlier, "Tech")
+        rollups.bump("quiz_attempt", earlier, "Tech", -1)
+        # A decrement never creates a row
+        rollups.bump("quiz_attempt", earlier, "Design", -1)
+
+        daily = dict(DailyRollup.objects.filter(metric="quiz_attempt").values_list("day", "count"))
+        self.assertEqual(daily, {today: 2, earlier: 0})
+        total = RollupTotal.objects.get(metric="quiz_attempt", key="Tech")
+        self.assertEqual((total.count, total.last_day), (2, today))
+        self.assertFalse(RollupTotal.objects.filter(key="Design").exists())
+
+    def test_dashboard_figures(self):
+        careers = [Career.objects.create(title=f"Career {i}", description="d", domain="tech") for i in range(3)]
+        users = [User.objects.create_user(email=f"rollup-{i}@example.com", password="x") for i in range(3)]
+        for user, category in zip(users, ["Tech", "Tech", "Design"]):
+            QuizResult.objects.create(user=user, scores={category: 1}, best_category=category)
+        for user in users:
+            Bookmark.objects.create(user=user, career=careers[1])
+        Bookmark.objects.create(user=users[0], career=careers[2])
+        # Someone last active long ago
+        rollups.bump("active_user", timezone.localdate() - timedelta(days=90), 10_000)
+
+        staff = User.objects.create_user(email="rollup-admin@example.com", password="x", is_staff=True)
+        request = APIRequestFactory().get("/admin/")
+        request.user = staff
+        with mock.patch("core.views.render") as render:
+            dashboard_view(request)
+        context = render.call_args.args[2]
+        # The three quiz takers and the admin; not the one from 90 days ago
+        self.assertEqual(context["active_users_count"], 4)
+        self.assertEqual(context["quiz_attempts_count"], 3)
+        self.assertEqual(context["popular_categories"], [
+            {"best_category": "Tech", "count": 2}, {"best_category": "Design", "count": 1},
+        ])
+        self.assertEqual(context["popular_careers"], [
+            {"career__title": "Career 1", "count": 3}, {"career__title": "Career 2", "count": 1},
+        ])
+
+        # A backfill from the event tables gives the same figures
+        figures = (rollups.active_users_count(), rollups.total("quiz_attempt"), rollups.top_keys("bookmark_career"))
+        rollups.backfill()
+        self.assertEqual(
+            (rollups.active_users_count(), rollups.total("quiz_attempt"), rollups.top_keys("bookmark_career")),
+            figures,
+        )
+
+
+class CareerListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        rows = [
+            ("Data Engineer", "technology", "mid", "80-120k", ["SQL", "Python"]),
+            ("Data Analyst", "data-analytics", "entry", "50-80k", ["SQL", "Excel"]),
+            ("Nurse", "healthcare", "entry", "50-80k", ["Patient care"]),
+            ("Platform Engineer", "technology", "senior", "120k+", ["Kubernetes"]),
+            ("Designer", "design", "mid", "50-80k", ["Figma"]),
+        ]
+        cls.careers = {
+            title: Career.objects.create(
+                title=title, description=f"{title} role.", domain=domain,
+                experience=experience, salary_range=salary, required_skills=skills,
+            )
+            for title, domain, experience, salary, skills in rows
+        }
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def titles(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sorted(career["title"] for career in response.json())
+
+    def test_filters(self):
+        self.assertEqual(self.titles("/api/careers/?domain=technology"), ["Data Engineer", "Platform Engineer"])
+        self.assertEqual(self.titles("/api/careers/?experience=entry&salary_range=50-80k"), ["Data Analyst", "Nurse"])
+        self.assertEqual(len(self.titles("/api/careers/?domain=all&experience=all")), 5)
+
+    def test_search_uses_the_index(self):
+        # Word prefixes over the title, company, skills and description
+        self.assertEqual(self.titles("/api/careers/?search=sql"), ["Data Analyst", "Data Engineer"])
+        self.assertEqual(self.titles("/api/careers/?search=engin"), ["Data Engineer", "Platform Engineer"])
+        self.assertEqual(self.titles("/api/careers/?search=sql&domain=technology"), ["Data Engineer"])
+        self.assertEqual(self.titles("/api/careers/?search=%21%21"), [])
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/careers/?search=python")
+        self.assertIn(search.SEARCH_TABLE, queries[-1]["sql"])
+        self.assertNotIn("LIKE", queries[-1]["sql"])
+
+    def test_keyset_pages(self):
+        url, seen = "/api/careers/?page_size=2&domain=all", []
+        while url:
+            page = self.client.get(url).json()
+            self.assertLessEqual(len(page["results"]), 2)
+            seen += [career["career_id"] for career in page["results"]]
+            url = page["next"]
+        self.assertEqual(seen, sorted((career.pk for career in self.careers.values()), reverse=True))
+
+    def test_keyset_pages_keep_the_filters(self):
+        page = self.client.get("/api/careers/?page_size=1&search=engineer").json()
+        self.assertEqual([career["title"] for career in page["results"]], ["Platform Engineer"])
+        self.assertIn("search=engineer", page["next"])
+        page = self.client.get(page["next"]).json()
+        self.assertEqual([career["title"] for career in page["results"]], ["Data Engineer"])
+        self.assertIsNone(page["next"])
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.title_hit = Career.objects.create(title="Robotics Engineer", description="Builds machines.", domain="engineering")
+        cls.body_hit = Career.objects.create(
+            title="Plant Technician", description="Maintains robotics cells on the line.", domain="manufacturing",
+        )
+        cls.resource = Resource.objects.create(title="Robotics starter kit", description="Parts list.")
+        cls.hostile = Career.objects.create(
+            title="Web Developer", description='Knows <script>alert("x")</script> and welding.', domain="technology",
+        )
+
+    def search(self, query, **params):
+        response = self.client.get("/api/search/", {"q": query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+    def test_query_is_required(self):
+        self.assertEqual(self.client.get("/api/search/").status_code, 400)
+        self.assertEqual(self.client.get("/api/search/", {"q": "x", "limit": "many"}).status_code, 400)
+
+    def test_title_matches_rank_first(self):
+        results = self.search("robotics", type="career")
+        self.assertEqual([(r["type"], r["id"]) for r in results], [
+            ("career", self.title_hit.pk), ("career", self.body_hit.pk),
+        ])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+        self.assertEqual(len(self.search("robot")), 3)
+
+    def test_snippets_escape_the_indexed_text(self):
+        [result] = self.search("welding")
+        self.assertNotIn("<script>", result["snippet"])
+        self.assertIn("&lt;script&gt;", result["snippet"])
+        self.assertIn("<mark>welding</mark>", result["snippet"])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.title_hit.title = "Drone Pilot"
+        self.title_hit.save()
+        self.assertEqual([r["id"] for r in self.search("drone")], [self.title_hit.pk])
+        self.title_hit.delete()
+        self.assertEqual(self.search("drone"), [])
+
+    def test_rebuild_search_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.SEARCH_TABLE}")
+        self.assertEqual(self.search("robotics"), [])
+
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        self.assertIn("career: 3 indexed", out.getvalue())
+        self.assertIn("resource: 1 indexed", out.getvalue())
+        self.assertEqual(len(self.search("robotics")), 3)
+
+    def test_migration_fills_the_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.SEARCH_TABLE}")
+        migration = importlib.import_module("core.migrations.0019_fill_search_index")
+        migration.fill_search_index(django_apps, mock.Mock(connection=connection))
+        self.assertEqual(len(self.search("robotics")), 3)
+        self.assertEqual([r["id"] for r in self.search("welding")], [self.hostile.pk])
+
+
+class BulkImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(email="import-admin@example.com", password="x", is_staff=True)
+
+    def post(self, body, content_type):
+        return self.client.post(
+            "/api/import/careers/", body, content_type=content_type, **auth_headers(self.staff),
+        )
+
+    def test_invalid_rows_are_reported(self):
+        body = b'{"title": "A", "description": "a", "domain": "tech"}\n{"title": "B"}\nnot json\n'
+        response = self.post(body, "application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual([error["row"] for error in response.json()["errors"]], [2, 3])
+
+    def test_bad_encoding_stops_with_400(self):
+        body = "title,description,domain\nA,a,tech\n".encode() + b"B,\xff\xfe,tech\n"
+        response = self.post(body, "text/csv")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual(response.json()["errors"][-1]["row"], 3)
+        self.assertIn("UTF-8", response.json()["stopped"])
+
+    def test_malformed_csv_stops_with_400(self):
+        body = f"title,description,domain\nA,a,tech\nB,{'x' * 200_000},tech\n".encode()
+        response = self.post(body, "text/csv")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["created"], 1)
+        self.assertIn("Malformed CSV", response.json()["stopped"])
+
+    def test_rows_before_the_failure_stay_imported(self):
+        rows = "".join(f'{{"title": "C{i}", "description": "d", "domain": "tech"}}\n' for i in range(5))
+        body = rows.encode() + b'{"title": "\xff"}\n'
+        with mock.patch("core.views.imports.BulkImporter", partial(imports.BulkImporter, batch_size=2)):
+            response = self.post(body, "application/x-ndjson")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["created"], 5)
+        self.assertEqual(response.json()["errors"], [
+            {"row": 6, "errors": {"non_field_errors": ["File is not valid UTF-8."]}},
+        ])
+        self.assertEqual(Career.objects.filter(title__startswith="C").count(), 5)
+
+
+class CatalogLoaderTests(TestCase):
+    records = [
+        {"title": "Data Engineer", "company": "Acme", "description": "Pipelines.", "domain": "technology"},
+        {"title": "Nurse", "company": "City Hospital", "description": "Patient care.", "domain": "healthcare"},
+    ]
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def test_unchanged_reload_sends_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(load_catalog("careers", self.records).created, 2)
+        version = get_version("careers")
+
+        sent = []
+        receiver = lambda sender, instances, **kwargs: sent.append(instances)
+        bulk_saved.connect(receiver)
+        self.addCleanup(bulk_saved.disconnect, receiver)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            report = load_catalog("careers", self.records)
+        self.assertEqual((report.created, report.updated, report.unchanged), (0, 0, 2))
+        self.assertEqual(sent, [])
+        self.assertEqual(callbacks, [])
+        self.assertEqual(get_version("careers"), version)
+
+
+class StoryApprovalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(email="author@example.com", password="x")
+        cls.story = SuccessStory.objects.create(
+            user=cls.author, name="Pending story", domain="technology",
+            education="BSc", challenge="Switching careers", outcome="Hired",
+        )
+
+    def approve(self):
+        model_admin = admin.site._registry[SuccessStory]
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.approve_stories(None, SuccessStory.objects.filter(pk=self.story.pk))
+
+    def test_approval_moves_the_etag(self):
+        client = APIClient()
+        before = client.get("/api/successstories/")
+        self.assertNotContains(before, "Pending story")
+        self.assertEqual(client.get("/api/successstories/", HTTP_IF_NONE_MATCH=before["ETag"]).status_code, 304)
+
+        self.approve()
+        after = client.get("/api/successstories/", HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual(after.status_code, 200)
+        self.assertContains(after, "Pending story")
+        self.assertNotEqual(after["ETag"], before["ETag"])
+
+
+class ResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(email="cache-author@example.com", password="x")
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def test_save_invalidates_cached_list(self):
+        client = APIClient()
+        self.assertEqual(client.get("/api/careers/")["X-Cache"], "MISS")
+        self.assertEqual(client.get("/api/careers/")["X-Cache"], "HIT")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Career.objects.create(title="Freshly added", domain="technology")
+        response = client.get("/api/careers/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertContains(response, "Freshly added")
+
+    def test_story_approval_invalidates_cached_list(self):
+        story = SuccessStory.objects.create(
+            user=self.author, name="Awaiting approval", domain="design",
+            education="BA", challenge="None", outcome="Hired",
+        )
+        client = APIClient()
+        client.get("/api/successstories/")
+        cached = client.get("/api/successstories/")
+        self.assertEqual(cached["X-Cache"], "HIT")
+        self.assertNotContains(cached, "Awaiting approval")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.site._registry[SuccessStory].approve_stories(None, SuccessStory.objects.filter(pk=story.pk))
+        response = client.get("/api/successstories/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertContains(response, "Awaiting approval")
+
+
+class QuizSubmissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="quiz-taker@example.com", password="x")
+        cls.options = {}
+        for order, categories in enumerate([("Tech", "Creative"), ("Tech", "Analytical"), ("Creative", "Tech")]):
+            question = QuizQuestion.objects.create(text=f"Question {order}", order=order)
+            for position, category in enumerate(categories):
+                cls.options[(order, category)] = Option.objects.create(
+                    question=question, text=category, category=category, order=position,
+                )
+
+    def setUp(self):
+        # Versions and the option table outlive each test's rollback
+        for cache in caches.all():
+            cache.clear()
+        option_table.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def ids(self, *keys):
+        return [self.options[key].pk for key in keys]
+
+    def test_score_answers(self):
+        scores, best = score_answers(self.ids((0, "Tech"), (1, "Tech"), (2, "Creative")))
+        self.assertEqual(scores, {"Tech": 2, "Creative": 1, "Analytical": 0})
+        self.assertEqual(best, "Tech")
+        with self.assertRaises(InvalidAnswers):
+            score_answers([0])
+
+    def test_submit_stores_the_server_score(self):
+        response = self.client.post(
+            "/api/quizresults/submit/", {"options": self.ids((0, "Creative"), (2, "Creative"))}, format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["best_category"], "Creative")
+        result = QuizResult.objects.get(user=self.user)
+        self.assertEqual(result.scores, {"Tech": 0, "Creative": 2, "Analytical": 0})
+
+    def test_invalid_answers_are_rejected(self):
+        unknown = self.client.post("/api/quizresults/submit/", {"options": [0]}, format="json")
+        twice = self.client.post(
+            "/api/quizresults/submit/", {"options": self.ids((0, "Tech"), (0, "Creative"))}, format="json",
+        )
+        self.assertEqual((unknown.status_code, twice.status_code), (400, 400))
+        self.assertFalse(QuizResult.objects.exists())
+
+    def test_clients_cannot_write_scores(self):
+        created = self.client.post("/api/quizresults/", {"scores": {"Tech": 99}, "best_category": "Tech"}, format="json")
+        self.assertEqual(created.status_code, 405)
+        result = QuizResult.objects.create(user=self.user, scores={"Tech": 1}, best_category="Tech")
+        edited = self.client.patch(f"/api/quizresults/{result.pk}/", {"best_category": "Creative"}, format="json")
+        self.assertEqual(edited.status_code, 405)
+        self.assertEqual(self.client.get("/api/quizresults/").status_code, 200)
+
+    def test_option_edits_rebuild_the_table(self):
+        answers = self.ids((0, "Tech"), (1, "Analytical"))
+        self.assertEqual(score_answers(answers)[1], "Tech")
+
+        option = self.options[(0, "Tech")]
+        option.category = "Analytical"
+        with self.captureOnCommitCallbacks(execute=True):
+            option.save()
+            # Rebuilt mid-transaction, the table would keep the old category
+            self.assertEqual(score_answers(answers)[1], "Tech")
+        scores, best = score_answers(answers)
+        self.assertEqual(best, "Analytical")
+        self.assertEqual(scores["Analytical"], 2)
+
+    def test_question_payload_moves_on_commit(self):
+        stale = get_question_payload()
+        version = get_quiz_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            QuizQuestion.objects.filter(order=0).get().options.create(text="Finance", category="Finance", order=2)
+            # Nothing is committed yet: a reader still sees (and caches) the old version
+            self.assertEqual(get_quiz_version(), version)
+        self.assertNotEqual(get_quiz_version(), version)
+        self.assertNotEqual(get_question_payload(), stale)
+        self.assertIn(b"Finance", get_question_payload())
+
+
+class TrendingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="trend-setter@example.com", password="x")
+        cls.careers = [Career.objects.create(title=f"Career {i}", domain="technology") for i in range(3)]
+
+    def setUp(self):
+        trending.clear_cache()
+        self.addCleanup(trending.clear_cache)
+
+    def test_top_ids_only_reads(self):
+        Bookmark.objects.create(user=self.user, career=self.careers[1])
+        with self.assertNumQueries(1):
+            self.assertEqual(trending.top_ids("career"), [])
+
+    def test_update_trending_folds_in_bookmarks(self):
+        other = User.objects.create_user(email="follower@example.com", password="x")
+        for user in (self.user, other):
+            Bookmark.objects.create(user=user, career=self.careers[2])
+        Bookmark.objects.create(user=self.user, career=self.careers[0])
+
+        call_command("update_trending", stdout=mock.Mock())
+        self.assertEqual(trending.top_ids("career"), [self.careers[2].pk, self.careers[0].pk])
+        response = APIClient().get("/api/careers/?trending=true")
+        self.assertEqual([row["title"] for row in response.data], ["Career 2", "Career 0"])
+
+
+def reload_urlconf():
+    # core.urls mounts the async views at import time when ASYNC_READ_VIEWS is on
+    importlib.reload(core_urls)
+    importlib.reload(importlib.import_module("pathseeker.urls"))
+    clear_url_caches()
+
+
+class AsyncReadViewTests(TestCase):
+    """The async views (ASYNC_READ_VIEWS) answer exactly like the sync views they shadow."""
+
+    ANONYMOUS = [
+        "/api/careers/",
+        "/api/careers/?domain=technology",
+        "/api/careers/?fields=title,domain",
+        "/api/careers/?page_size=2",  # handed to the sync view
+        "/api/resources/",
+        "/api/successstories/",
+        "/api/questions/list/",
+        "/api/bookmarks/",
+        "/api/auth/me/",
+    ]
+    AUTHENTICATED = ["/api/careers/", "/api/bookmarks/", "/api/bookmarks/?user=1", "/api/auth/me/"]
+
+    @classmethod
+    def setUpTestData(cls):
+        generate({"users": 2, "careers": 6, "resources": 3, "stories": 2, "bookmarks": 4})
+        cls.user = User.objects.filter(pk=Bookmark.objects.values("user")[:1]).get()
+        question = QuizQuestion.objects.create(text="Pick one", order=1)
+        Option.objects.create(question=question, text="Build things", category="Tech")
+
+    def setUp(self):
+        self.headers = auth_headers(self.user)
+        self.expected = {}
+        client = APIClient()
+        for path in self.ANONYMOUS:
+            self.expected["anonymous", path] = self.summary(client.get(path))
+        for path in self.AUTHENTICATED:
+            self.expected["user", path] = self.summary(client.get(path, **self.headers))
+        self.expected["bad token"] = self.summary(client.get("/api/careers/", HTTP_AUTHORIZATION="Bearer nope"))
+
+        # Computed again by the async views, not replayed from the sync responses
+        caches["responses"].clear()
+        override = override_settings(ASYNC_READ_VIEWS=True)
+        override.enable()
+        reload_urlconf()
+        self.addCleanup(reload_urlconf)
+        self.addCleanup(override.disable)
+
+    def summary(self, response):
+        return response.status_code, json.loads(response.content), response.get("ETag")
+
+    async def test_same_responses_as_sync_views(self):
+        client = AsyncClient()
+        auth = {"Authorization": self.headers["HTTP_AUTHORIZATION"]}
+        for path in self.ANONYMOUS:
+            with self.subTest(path=path):
+                response = await client.get(path)
+                self.assertEqual(response.resolver_match.func.__module__, "core.async_views")
+                self.assertEqual(self.summary(response), self.expected["anonymous", path])
+        for path in self.AUTHENTICATED:
+            with self.subTest(path=path, user=True):
+                self.assertEqual(self.summary(await client.get(path, headers=auth)), self.expected["user", path])
+        response = await client.get("/api/careers/", headers={"Authorization": "Bearer nope"})
+        self.assertEqual(self.summary(response), self.expected["bad token"])
+
+    async def test_response_cache_and_conditional_get(self):
+        client = AsyncClient()
+        first = await client.get("/api/careers/")
+        second = await client.get("/api/careers/")
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], self.expected["anonymous", "/api/careers/"][2])
+
+        not_modified = await client.get("/api/careers/", headers={"If-None-Match": first["ETag"]})
+        self.assertEqual(not_modified.status_code, 304)
+        questions = await client.get("/api/questions/list/")
+        not_modified = await client.get("/api/questions/list/", headers={"If-None-Match": questions["ETag"]})
+        self.assertEqual(not_modified.status_code, 304)
+
+    async def test_cache_is_only_used_through_its_async_api(self):
+        blocking = []
+
+        def on_loop(method):
+            def wrapper(cache, *args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    blocking.append(method.__name__)
+                except RuntimeError:
+                    pass  # a sync_to_async thread: fine
+                return method(cache, *args, **kwargs)
+            return wrapper
+
+        methods = {name: getattr(LocMemCache, name) for name in ("get", "set", "add", "incr", "get_many")}
+        with mock.patch.multiple(LocMemCache, **{name: on_loop(method) for name, method in methods.items()}):
+            client = AsyncClient()
+            for path in ("/api/careers/", "/api/careers/", "/api/questions/list/"):
+                self.assertEqual((await client.get(path)).status_code, 200)
+        self.assertEqual(blocking, [])
+
+    async def test_other_requests_fall_back_to_the_sync_view(self):
+        response = await AsyncClient().get("/api/careers/?format=api")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
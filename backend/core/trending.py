@@ -0,0 +1,165 @@
+import math
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Bookmark, TrendingScore, TrendingCheckpoint
+
+
+# -------------------------
+# Decayed Scores
+# -------------------------
+#
+# An event of weight w at time t contributes w * exp(-decay * (now - t)) to
+# an item's score. Every item decays by the same factor as time passes, so
+# we store log(sum(w * exp(decay * (t - EPOCH)))) instead: it never needs
+# rewriting as the clock moves, new events fold in with logaddexp, and the
+# stored value sorts exactly like the live score without overflowing.
+
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+HALF_LIFE = timedelta(days=getattr(settings, "TRENDING_HALF_LIFE_DAYS", 3))
+WINDOW = timedelta(days=getattr(settings, "TRENDING_WINDOW_DAYS", 30))
+CACHE_TTL = getattr(settings, "TRENDING_CACHE_TTL", 300)
+
+DECAY = math.log(2) / HALF_LIFE.total_seconds()
+
+BOOKMARK_WEIGHT = 1.0
+DOWNLOAD_WEIGHT = 0.5
+
+BATCH_SIZE = 5000
+
+
+def _log_weight(when, weight):
+    return DECAY * (when - EPOCH).total_seconds() + math.log(weight)
+
+
+def _logaddexp(a, b):
+    if a < b:
+        a, b = b, a
+    return a + math.log1p(math.exp(b - a))
+
+
+def current_score(log_score, now=None):
+    """Translate a stored log score into today's decayed score."""
+    now = now or timezone.now()
+    return math.exp(log_score - DECAY * (now - EPOCH).total_seconds())
+
+
+def add_events(kind, events):
+    """
+    Fold (object_id, when, weight) events into the stored scores with one
+    read and one bulk write per call.
+    """
+    incoming = {}
+    for object_id, when, weight in events:
+        value = _log_weight(when, weight)
+        incoming[object_id] = _logaddexp(incoming[object_id], value) if object_id in incoming else value
+    if not incoming:
+        return 0
+
+    with transaction.atomic():
+        existing = {
+            row.object_id: row
+            for row in TrendingScore.objects.filter(kind=kind, object_id__in=list(incoming))
+        }
+        to_update, to_create = [], []
+        for object_id, value in incoming.items():
+            row = existing.get(object_id)
+            if row is None:
+                to_create.append(TrendingScore(kind=kind, object_id=object_id, log_score=value))
+            else:
+                row.log_score = _logaddexp(row.log_score, value)
+                to_update.append(row)
+        TrendingScore.objects.bulk_update(to_update, ["log_score"], batch_size=500)
+        TrendingScore.objects.bulk_create(to_create, batch_size=500)
+    return len(incoming)
+
+
+# -------------------------
+# Event Sources
+# -------------------------
+
+def update_from_bookmarks(batch_size=BATCH_SIZE):
+    """
+    Fold bookmarks created since the last run into the scores. Work is
+    proportional to new bookmarks only, walking the primary key index.
+    """
+    processed = 0
+    while True:
+        with transaction.atomic():
+            checkpoint, _ = TrendingCheckpoint.objects.select_for_update().get_or_create(source="bookmarks")
+            rows = list(
+                Bookmark.objects.filter(pk__gt=checkpoint.last_id)
+                .order_by("pk")
+                .values_list("pk", "career_id", "resource_id", "created_at")[:batch_size]
+            )
+            if not rows:
+                return processed
+
+            add_events("career", (
+                (career_id, created_at, BOOKMARK_WEIGHT)
+                for _, career_id, _, created_at in rows if career_id is not None
+            ))
+            add_events("resource", (
+                (resource_id, created_at, BOOKMARK_WEIGHT)
+                for _, _, resource_id, created_at in rows if resource_id is not None
+            ))
+            checkpoint.last_id = rows[-1][0]
+            checkpoint.save(update_fields=["last_id", "updated_at"])
+        processed += len(rows)
+
+
+def record_downloads(deltas):
+    """Flush hook for the download counter: {resource_pk: downloads}."""
+    now = timezone.now()
+    add_events("resource", (
+        (pk, now, DOWNLOAD_WEIGHT * count) for pk, count in deltas.items() if count > 0
+    ))
+
+
+def prune(now=None):
+    """Drop items with no meaningful activity inside the sliding window."""
+    now = now or timezone.now()
+    cutoff = DECAY * (now - WINDOW - EPOCH).total_seconds()
+    return TrendingScore.objects.filter(log_score__lt=cutoff).delete()[0]
+
+
+def refresh(now=None):
+    processed = update_from_bookmarks()
+    pruned = prune(now)
+    return processed, pruned
+
+
+# -------------------------
+# Top-N Cache
+# -------------------------
+
+_top_cache = {}
+
+
+def top_ids(kind, limit=10):
+    """
+    Ids of the `limit` hottest items of a kind, best first: one indexed
+    read, held in process memory for TRENDING_CACHE_TTL seconds. Folding
+    in new events is left to the update_trending command (cron or
+    --loop), so a request never pays for a backlog of bookmarks.
+    """
+    cached = _top_cache.get((kind, limit))
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    ids = list(
+        TrendingScore.objects.filter(kind=kind)
+        .order_by("-log_score")
+        .values_list("object_id", flat=True)[:limit]
+    )
+    _top_cache[(kind, limit)] = (time.monotonic() + CACHE_TTL, ids)
+    return ids
+
+
+def clear_cache():
+    _top_cache.clear()
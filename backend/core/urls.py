@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework.decorators import api_view, permission_classes
@@ -7,9 +8,11 @@ from .views import (
     UserViewSet, CareerViewSet, ResourceViewSet, SuccessStoryViewSet,
     UserProfileViewSet, MultimediaViewSet, QuizQuestionViewSet,
     FeedbackViewSet, BookmarkViewSet, QuizResultViewSet, QuizQuestionListAPIView,
-    PasswordResetRequestView, PasswordResetConfirmView
+    PasswordResetRequestView, PasswordResetConfirmView, search_view, BulkImportView,
+    TableExportView,
 )
 from .serializers import UserSerializer
+from . import async_views
 
 # --- Current user view (must be defined first) ---
 @api_view(["GET"])
@@ -33,11 +36,21 @@ router.register(r"successstories", SuccessStoryViewSet, basename='successstory')
 
 # --- API endpoints ---
 urlpatterns = [
+    # Quiz questions list endpoint (read-only); must come before the router,
+    # whose questions/<pk>/ route would otherwise swallow "list"
+    path("questions/list/", QuizQuestionListAPIView.as_view(), name="quiz-question-list"),
+
     # DRF router URLs
     path("", include(router.urls)),
 
-    # Quiz questions list endpoint (read-only)
-    path("questions/list/", QuizQuestionListAPIView.as_view(), name="quiz-question-list"),
+    # Full-text search across careers, resources and multimedia
+    path("search/", search_view, name="search"),
+
+    # Admin-only bulk import (NDJSON/CSV) for careers, resources and multimedia
+    path("import/<str:catalog>/", BulkImportView.as_view(), name="bulk_import"),
+
+    # Admin-only streaming NDJSON/CSV export of any core table
+    path("export/<str:table>/", TableExportView.as_view(), name="table_export"),
 
     # Current logged-in user endpoint
     path("auth/me/", current_user, name="current_user"),
@@ -46,3 +59,20 @@ urlpatterns = [
     path("auth/password-reset/", PasswordResetRequestView.as_view(), name="password_reset_request"),
     path("auth/password-reset/confirm/", PasswordResetConfirmView.as_view(), name="password_reset_confirm"),
 ]
+
+if settings.ASYNC_READ_VIEWS:
+    # Async variants of the read-heavy GETs (see core.async_views), matched
+    # before the routes above; whatever they don't handle goes to the view
+    # they wrap. They reuse the wrapped routes' names, so /metrics reports
+    # each endpoint under one view label whichever variant served it.
+    sync_views = {pattern.name: pattern.callback for pattern in router.urls}
+    urlpatterns = [
+        path("careers/", async_views.catalog_list(CareerViewSet, sync_views["career-list"]), name="career-list"),
+        path("resources/", async_views.catalog_list(ResourceViewSet, sync_views["resource-list"]), name="resource-list"),
+        path("multimedia/", async_views.catalog_list(MultimediaViewSet, sync_views["multimedia-list"]), name="multimedia-list"),
+        path("successstories/", async_views.catalog_list(SuccessStoryViewSet, sync_views["successstory-list"]), name="successstory-list"),
+        path("questions/list/", async_views.question_list(QuizQuestionListAPIView, QuizQuestionListAPIView.as_view()), name="quiz-question-list"),
+        path("bookmarks/", async_views.bookmark_list(sync_views["bookmark-list"]), name="bookmark-list"),
+        path("bookmarks/export_pdf/", async_views.bookmark_export(sync_views["bookmark-export-pdf"]), name="bookmark-export-pdf"),
+        path("auth/me/", async_views.current_user(current_user), name="current_user"),
+    ] + urlpatterns
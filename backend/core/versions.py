@@ -0,0 +1,98 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Career, Resource, Multimedia, SuccessStory, QuizQuestion, Option
+from .signals import bulk_saved
+
+
+# -------------------------
+# Catalog Versions
+# -------------------------
+#
+# Each scope has a version kept in the Django cache: a random token plus the
+# time it last changed. Any save or delete of a model in the scope replaces
+# it, once the transaction commits. Tokens are random rather than counters,
+# so a cache flush or restart can never bring back an old ETag that now
+# describes different data.
+
+SCOPES = {
+    "careers": (Career,),
+    "resources": (Resource,),
+    "multimedia": (Multimedia,),
+    "successstories": (SuccessStory,),
+    "quiz": (QuizQuestion, Option),
+}
+
+VERSION_KEY = "version:{scope}"
+
+
+def _new_version():
+    return uuid.uuid4().hex, timezone.now()
+
+
+def get_version(scope):
+    """Return (token, last_modified) for the scope without touching the DB."""
+    key = VERSION_KEY.format(scope=scope)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key) or _new_version()
+    return version
+
+
+async def aget_version(scope):
+    """get_version() for async views, through the cache's async API."""
+    key = VERSION_KEY.format(scope=scope)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _new_version(), timeout=None)
+        version = await cache.aget(key) or _new_version()
+    return version
+
+
+def bump_version(scope):
+    key = VERSION_KEY.format(scope=scope)
+    transaction.on_commit(lambda: cache.set(key, _new_version(), timeout=None))
+
+
+def make_etag(scope, *parts):
+    token, _ = get_version(scope)
+    return etag_for(token, *parts)
+
+
+def etag_for(token, *parts):
+    """The ETag of a body shaped by `parts` at the version `token`."""
+    digest = hashlib.md5("\n".join([token, *map(str, parts)]).encode(), usedforsecurity=False)
+    return f'"{digest.hexdigest()}"'
+
+
+# -------------------------
+# Signals
+# -------------------------
+
+_MODEL_SCOPES = {model: scope for scope, models in SCOPES.items() for model in models}
+
+
+@receiver(post_save, sender=Career)
+@receiver(post_save, sender=Resource)
+@receiver(post_save, sender=Multimedia)
+@receiver(post_save, sender=SuccessStory)
+@receiver(post_save, sender=QuizQuestion)
+@receiver(post_save, sender=Option)
+@receiver(post_delete, sender=Career)
+@receiver(post_delete, sender=Resource)
+@receiver(post_delete, sender=Multimedia)
+@receiver(post_delete, sender=SuccessStory)
+@receiver(post_delete, sender=QuizQuestion)
+@receiver(post_delete, sender=Option)
+@receiver(bulk_saved)
+def bump_for_model(sender, **kwargs):
+    scope = _MODEL_SCOPES.get(sender)
+    if scope is not None:
+        bump_version(scope)
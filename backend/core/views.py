@@ -1,22 +1,18 @@
-from rest_framework import viewsets, permissions, status, generics, serializers
+from rest_framework import viewsets, mixins, permissions, status, generics, serializers
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from io import BytesIO
-from django.http import HttpResponse
+from rest_framework.settings import api_settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 import uuid
 from django.utils import timezone
 from datetime import timedelta
-from django.core.mail import send_mail
 from django.conf import settings
 from django.contrib import admin
 from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import render
-from django.db.models import Count
-
-# PDF export
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
+from django.views.decorators.http import condition
 
 from .models import (
     User, Career, Resource, SuccessStory, UserProfile,
@@ -27,8 +23,18 @@ from .serializers import (
     UserSerializer, CareerSerializer, ResourceSerializer,
     SuccessStorySerializer, UserProfileSerializer,
     MultimediaSerializer, QuizQuestionSerializer,
-    FeedbackSerializer, BookmarkSerializer, QuizResultSerializer
+    FeedbackSerializer, BookmarkSerializer, QuizResultSerializer,
+    QuizSubmissionSerializer, requested_fieldset, ValuesRowRenderer
 )
+from .pagination import KeysetPagination
+from .authentication import HasMetricsToken, MetricsTokenAuthentication
+from .counters import download_counter
+from . import rollups, recommendations, trending, exports, imports, versions, metrics
+from .files import ranged_file_response, media_file_response
+from .outbox import enqueue_mail
+from .response_cache import response_cache
+from . import search as search_index
+from .quiz import score_answers, InvalidAnswers, get_question_payload
 
 
 # -------------------------
@@ -49,40 +55,236 @@ class UserViewSet(viewsets.ModelViewSet):
         return super().get_permissions()
 
 
+# -------------------------
+# Conditional GET
+# -------------------------
+
+class ConditionalGetMixin:
+    """
+    Strong ETag and Last-Modified headers on list and detail responses,
+    derived from the cached version of `version_scope`. A matching
+    If-None-Match (or a fresh If-Modified-Since) is answered with 304
+    before any query or serializer runs.
+    """
+    version_scope = None
+
+    def get_etag_parts(self, request):
+        # Everything besides the catalog version that shapes the body
+        return [request.build_absolute_uri(), request.accepted_renderer.format]
+
+    def get_etag(self, request, *args, **kwargs):
+        return versions.make_etag(self.version_scope, *self.get_etag_parts(request))
+
+    def get_last_modified(self, request, *args, **kwargs):
+        return versions.get_version(self.version_scope)[1]
+
+    def conditional(self, handler, request, *args, **kwargs):
+        handler = condition(etag_func=self.get_etag, last_modified_func=self.get_last_modified)(handler)
+        return handler(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
+
+
+class CachedResponseMixin:
+    """
+    Serve anonymous list/detail GETs from the shared response cache, keyed
+    on the `version_scope` version, URL (path and query string), renderer
+    and authenticator. Responses carry X-Cache: HIT or MISS.
+    """
+
+    def get_response_cache_key(self, request):
+        parts = self.get_response_cache_parts(request)
+        return response_cache.make_key(self.version_scope, *parts) if parts is not None else None
+
+    def get_response_cache_parts(self, request):
+        if request.user.is_authenticated:
+            return None
+        authenticator = request.successful_authenticator
+        return [
+            request.build_absolute_uri(),
+            request.accepted_renderer.format,
+            type(authenticator).__name__ if authenticator else "anonymous",
+        ]
+
+    def cached(self, handler, request, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+
+        entry = response_cache.get(key)
+        if entry is not None:
+            content, content_type = entry
+            response = HttpResponse(content, content_type=content_type)
+            response["X-Cache"] = "HIT"
+            return response
+
+        def store(rendered):
+            response_cache.set(key, rendered.content, rendered["Content-Type"])
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            # Store the bytes once DRF has rendered them
+            response.add_post_render_callback(store)
+        response["X-Cache"] = "MISS"
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached(super().retrieve, request, *args, **kwargs)
+
+
+class DeferredFieldsMixin:
+    """
+    Load only the columns the (sparse) serializer will render: ?fields=
+    becomes .only() and omitted fields become .defer().
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        fields, omit = requested_fieldset(
+            {"request": self.request, "view": self},
+            getattr(serializer_class.Meta, "list_exclude", ()),
+        )
+        meta = queryset.model._meta
+        columns = {f.name for f in meta.concrete_fields if not f.primary_key}
+        if fields is not None:
+            return queryset.only(meta.pk.name, *(columns & fields - omit))
+        if omit & columns:
+            return queryset.defer(*(omit & columns))
+        return queryset
+
+
+class FastListMixin:
+    """
+    Serve list actions from `.values()` rows through ValuesRowRenderer
+    instead of instantiating the ModelSerializer per object. Output is the
+    same JSON; serializers the renderer cannot reproduce use the normal path.
+    """
+    fast_list = True
+
+    def list(self, request, *args, **kwargs):
+        renderer = ValuesRowRenderer.for_serializer(self.get_serializer()) if self.fast_list else None
+        if renderer is None:
+            return super().list(request, *args, **kwargs)
+
+        rows = self.filter_queryset(self.get_queryset()).values(*renderer.sources)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(renderer.render(page))
+        return Response(renderer.render(rows))
+
+
+# -------------------------
+# Trending
+# -------------------------
+
+TRENDING_LIMIT = 10
+
+
+def trending_response(view, model, kind):
+    """Serialize the hottest items of one kind in trending order."""
+    ids = trending.top_ids(kind, TRENDING_LIMIT)
+    items = model.objects.in_bulk(ids)
+    ordered = [items[pk] for pk in ids if pk in items]
+    return Response(view.get_serializer(ordered, many=True).data)
+
+
 # -------------------------
 # Career Views
 # -------------------------
 
-class CareerViewSet(viewsets.ModelViewSet):
+class CareerViewSet(ConditionalGetMixin, CachedResponseMixin, DeferredFieldsMixin, FastListMixin, viewsets.ModelViewSet):
     queryset = Career.objects.all()
     serializer_class = CareerSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
+    version_scope = "careers"
+
+    # Exact-match filters, each backed by a (field, career_id) index
+    filter_fields = ("domain", "experience", "salary_range")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != "list":
+            return queryset
+
+        params = self.request.query_params
+        for field in self.filter_fields:
+            value = params.get(field)
+            if value and value != "all":
+                queryset = queryset.filter(**{field: value})
+
+        # Word-prefix match on the full-text index (title, description,
+        # company, domain and skills), not a LIKE scan of every row
+        search = params.get("search", "").strip()
+        if search:
+            queryset = search_index.filter_matching(queryset, search)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        params = request.query_params
+        if params.get("recommended") == "true":
+            return self._recommendations(request, recommendations.STORED_RECOMMENDATIONS)
+        if params.get("top_picks") == "true":
+            return self._recommendations(request, recommendations.TOP_PICKS)
+        if params.get("trending") == "true":
+            return trending_response(self, Career, "career")
+        return super().list(request, *args, **kwargs)
+
+    def _recommendations(self, request, limit):
+        # Always the requesting user's own picks, whatever ?user= says
+        if not request.user.is_authenticated:
+            return Response([])
+        data = []
+        for rec in recommendations.get_recommendations(request.user, limit):
+            item = self.get_serializer(rec.career).data
+            item["match_percent"] = f"{round(rec.score * 100)}%"
+            data.append(item)
+        return Response(data)
 
 
 # -------------------------
 # Resource Views
 # -------------------------
 
-class ResourceViewSet(viewsets.ModelViewSet):
+class ResourceViewSet(ConditionalGetMixin, CachedResponseMixin, DeferredFieldsMixin, FastListMixin, viewsets.ModelViewSet):
     queryset = Resource.objects.all().order_by('-created_at')
     serializer_class = ResourceSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    version_scope = "resources"
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("trending") == "true":
+            return trending_response(self, Resource, "resource")
+        return super().list(request, *args, **kwargs)
 
     @action(detail=True, methods=['post'])
     def increment_download_count(self, request, pk=None):
         resource = self.get_object()
-        resource.download_count += 1
-        resource.save()
-        return Response({'status': 'success', 'download_count': resource.download_count})
+        download_counter.increment(resource.pk)
+        download_count = resource.download_count + download_counter.pending(resource.pk)
+        return Response({'status': 'success', 'download_count': download_count})
 
 
 # -------------------------
 # Success Story Views
 # -------------------------
 
-class SuccessStoryViewSet(viewsets.ModelViewSet):
+class SuccessStoryViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     serializer_class = SuccessStorySerializer
-    
+    version_scope = "successstories"
+
+    def get_etag_parts(self, request):
+        # Staff also see unapproved stories
+        return super().get_etag_parts(request) + [request.user.is_staff]
+
     def get_queryset(self):
         if self.request.user.is_staff:
             return SuccessStory.objects.all().order_by('-created_at')
@@ -104,14 +306,14 @@ class SuccessStoryViewSet(viewsets.ModelViewSet):
 # -------------------------
 
 
-class UserProfileViewSet(viewsets.ModelViewSet):
+class UserProfileViewSet(DeferredFieldsMixin, viewsets.ModelViewSet):
     queryset = UserProfile.objects.all()
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         # allow only user's profiles
-        return UserProfile.objects.filter(user=self.request.user)
+        return super().get_queryset().filter(user=self.request.user)
 
     @action(detail=False, methods=["get", "patch"], permission_classes=[IsAuthenticated])
     def me(self, request):
@@ -132,28 +334,234 @@ class UserProfileViewSet(viewsets.ModelViewSet):
 # Multimedia Views
 # -------------------------
 
-class MultimediaViewSet(viewsets.ModelViewSet):
+class MultimediaViewSet(ConditionalGetMixin, CachedResponseMixin, DeferredFieldsMixin, viewsets.ModelViewSet):
     queryset = Multimedia.objects.all()
     serializer_class = MultimediaSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    version_scope = "multimedia"
+
+
+# -------------------------
+# Media File Views
+# -------------------------
+
+class MediaFileView(generics.GenericAPIView):
+    """
+    Uploaded files at their MEDIA_URL paths, in production as well as
+    DEBUG, with Range/If-Range and validators (see
+    core.files.media_file_response, which can also hand the body to the
+    front server).
+
+    A file is only served while a row that the owning viewset would let
+    the requester retrieve points at it; anything else under MEDIA_ROOT is
+    a 404. Staff may fetch any file a row points at. Resource and
+    Multimedia files need no credentials, so <audio>/<video> elements can
+    play them directly; profile images and resumes need their owner's (or
+    a staff) token.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    # upload_to prefix -> (the viewset whose access rules apply, file field)
+    MEDIA_VIEWSETS = {
+        "resources/": (ResourceViewSet, "file"),
+        "multimedia/": (MultimediaViewSet, "file"),
+        "profiles/": (UserProfileViewSet, "profile_image"),
+        "resumes/": (UserProfileViewSet, "resume"),
+    }
+
+    def get(self, request, name):
+        viewset_class, field = next(
+            (mapping for prefix, mapping in self.MEDIA_VIEWSETS.items() if name.startswith(prefix)),
+            (None, None),
+        )
+        if viewset_class is None:
+            raise Http404
+        viewset = viewset_class(
+            action="retrieve", request=request, args=(), kwargs={}, format_kwarg=self.format_kwarg,
+        )
+        viewset.check_permissions(request)
+        if request.user.is_staff:
+            queryset = viewset_class.queryset.model._default_manager.all()
+        else:
+            queryset = viewset.get_queryset()
+        instance = queryset.filter(**{field: name}).first()
+        if instance is None:
+            raise Http404
+        viewset.check_object_permissions(request, instance)
+        return media_file_response(request, getattr(instance, field))
+
+
+# -------------------------
+# Search Views
+# -------------------------
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def search_view(request):
+    """
+    Full-text search across careers, resources and multimedia.
+    Query params: q (required), type (comma separated), limit.
+    """
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({"detail": "Query parameter 'q' is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+    types = [t for t in request.query_params.get('type', '').split(',') if t]
+    try:
+        limit = max(1, int(request.query_params.get('limit', 20)))
+    except ValueError:
+        return Response({"detail": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+    results = search_index.search(query, types=types, limit=limit)
+    return Response({"query": query, "count": len(results), "results": results})
+
+
+# -------------------------
+# Bulk Import Views
+# -------------------------
+
+class BulkImportView(generics.GenericAPIView):
+    """
+    Admin-only streaming import of careers, resources or multimedia.
+
+    Send NDJSON or CSV either as the raw request body (Content-Type
+    application/x-ndjson or text/csv) or as a multipart `file` upload;
+    `?type=ndjson|csv` overrides detection. Rows are validated with the
+    regular serializers and inserted in batches. The response reports the
+    created count and per-row errors; an upload that stops being readable
+    (not UTF-8, broken CSV) answers 400 with the same report, counting the
+    rows imported before that point.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request, catalog):
+        serializer_class = imports.IMPORTABLE.get(catalog)
+        if serializer_class is None:
+            return Response({"detail": f"Unknown catalog '{catalog}'."}, status=status.HTTP_404_NOT_FOUND)
+
+        content_type = request.content_type or ""
+        if content_type.startswith("multipart/form-data"):
+            upload = request.FILES.get("file")
+            if upload is None:
+                return Response({"detail": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+            stream = upload
+            fmt = imports.detect_format(upload.content_type or "", upload.name)
+        else:
+            # Read straight from the socket; request.data would buffer it all
+            stream = request.stream
+            fmt = imports.detect_format(content_type)
+        fmt = request.query_params.get("type") or fmt
+
+        if fmt not in ("ndjson", "csv"):
+            return Response({"detail": "Upload must be NDJSON or CSV."}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        if stream is None:
+            return Response({"detail": "Empty upload."}, status=status.HTTP_400_BAD_REQUEST)
+
+        extra = {"created_by": request.user} if catalog == "resources" else {}
+        importer = imports.BulkImporter(
+            serializer_class, extra=extra, context=self.get_serializer_context(),
+        )
+        result = importer.run(imports.iter_rows(stream, fmt))
+        if result["stopped"]:
+            return Response(
+                {"detail": f"Import stopped: {result['stopped']}", **result},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(result)
+
+
+class TableExportView(generics.GenericAPIView):
+    """
+    Admin-only streaming dump of one table as NDJSON (default) or CSV.
+
+    `?type=ndjson|csv` picks the format. `?since=<ISO date or datetime>`
+    limits the export to rows created (or, for profiles, updated) at or
+    after that moment, ordered oldest first, for incremental pulls. Rows
+    are read with a server-side iterator and written as they arrive (under
+    ASGI through exports.astream()), so memory stays flat however large
+    the table is.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+    def get(self, request, table):
+        export = exports.TABLE_EXPORTS.get(table)
+        if export is None:
+            return Response({"detail": f"Unknown table '{table}'."}, status=status.HTTP_404_NOT_FOUND)
+
+        fmt = request.query_params.get("type", "ndjson")
+        if fmt not in self.CONTENT_TYPES:
+            return Response({"detail": "type must be 'ndjson' or 'csv'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        since = request.query_params.get("since")
+        if since:
+            if export.since_field is None:
+                return Response({"detail": f"'{table}' does not support since."}, status=status.HTTP_400_BAD_REQUEST)
+            try:
+                since = exports.parse_since(since)
+            except ValueError:
+                return Response({"detail": "since must be an ISO date or datetime."}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            since = None
+
+        rows = export.rows(since=since)
+        stream = exports.stream_csv if fmt == "csv" else exports.stream_ndjson
+        content = stream(export, rows)
+        if isinstance(request._request, ASGIRequest):
+            content = exports.astream(content)
+        response = StreamingHttpResponse(content, content_type=self.CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="{table}.{fmt}"'
+        return response
+
+
+class MetricsView(generics.GenericAPIView):
+    """
+    Admin-only request, latency, SQL and cache metrics (core.metrics) in
+    the Prometheus text format, for every worker sharing METRICS_DIR.
+    Scrapers send METRICS_TOKEN as a bearer token; staff can also use
+    their own JWT.
+    """
+    authentication_classes = [MetricsTokenAuthentication, *api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    permission_classes = [HasMetricsToken | permissions.IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(metrics.registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 # -------------------------
 # Quiz Views
 # -------------------------
 
-class QuizQuestionViewSet(viewsets.ModelViewSet):
-    queryset = QuizQuestion.objects.all()
+class CachedQuestionListMixin:
+    """
+    Serve the question list from the pre-rendered JSON cache. Other
+    renderers (e.g. the browsable API) fall back to normal serialization.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != "json":
+            return super().list(request, *args, **kwargs)
+        return HttpResponse(get_question_payload(), content_type="application/json")
+
+
+class QuizQuestionViewSet(CachedQuestionListMixin, viewsets.ModelViewSet):
+    queryset = QuizQuestion.objects.prefetch_related("options")
     serializer_class = QuizQuestionSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 
-class QuizQuestionListAPIView(generics.ListAPIView):
-    queryset = QuizQuestion.objects.all()
+class QuizQuestionListAPIView(ConditionalGetMixin, CachedQuestionListMixin, generics.ListAPIView):
+    queryset = QuizQuestion.objects.prefetch_related("options")
     serializer_class = QuizQuestionSerializer
+    version_scope = "quiz"
 
 
-class QuizResultViewSet(viewsets.ModelViewSet):
+class QuizResultViewSet(mixins.DestroyModelMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    A user's quiz results. They are only ever written by `submit`, which
+    scores the answers itself; clients cannot create or edit a result.
+    """
     queryset = QuizResult.objects.all()
     serializer_class = QuizResultSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -161,8 +569,22 @@ class QuizResultViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return QuizResult.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+    @action(detail=False, methods=['post'])
+    def submit(self, request):
+        """
+        Score a list of chosen option ids on the server and store the result.
+        Body: {"options": [<option id>, ...]}
+        """
+        submission = QuizSubmissionSerializer(data=request.data)
+        submission.is_valid(raise_exception=True)
+
+        try:
+            scores, best_category = score_answers(submission.validated_data['options'])
+        except InvalidAnswers as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = QuizResult.objects.create(user=request.user, scores=scores, best_category=best_category)
+        return Response(self.get_serializer(result).data, status=status.HTTP_201_CREATED)
 
 
 # -------------------------
@@ -196,28 +618,26 @@ class BookmarkViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"])
     def export_pdf(self, request):
-        bookmarks = Bookmark.objects.filter(user=request.user)
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer)
-        styles = getSampleStyleSheet()
-        story = []
-
-        story.append(Paragraph("My Bookmarks & Notes", styles["Title"]))
-        story.append(Spacer(1, 20))
-
-        for bm in bookmarks:
-            item = bm.career or bm.resource or bm.multimedia
-            text = f"<b>{item}</b><br/>{bm.note or ''}"
-            story.append(Paragraph(text, styles["Normal"]))
-            story.append(Spacer(1, 12))
-
-        doc.build(story)
-        buffer.seek(0)
-        return HttpResponse(
-            buffer,
-            as_attachment=True,
-            content_type="application/pdf",
-            headers={"Content-Disposition": 'attachment; filename="bookmarks.pdf"'},
+        """
+        Download the bookmarks PDF. Rendered files are cached per bookmark-set
+        version and served with Range support.
+
+        ?mode=job renders off-request instead: the response is 202 with the
+        job status until the PDF is ready, then the file itself.
+        """
+        if request.query_params.get("mode") == "job":
+            export = exports.request_export(request.user, wait=False)
+            if not exports.is_current(export):
+                return Response(
+                    {"status": export.status, "version": export.version, "error": export.error},
+                    status=status.HTTP_202_ACCEPTED,
+                )
+        else:
+            export = exports.request_export(request.user, wait=True)
+
+        return ranged_file_response(
+            request, export.file_path, "application/pdf",
+            filename="bookmarks.pdf", as_attachment=True,
         )
 
 
@@ -304,11 +724,9 @@ class PasswordResetRequestView(generics.GenericAPIView):
             f"Thanks,\nThe PathSeeker Team"
         )
 
-        try:
-            send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [user.email])
-            return Response({"detail": "Password reset link sent to your email."})
-        except Exception as e:
-            return Response({"detail": f"Failed to send email: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        # Delivered by the send_queued_mail worker, never inline
+        enqueue_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [user.email])
+        return Response({"detail": "Password reset link sent to your email."})
 
 
 class PasswordResetConfirmView(generics.GenericAPIView):
@@ -344,43 +762,22 @@ class PasswordResetConfirmView(generics.GenericAPIView):
 
 @staff_member_required
 def dashboard_view(request):
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-
-    active_user_ids = QuizResult.objects.filter(submitted_at__gte=thirty_days_ago).values_list("user_id", flat=True)
-    recent_users = User.objects.filter(created_at__gte=thirty_days_ago).values_list("id", flat=True)
-    active_users_count = User.objects.filter(pk__in=set(list(active_user_ids) + list(recent_users))).count()
-
-    quiz_attempts_count = QuizResult.objects.count()
-    popular_categories = (
-        QuizResult.objects.values("best_category")
-        .annotate(count=Count("best_category"))
-        .order_by("-count")[:5]
-    )
-
-    popular_careers = (
-        Bookmark.objects.values("career__title")
-        .annotate(count=Count("career"))
-        .order_by("-count")[:5]
-    )
-    popular_resources = (
-        Bookmark.objects.values("resource__title")
-        .annotate(count=Count("resource"))
-        .order_by("-count")[:5]
-    )
-    popular_multimedia = (
-        Bookmark.objects.values("multimedia__title")
-        .annotate(count=Count("multimedia"))
-        .order_by("-count")[:5]
-    )
+    # Every figure comes from the DailyRollup table (see core.rollups), so
+    # the page cost does not grow with QuizResult or Bookmark volume.
+    popular_categories = [
+        {"best_category": category, "count": count}
+        for category, count in rollups.top_keys("quiz_attempt")
+    ]
 
     context = {
         **admin.site.each_context(request),
-        "active_users_count": active_users_count,
-        "quiz_attempts_count": quiz_attempts_count,
+        "active_users_count": rollups.active_users_count(days=30),
+        "quiz_attempts_count": rollups.total("quiz_attempt"),
         "popular_categories": popular_categories,
-        "popular_careers": popular_careers,
-        "popular_resources": popular_resources,
-        "popular_multimedia": popular_multimedia,
+        "popular_careers": rollups.popular_bookmarks("career"),
+        "popular_resources": rollups.popular_bookmarks("resource"),
+        "popular_multimedia": rollups.popular_bookmarks("multimedia"),
+        "response_cache": response_cache.stats(),
         "title": "Dashboard",
     }
 
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pathseeker.settings')
+# Mount the async read views (core.async_views) when served over ASGI
+os.environ.setdefault('ASYNC_READ_VIEWS', '1')
 
 application = get_asgi_application()
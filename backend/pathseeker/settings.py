@@ -36,6 +36,55 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.environ.get('EMAIL_USER') # Your Gmail address
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_APP_PASSWORD') # The 16-character App Password you generated
 
+# Outgoing mail is queued in the OutboxEmail table and delivered by
+# `python manage.py send_queued_mail --loop`; failures back off exponentially
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_BASE_SECONDS = 30
+
+# Seconds between write-behind flushes of buffered counters (e.g. downloads)
+COUNTER_FLUSH_INTERVAL = 5.0
+
+# Trending careers/resources: score half-life, sliding window and how long
+# the in-memory top-N list is reused before it is read again. New bookmarks
+# are folded in by `manage.py update_trending` (cron, or --loop)
+TRENDING_HALF_LIFE_DAYS = 3
+TRENDING_WINDOW_DAYS = 30
+TRENDING_CACHE_TTL = 300
+
+# Uploaded files are served by core.views.MediaFileView. Set FILE_OFFLOAD
+# to "x-accel-redirect" (nginx, with MEDIA_ROOT as an internal location at
+# FILE_ACCEL_REDIRECT_PREFIX) or "x-sendfile" (Apache/lighttpd) to have
+# the front server send the bytes once the view has checked access.
+FILE_OFFLOAD = os.environ.get("FILE_OFFLOAD") or None
+FILE_ACCEL_REDIRECT_PREFIX = "/protected-media/"
+
+# Rendered bookmark PDFs (kept outside MEDIA_ROOT)
+EXPORT_ROOT = BASE_DIR / "var" / "exports"
+EXPORT_WORKERS = 2
+
+# Threads recomputing career recommendations after quiz and profile saves
+RECOMMENDATION_WORKERS = 1
+
+# Rendered anonymous GET responses for the catalog endpoints. "default"
+# also holds the catalog version tokens that key those entries, so with
+# several workers point both at a shared backend (e.g. FileBasedCache with
+# a common LOCATION) or each worker only sees its own invalidations.
+# Locmem evicts least recently used entries past MAX_ENTRIES.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+        "TIMEOUT": 600,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
+}
+RESPONSE_CACHE_ALIAS = "responses"
+# Bodies larger than this are served but never stored
+RESPONSE_CACHE_MAX_BYTES = 512 * 1024
+
 # URL of your React frontend
 FRONTEND_URL = "http://localhost:5173" # Adjust if your port is different
 
@@ -61,6 +110,7 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
 MIDDLEWARE = [
+    "core.middleware.RequestTimingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -74,7 +124,7 @@ MIDDLEWARE = [
 # Add this configuration block
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.CachedJWTAuthentication",
     ),
 }
 
@@ -99,24 +149,91 @@ WSGI_APPLICATION = 'pathseeker.wsgi.application'
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ),
 }
 
+# Authenticated users are resolved from a per-process cache for up to this
+# many seconds; saving or deleting a User drops its entry immediately
+JWT_USER_CACHE_TTL = 30
+JWT_USER_CACHE_SIZE = 1024
+
+# Per-request Server-Timing header (SQL, serialization, rendering, total;
+# staff only unless DEBUG) and a JSON log line on the core.slow_requests
+# logger, with the slowest queries, for requests over SLOW_REQUEST_MS
+# (core.middleware)
+REQUEST_TIMING = os.environ.get("REQUEST_TIMING", "1") == "1"
+SLOW_REQUEST_MS = 500
+SLOW_REQUEST_TOP_QUERIES = 5
+
+# Request counts, latency histograms, SQL and cache figures for /metrics
+# (core.metrics), collected by the same middleware. With several worker
+# processes, point METRICS_DIR at a directory they share (cleared on
+# deploy) so every scrape reports all of them.
+METRICS_DIR = os.environ.get("METRICS_DIR") or None
+METRICS_FLUSH_INTERVAL = 5.0
+# Static bearer token for Prometheus (authorization.credentials_file);
+# staff JWTs work too but expire after five minutes. Empty disables it.
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# Serve the read-heavy GET endpoints from async views (core.async_views).
+# pathseeker/asgi.py switches this on; under WSGI they would only add a
+# thread hop per request.
+ASYNC_READ_VIEWS = os.environ.get("ASYNC_READ_VIEWS") == "1"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite in WAL mode: readers never block the writer or each other, and
+# writes take the lock up front (BEGIN IMMEDIATE) so concurrent writers
+# queue on busy_timeout instead of failing with "database is locked".
+# Reads outside a transaction go to the read-only 'replica' connection
+# (see core.database.ReadWriteRouter). SQLITE_PATH overrides the file.
+SQLITE_PATH = Path(os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'))
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'NAME': SQLITE_PATH,
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': 20,
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                f'PRAGMA mmap_size={SQLITE_MMAP_SIZE};'
+                'PRAGMA cache_size=-20000;'
+                'PRAGMA temp_store=MEMORY;'
+            ),
+        },
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': f'file:{SQLITE_PATH}?mode=ro',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': 20,
+            'init_command': (
+                'PRAGMA query_only=ON;'
+                f'PRAGMA mmap_size={SQLITE_MMAP_SIZE};'
+                'PRAGMA cache_size=-20000;'
+                'PRAGMA temp_store=MEMORY;'
+            ),
+        },
+        'TEST': {'MIRROR': 'default'},
+    },
 }
 
+DATABASE_ROUTERS = ['core.database.ReadWriteRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
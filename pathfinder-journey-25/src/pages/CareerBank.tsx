@@ -4,7 +4,7 @@ import { Input } from "@/components/ui/input";
 import { Badge } from "@/components/ui/badge";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Search, Filter, Star, TrendingUp, Users, DollarSign, Loader2 } from "lucide-react";
-import { useState, useMemo, useEffect } from "react";
+import { useState, useEffect } from "react";
 import api from "@/lib/api"; // Import your configured API instance
 import { toast } from "@/components/ui/use-toast";
 
@@ -15,7 +15,7 @@ interface Career {
   description: string;
   domain: string;
   required_skills: string[];
-  education_path: string;
+  education_path?: string;
   expected_salary: string;
   company: string;
   demand: string;
@@ -24,48 +24,87 @@ interface Career {
   salary_range: string;
 }
 
+// One keyset page of /careers/ (requested with page_size)
+interface CareerPage {
+  next: string | null;
+  previous: string | null;
+  results: Career[];
+}
+
+const PAGE_SIZE = 20;
+
 const CareerBank = () => {
   const [careers, setCareers] = useState<Career[]>([]);
+  const [nextPage, setNextPage] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchTerm, setSearchTerm] = useState("");
+  const [debouncedSearch, setDebouncedSearch] = useState("");
   const [selectedCategory, setSelectedCategory] = useState("all");
   const [selectedExperience, setSelectedExperience] = useState("all");
   const [selectedSalary, setSelectedSalary] = useState("all");
 
-  // Fetch careers from the backend when the component mounts
+  const showError = (error: unknown) => {
+    console.error("Failed to fetch careers:", error);
+    toast({
+      title: "Error",
+      description: "Could not load career data. Please try again later.",
+      variant: "destructive",
+    });
+  };
+
+  // Wait for a pause in typing before searching
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  // The backend filters and pages; fetch the first page whenever they change
   useEffect(() => {
+    let ignore = false;
     const fetchCareers = async () => {
+      setLoading(true);
       try {
-        const response = await api.get<Career[]>("/careers/");
-        setCareers(response.data);
-      } catch (error) {
-        console.error("Failed to fetch careers:", error);
-        toast({
-          title: "Error",
-          description: "Could not load career data. Please try again later.",
-          variant: "destructive",
+        const response = await api.get<CareerPage>("/careers/", {
+          params: {
+            omit: "education_path",
+            page_size: PAGE_SIZE,
+            search: debouncedSearch || undefined,
+            domain: selectedCategory,
+            experience: selectedExperience,
+            salary_range: selectedSalary,
+          },
         });
+        if (!ignore) {
+          setCareers(response.data.results);
+          setNextPage(response.data.next);
+        }
+      } catch (error) {
+        if (!ignore) showError(error);
       } finally {
-        setLoading(false);
+        if (!ignore) setLoading(false);
       }
     };
     fetchCareers();
-  }, []);
+    return () => {
+      ignore = true;
+    };
+  }, [debouncedSearch, selectedCategory, selectedExperience, selectedSalary]);
 
-  const filteredCareers = useMemo(() => {
-    return careers.filter(career => {
-      const matchesSearch = searchTerm === "" || 
-        career.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        career.company.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        career.required_skills.some(skill => skill.toLowerCase().includes(searchTerm.toLowerCase()));
-      
-      const matchesCategory = selectedCategory === "all" || career.domain === selectedCategory;
-      const matchesExperience = selectedExperience === "all" || career.experience === selectedExperience;
-      const matchesSalary = selectedSalary === "all" || career.salary_range === selectedSalary;
-      
-      return matchesSearch && matchesCategory && matchesExperience && matchesSalary;
-    });
-  }, [searchTerm, selectedCategory, selectedExperience, selectedSalary, careers]);
+  const loadMore = async () => {
+    if (!nextPage) return;
+    setLoadingMore(true);
+    try {
+      // `next` is an absolute URL carrying the cursor and the same filters
+      const response = await api.get<CareerPage>(nextPage);
+      setCareers((current) => [...current, ...response.data.results]);
+      setNextPage(response.data.next);
+    } catch (error) {
+      showError(error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   return (
     <div className="min-h-screen bg-background">
@@ -142,7 +181,7 @@ const CareerBank = () => {
         {/* Results Count */}
         <div className="mb-6">
           <p className="text-muted-foreground">
-            Showing {filteredCareers.length} of {careers.length} careers
+            Showing {careers.length} careers{nextPage ? " so far" : ""}
           </p>
         </div>
 
@@ -153,13 +192,13 @@ const CareerBank = () => {
               <Loader2 className="w-8 h-8 animate-spin text-primary" />
               <p className="ml-4 text-lg">Loading Careers...</p>
             </div>
-          ) : filteredCareers.length === 0 ? (
+          ) : careers.length === 0 ? (
             <div className="text-center py-12">
               <p className="text-lg text-muted-foreground mb-2">No careers found</p>
               <p className="text-sm text-muted-foreground">Try adjusting your search or filters</p>
             </div>
           ) : (
-            filteredCareers.map((career) => (
+            careers.map((career) => (
               <Card key={career.career_id} className="hover:shadow-lg transition-shadow duration-300">
                 <CardHeader className="pb-4">
                   <div className="flex justify-between items-start">
@@ -215,6 +254,15 @@ const CareerBank = () => {
             ))
           )}
         </div>
+
+        {!loading && nextPage && (
+          <div className="flex justify-center mt-8">
+            <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+              {loadingMore && <Loader2 className="w-4 h-4 mr-2 animate-spin" />}
+              Load more careers
+            </Button>
+          </div>
+        )}
       </main>
     </div>
   );
@@ -12,7 +12,7 @@ interface Content {
   type: "Video" | "Podcast" | "Explainer";
   title: string;
   url: string;
-  transcript: string;
+  transcript?: string; // only on the detail endpoint
   tags: string[];
 }
 
@@ -24,13 +24,26 @@ const MultimediaHub = () => {
   const [likes, setLikes] = useState(12);
   const [dislikes, setDislikes] = useState(2);
 
+  // The list omits transcripts, so load the full item once it is selected
+  const selectContent = async (content: Content) => {
+    setSelectedContent(content);
+    try {
+      const response = await api.get<Content>(`/multimedia/${content.multimedia_id}/`);
+      setSelectedContent((current) =>
+        current?.multimedia_id === content.multimedia_id ? response.data : current
+      );
+    } catch (error) {
+      console.error("Failed to fetch multimedia details:", error);
+    }
+  };
+
   useEffect(() => {
     const fetchMultimedia = async () => {
       try {
         const response = await api.get<Content[]>("/multimedia/");
         setContentList(response.data);
         if (response.data.length > 0) {
-          setSelectedContent(response.data[0]);
+          selectContent(response.data[0]);
         }
       } catch (error) {
         console.error("Failed to fetch multimedia content:", error);
@@ -151,7 +164,7 @@ const MultimediaHub = () => {
                 className={`p-4 border border-border rounded-lg hover:bg-muted/50 transition-colors cursor-pointer ${
                   selectedContent?.multimedia_id === content.multimedia_id ? "border-2 border-primary" : ""
                 }`}
-                onClick={() => setSelectedContent(content)}
+                onClick={() => selectContent(content)}
               >
                 <h4 className="font-semibold">{content.title}</h4>
                 <p className="text-sm text-muted-foreground">{content.type}</p>
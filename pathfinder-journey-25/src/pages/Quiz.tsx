@@ -12,14 +12,20 @@ import api from "@/lib/api"; // Assuming you have a configured axios instance
 interface Question {
   question_id: number;
   text: string;
-  options: { text: string; category: string }[];
+  options: { id: number; text: string; category: string }[];
+}
+
+// Scored on the server from the chosen option ids
+interface QuizResult {
+  scores: Record<string, number>;
+  best_category: string;
 }
 
 const Quiz = () => {
   const [questions, setQuestions] = useState<Question[]>([]);
   const [currentQuestion, setCurrentQuestion] = useState(0);
   const [answers, setAnswers] = useState<string[]>([]);
-  const [showResults, setShowResults] = useState(false);
+  const [result, setResult] = useState<QuizResult | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -66,35 +72,17 @@ const Quiz = () => {
     setAnswers(newAnswers);
   };
 
-  const calculateResults = () => {
-    const scores: Record<string, number> = { Tech: 0, Creative: 0, Analytical: 0, Leadership: 0 };
-    answers.forEach((answer, idx) => {
-      const option = questions[idx].options.find((opt) => opt.text === answer);
-      if (option) scores[option.category] += 1;
-    });
-    let bestCategory = "Tech";
-    let maxScore = 0;
-    for (const category in scores) {
-      if (scores[category] > maxScore) {
-        maxScore = scores[category];
-        bestCategory = category;
-      }
-    }
-    return { scores, bestCategory };
-  };
-
   const handleSubmit = async () => {
-    const { scores, bestCategory } = calculateResults();
     try {
-      await api.post("/quizresults/", {
-        scores: scores,
-        best_category: bestCategory,
+      // answers holds the chosen option ids; the server does the scoring
+      const response = await api.post<QuizResult>("/quizresults/submit/", {
+        options: answers.map(Number),
       });
-      console.log("Quiz result submitted successfully");
+      setResult(response.data);
     } catch (err) {
       console.error("Error submitting quiz result:", err);
+      setError("Failed to submit your answers. Please try again later.");
     }
-    setShowResults(true);
   };
 
   // Loading State
@@ -117,8 +105,8 @@ const Quiz = () => {
   }
 
   // Results Page
-  if (showResults) {
-    const { scores, bestCategory } = calculateResults();
+  if (result) {
+    const { scores, best_category: bestCategory } = result;
 
     return (
       <div className="min-h-screen bg-background">
@@ -138,7 +126,7 @@ const Quiz = () => {
                 <Briefcase className="w-5 h-5 mr-2 text-primary" /> Suggested Careers
               </h3>
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
-                {careerSuggestions[bestCategory].map((career, idx) => (
+                {(careerSuggestions[bestCategory] ?? []).map((career, idx) => (
                   <div
                     key={idx}
                     className="p-4 border border-border rounded-lg bg-card hover:bg-muted/50 transition-colors"
@@ -219,7 +207,7 @@ const Quiz = () => {
                     key={index}
                     className="flex items-center space-x-2 p-4 border border-border rounded-lg hover:bg-muted/50 transition-colors"
                   >
-                    <RadioGroupItem value={option.text} id={`option-${index}`} />
+                    <RadioGroupItem value={String(option.id)} id={`option-${index}`} />
                     <Label
                       htmlFor={`option-${index}`}
                       className="flex-1 cursor-pointer font-medium"